@@ -0,0 +1,1036 @@
+# 골프존 카운티 예약 앱 성능 측정 스크립트
+# 사용법: python benchmark.py parse [--pages 4] [--slots 30] [--repeat 200]
+#         python benchmark.py clock [--skews 0.3717 -1.2504] [--latency 0.02]
+#         python benchmark.py wait [--runs 200] [--load]
+#         python benchmark.py e2e [--runs 3] [--latency 0.02] [--contention 0.3] [--failure-rate 0.05]
+#         python benchmark.py e2e --gate-open --rehearsal [--latency 0.04] [--clock-skew 0.37]
+#         python benchmark.py prep [--repeat 2000]
+#         python benchmark.py log [--repeat 20000]
+#         python benchmark.py ui [--repeat 10] [--lines 500]
+#         python benchmark.py login [--runs 5] [--latency 0.02]
+#         python benchmark.py rank [--pages 4] [--slots 30] [--repeat 2000]
+#         python benchmark.py pages [--runs 5] [--latency 0.02]
+#         python benchmark.py filter [--runs 5] [--latency 0.02] [--nine-hole-every 3]
+#         python benchmark.py encoding [--runs 20] [--latency 0.02] [--bandwidth 1250000]
+#         python benchmark.py transport [--runs 10] [--latency 0.02] [--checks 3]
+#         python benchmark.py dns [--runs 10] [--latency 0.02] [--dns-delay 0.08]
+#         python benchmark.py session [--runs 20] [--latency 0.03] [--checks 3]
+import argparse
+import datetime
+import logging
+import queue
+import random
+import re
+import socket
+import statistics
+import tempfile
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+# streamlit_app을 bare 모드로 import 할 때 출력되는 ScriptRunContext 경고 억제
+logging.disable(logging.WARNING)
+
+import streamlit_app as app
+from mock_server import MockGolfzonServer, make_teetime_page_html
+
+
+# ============================================================
+# 공용 유틸리티
+# ============================================================
+def make_core(golfclub_seq="1", api_domain=None):
+    """로그를 버리는 APIBookingCore 인스턴스를 생성합니다."""
+    return app.APIBookingCore(lambda msg, q: None, queue.Queue(), threading.Event(), golfclub_seq, api_domain)
+
+
+def summarize(samples_ms):
+    """ms 단위 샘플의 p50/p99/평균을 반환합니다."""
+    ordered = sorted(samples_ms)
+    p99_index = min(len(ordered) - 1, int(round(len(ordered) * 0.99)) - 1)
+    return {
+        'p50': statistics.median(ordered),
+        'p99': ordered[max(0, p99_index)],
+        'mean': statistics.fmean(ordered),
+    }
+
+
+# ============================================================
+# 1. HTML 파싱: 고속 추출기 vs BeautifulSoup
+# ============================================================
+def bench_parse(args):
+    core = make_core()
+    pages = [make_teetime_page_html(page_no, slots=args.slots) for page_no in range(1, args.pages + 1)]
+
+    def run(parse_func):
+        samples = []
+        for _ in range(args.repeat):
+            for page_html in pages:
+                start = time.perf_counter()
+                parse_func(page_html)
+                samples.append((time.perf_counter() - start) * 1000)
+        return summarize(samples)
+
+    fast_result = app.extract_teetime_items(pages[0])
+    bs_result = core._parse_teetime_items_bs(pages[0])
+    if fast_result != bs_result:
+        raise SystemExit("❌ 고속 추출기 결과가 BeautifulSoup 결과와 다릅니다.")
+
+    print(f"페이지당 파싱 시간 ({args.pages}페이지 x {args.slots}슬롯, {args.repeat}회 반복)")
+    results = {
+        'BeautifulSoup(html.parser)': run(core._parse_teetime_items_bs),
+        'extract_teetime_items': run(app.extract_teetime_items),
+    }
+    for name, stats in results.items():
+        print(f"  {name:<28} p50={stats['p50']:.3f}ms  p99={stats['p99']:.3f}ms  mean={stats['mean']:.3f}ms")
+    speedup = results['BeautifulSoup(html.parser)']['p50'] / results['extract_teetime_items']['p50']
+    print(f"  → p50 기준 {speedup:.1f}배 빠름")
+
+    # 필터링/정렬: 기존 문자열 4-튜플 vs TeeTime (분 단위 int 비교)
+    items = [item for page_html in pages for item in app.extract_teetime_items(page_html)]
+    tuples = [(t.time_api, t.time_table_id, t.course_cd, t.course_nm) for t in items]
+    start_str, end_str, course = "06:00", "12:00", "IN"
+
+    def filter_tuples():
+        start_api, end_api = app.format_time_for_api(start_str), app.format_time_for_api(end_str)
+        selected = [t for t in tuples if start_api <= t[0] <= end_api]
+        selected = [t for t in selected if t[3] == course]
+        selected.sort(key=lambda x: (x[0], x[2]))
+        return [f"{app.format_time_for_display(t[0])} ({t[3]})" for t in selected[:5]]
+
+    def filter_teetime_items():
+        start_minutes, end_minutes = app.parse_minutes(start_str), app.parse_minutes(end_str)
+        selected = [t for t in items if start_minutes <= t.minutes <= end_minutes and t.course_nm == course]
+        selected.sort(key=app.TEETIME_SORT_KEY)
+        return [t.label for t in selected[:5]]
+
+    if filter_tuples() != filter_teetime_items():
+        raise SystemExit("❌ TeeTime 필터링 결과가 기존 튜플 필터링 결과와 다릅니다.")
+
+    def run_filter(func):
+        samples = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - start) * 1000)
+        return summarize(samples)
+
+    print(f"필터링/정렬 시간 (슬롯 {len(items)}개, {args.repeat}회 반복)")
+    filter_results = {'tuple (문자열 비교)': run_filter(filter_tuples), 'TeeTime (분 단위 int)': run_filter(filter_teetime_items)}
+    for name, stats in filter_results.items():
+        print(f"  {name:<28} p50={stats['p50']:.3f}ms  p99={stats['p99']:.3f}ms  mean={stats['mean']:.3f}ms")
+
+
+# ============================================================
+# 2. 서버 시계 추정: 알려진 시계 오차를 주입한 로컬 서버 대상
+# ============================================================
+def bench_clock(args):
+    print(f"서버 시계 오프셋 추정 (주입 지연 {args.latency * 1000:.0f}ms)")
+    for skew in args.skews:
+        server = MockGolfzonServer(clock_skew=skew, latency=args.latency).start()
+        try:
+            core = make_core(api_domain=server.base_url)
+            start = time.monotonic()
+            offset = core.get_server_time_offset()
+            elapsed = time.monotonic() - start
+            estimate = core.last_clock_estimate
+            legacy_offset = core._get_server_time_offset_legacy(f"{server.base_url}/login")
+        finally:
+            server.stop()
+
+        if estimate is None:
+            print(f"  skew={skew:+.4f}s  ❌ 정밀 측정 실패 (fallback offset={offset:+.4f}s)")
+            continue
+        inside = estimate.low <= skew <= estimate.high
+        print(
+            f"  skew={skew:+.4f}s  추정={offset:+.4f}s  오차={(offset - skew) * 1000:+.1f}ms  "
+            f"±{estimate.uncertainty * 1000:.1f}ms  구간 포함={'예' if inside else '아니오'}  "
+            f"샘플 {estimate.samples}개/{elapsed:.1f}초  | 기존 방식 오차={(legacy_offset - skew) * 1000:+.1f}ms")
+
+
+# ============================================================
+# 3. wait_until 발사 정확도: 기존 sleep 방식 vs monotonic sleep + busy-wait
+# ============================================================
+def legacy_wait_until(target_dt_kst, stop_event):
+    """변경 전 wait_until의 마지막 대기 로직 (datetime.now 기준 time.sleep, 로그 제외)."""
+    if not stop_event.is_set():
+        final_wait = (target_dt_kst - datetime.datetime.now(app.KST)).total_seconds()
+        if final_wait > 0:
+            time.sleep(final_wait)
+
+
+def _busy_loop(stop_event):
+    """Streamlit 재실행 루프처럼 GIL을 점유하는 CPU 부하."""
+    while not stop_event.is_set():
+        sum(i * i for i in range(2000))
+
+
+def bench_wait(args):
+    stop_event = threading.Event()
+    load_stop = threading.Event()
+    if args.load:
+        threading.Thread(target=_busy_loop, args=(load_stop,), daemon=True).start()
+
+    def run(wait_func):
+        lateness_ms = []
+        for _ in range(args.runs):
+            target = datetime.datetime.now(app.KST) + datetime.timedelta(seconds=random.uniform(0.02, 0.06))
+            wait_func(target)
+            lateness_ms.append((datetime.datetime.now(app.KST) - target).total_seconds() * 1000)
+        return summarize(lateness_ms)
+
+    try:
+        results = {
+            '기존 (time.sleep)': run(lambda target: legacy_wait_until(target, stop_event)),
+            '신규 (sleep + spin)': run(
+                lambda target: app.wait_until(target, stop_event, queue.Queue(), "bench")),
+        }
+    finally:
+        load_stop.set()
+
+    print(f"wait_until 발사 지연 ({args.runs}회, CPU 부하 스레드 {'있음' if args.load else '없음'})")
+    for name, stats in results.items():
+        print(f"  {name:<18} p50={stats['p50']:.3f}ms  p99={stats['p99']:.3f}ms  mean={stats['mean']:.3f}ms")
+
+
+# ============================================================
+# 4. End-to-End: 로컬 대체 서버 상대로 start_pre_process 전체 실행 (T-0 → Submit)
+# ============================================================
+READY_PATTERN = re.compile(r"발사 준비 완료: 시작 후 ([\d.]+)초")
+
+
+def run_e2e_once(server, args, fetch_mode, engine):
+    """
+    start_pre_process를 1회 실행하고
+    (T-0 → 첫 getList 도착, T-0 → Submit 도착, 성공 여부, 시작 → 발사 준비 완료(초))를 반환합니다.
+    """
+    server.reset()
+    target_server_epoch = int(server.now() + args.lead) + 1
+    target_dt = datetime.datetime.fromtimestamp(target_server_epoch, app.KST)
+    server.open_at = target_server_epoch if args.gate_open else None
+    inputs = {
+        'id': 'bench', 'password': 'bench',
+        'golfclub_seq': '1', 'golfclub_name': 'bench', 'api_domain': server.base_url,
+        'target_date': target_dt.strftime('%Y%m%d'),
+        'run_date': target_dt.strftime('%Y%m%d'), 'run_time': target_dt.strftime('%H:%M:%S'),
+        'start_time': args.start_time, 'end_time': args.end_time,
+        'order': '순차 (빠른 시간 순)', 'course_type': 'ALL',
+        'test_mode': False, 'booking_delay': args.booking_delay, 'fire_offset': args.fire_offset,
+        'rehearsal_before_open': args.rehearsal_before_open, 'rehearsal_rounds': args.rehearsal_rounds,
+        'rehearsal_date': target_dt.strftime('%Y%m%d'),
+        'fetch_mode': fetch_mode, 'engine': engine, 'warm_connections': args.warm,
+        'trace_dir': args.trace_dir,
+        'speculative_checks': args.speculative, 'check_concurrency': args.check_concurrency,
+        'session_cache': bool(args.session_cache), 'session_cache_dir': args.session_cache,
+        'preferred_windows': args.preferred_windows, 'course_weights': args.course_weights,
+        'avoid_edge_tees': args.avoid_edge_tees, 'page_count_file': args.page_count_file,
+        'hole_cnt': args.hole_cnt, 'server_filter': args.server_filter,
+        'accept_encoding': args.accept_encoding, 'transport': args.transport,
+    }
+
+    message_queue = queue.Queue()
+    stop_event = threading.Event()
+    worker = app.start_pre_process_async if engine == app.ENGINE_ASYNC else app.start_pre_process
+    try:
+        worker(message_queue, stop_event, inputs)
+    finally:
+        stop_event.set()  # 세션 유지/웜업 스레드 정리
+
+    logs = []
+    while not message_queue.empty():
+        logs.append(message_queue.get_nowait())
+    if args.verbose:
+        print("\n".join(logs))
+
+    # T-0: 서버 시계 기준 목표 시각을 로컬 시계로 환산한 값
+    t0_local = target_server_epoch - server.clock_skew
+    # 실행 중 리허설의 getList는 제외 (발사 오프셋은 최대 ±0.5초)
+    list_arrivals = [t for t in server.arrival_times("/reserve/golfclub/teetime/getList") if t >= t0_local - 1.0]
+    submit_arrivals = server.arrival_times("/reserve/postReserveConfirmSubmit")
+    first_list_ms = (min(list_arrivals) - t0_local) * 1000 if list_arrivals else None
+    submit_ms = (min(submit_arrivals) - t0_local) * 1000 if submit_arrivals else None
+    success = any("[대성공]" in line for line in logs)
+    ready_match = next(filter(None, (READY_PATTERN.search(line) for line in logs)), None)
+    ready_seconds = float(ready_match.group(1)) if ready_match else None
+    return first_list_ms, submit_ms, success, ready_seconds
+
+
+def run_rehearsal_once(server, args):
+    """start_rehearsal을 1회 실행하고 추천값 (booking_delay, fire_offset)을 반환합니다. 실패하면 None."""
+    server.open_at = None
+    inputs = {
+        'id': 'bench', 'password': 'bench',
+        'golfclub_seq': '1', 'golfclub_name': 'bench', 'api_domain': server.base_url,
+        'target_date': '20260101', 'rehearsal_date': '20260101', 'rehearsal_rounds': args.rehearsal_rounds,
+        'start_time': args.start_time, 'end_time': args.end_time,
+        'order': '순차 (빠른 시간 순)', 'course_type': 'ALL', 'fetch_mode': app.FETCH_MODE_CONCURRENT,
+        'page_count_file': args.page_count_file,
+    }
+    message_queue = queue.Queue()
+    app.start_rehearsal(message_queue, threading.Event(), inputs)
+    recommendation = None
+    while not message_queue.empty():
+        msg = message_queue.get_nowait()
+        if msg.startswith(app.REHEARSAL_RESULT_PREFIX):
+            recommendation = tuple(float(v) for v in msg[len(app.REHEARSAL_RESULT_PREFIX):].split(","))
+        elif args.verbose or "📊" in msg or msg.startswith("UI_LOG:[") and msg[22:].startswith("   "):
+            print(f"  {msg[22:] if msg.startswith('UI_LOG:') else msg}")
+    return recommendation
+
+
+def bench_e2e(args):
+    server = MockGolfzonServer(clock_skew=args.clock_skew, latency=args.latency, jitter=args.jitter,
+                               pages=args.pages, slots=args.slots, contention=args.contention,
+                               failure_rate=args.failure_rate, seed=args.seed,
+                               nine_hole_every=args.nine_hole_every, ignore_filters=args.ignore_filters,
+                               encodings=args.encodings, bandwidth=args.bandwidth,
+                               tls=args.tls, http2=args.http2).start()
+    engines = [app.ENGINE_THREAD] + ([app.ENGINE_ASYNC] if args.async_engine else [])
+    if args.rehearsal:
+        print(f"리허설 ({args.rehearsal_rounds}회, 최종 예약 요청 없음)")
+        recommendation = run_rehearsal_once(server, args)
+        if recommendation is None:
+            server.stop()
+            raise SystemExit("❌ 리허설 추천값을 받지 못했습니다.")
+        args.booking_delay, args.fire_offset = recommendation
+    print(f"End-to-End T-0 → Submit ({args.runs}회, 지연 {args.latency * 1000:.0f}ms"
+          f"+0~{args.jitter * 1000:.0f}ms, {args.pages}페이지 x {args.slots}슬롯, "
+          f"경합 {args.contention:.0%}, 실패 {args.failure_rate:.0%}, 시계 오차 {args.clock_skew:+.3f}s, "
+          f"예약 지연 {args.booking_delay:.3f}s, 발사 오프셋 {args.fire_offset:+.3f}s"
+          f"{', T-0 전 getList는 빈 목록' if args.gate_open else ''})")
+    try:
+        for engine in engines:
+            for fetch_mode in args.modes:
+                list_samples, submit_samples, ready_samples, successes = [], [], [], 0
+                for _ in range(args.runs):
+                    first_list_ms, submit_ms, success, ready_seconds = run_e2e_once(server, args, fetch_mode, engine)
+                    if ready_seconds is not None:
+                        ready_samples.append(ready_seconds * 1000)
+                    if first_list_ms is not None:
+                        list_samples.append(first_list_ms)
+                    if submit_ms is not None:
+                        submit_samples.append(submit_ms)
+                    successes += success
+
+                label = f"{engine} / {fetch_mode}"
+                if not submit_samples:
+                    print(f"  {label:<36} ❌ Submit 도착 없음 (성공 {successes}/{args.runs})")
+                    continue
+                list_stats = summarize(list_samples)
+                submit_stats = summarize(submit_samples)
+                ready_label = f"준비 p50={summarize(ready_samples)['p50']:.0f}ms  |  " if ready_samples else ""
+                print(f"  {label:<36} {ready_label}getList p50={list_stats['p50']:+.1f}ms  |  "
+                      f"Submit p50={submit_stats['p50']:.1f}ms p99={submit_stats['p99']:.1f}ms "
+                      f"mean={submit_stats['mean']:.1f}ms  |  성공 {successes}/{args.runs}")
+    finally:
+        server.stop()
+
+
+# ============================================================
+# 5. 예약 실패 분류: tests/test_outcomes.py (python -m pytest -q)
+# ============================================================
+
+
+# ============================================================
+# 6. 요청 준비 비용: 매 요청 헤더/쿠키/Payload 생성 vs 사전 준비된 요청 틀
+# ============================================================
+def bench_prep(args):
+    server = MockGolfzonServer().start()
+    try:
+        core = make_core(api_domain=server.base_url)
+        if core.requests_login("bench", "bench")['result'] != 'success':
+            raise SystemExit("❌ 로컬 대체 서버 로그인 실패")
+        date = "20260101"
+        core.prepare_request_templates(date)
+    finally:
+        server.stop()
+
+    def legacy(name, value):
+        if name == "getList":
+            payload = core._build_list_payload(date, value)
+            request = app.requests.Request("POST", core.TIME_LIST_URL, headers=core._get_list_headers(), data=payload)
+        elif name == "check":
+            url, headers, params = core._build_check_request(value)
+            request = app.requests.Request("GET", url, headers=headers, params=params)
+        else:
+            url, headers, payload = core._build_submit_request(date, value)
+            request = app.requests.Request("POST", url, headers=headers, data=payload)
+        return core.session.prepare_request(request)
+
+    def templated(name, value):
+        template = core._get_template(name, date)
+        if name == "getList":
+            return template.build(data={"pageNo": str(value)})
+        if name == "check":
+            return template.build(params={"timeTableId": value})
+        patch = core._submit_event_times()
+        patch["timeTableId"] = value
+        return template.build(data=patch)
+
+    values = {"getList": 3, "check": "12093007", "submit": "12093007"}
+    for name, value in values.items():
+        # 같은 초 안에서 만들어진 두 요청은 event*Time까지 동일해야 함 (초 경계에 걸리면 한 번 더 확인)
+        for _ in range(3):
+            expected, actual = legacy(name, value), templated(name, value)
+            if (expected.url, expected.body, dict(expected.headers)) == (actual.url, actual.body, dict(actual.headers)):
+                break
+        else:
+            raise SystemExit(f"❌ {name} 요청 틀 결과가 기존 요청과 다릅니다.\n  {expected.body}\n  {actual.body}")
+
+    print(f"요청 준비 시간 ({args.repeat}회 반복, 요청 1건당)")
+    for name, value in values.items():
+        results = {}
+        for label, build in (("기존 (헤더/쿠키/Payload 생성)", legacy), ("사전 준비된 요청 틀", templated)):
+            samples = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                build(name, value)
+                samples.append((time.perf_counter() - start) * 1000)
+            results[label] = summarize(samples)
+        for label, stats in results.items():
+            print(f"  {name:<8} {label:<24} p50={stats['p50'] * 1000:.1f}µs  p99={stats['p99'] * 1000:.1f}µs")
+
+
+# ============================================================
+# 7. 핫 패스 로깅 비용: log_message (즉시 포맷팅 + queue.put) vs HotPathLogger 링 버퍼
+# ============================================================
+def bench_log(args):
+    message_queue = queue.Queue()
+    hot_log = app.HotPathLogger(capacity=args.repeat)
+    response_text = '{"result":0,"data":{"success":false},"message":"이미 예약되어 있습니다."}' * 20
+    payload = {"bookgDate": "20260101", "timeTableId": "12091001", "eventLockTime": "2026-01-01 09:00:00.001"}
+
+    def timed(func):
+        samples = []
+        for i in range(args.repeat):
+            start = time.perf_counter()
+            func(i)
+            samples.append((time.perf_counter() - start) * 1000)
+        return summarize(samples)
+
+    cases = [
+        ("조회 시도 (짧은 메시지)",
+         lambda i: app.log_message(f"🔄 티 타임 조회 시도 ({i}페이지, 시도 1/3)...", message_queue),
+         lambda i: hot_log.log(app.EVT_GETLIST_TRY, i, 1, 3)),
+        ("Payload 덤프",
+         lambda i: app.log_message(f"🔎 2단계 PayLoad 전송 값: {payload}", message_queue),
+         lambda i: hot_log.log(app.EVT_SUBMIT_PAYLOAD, payload)),
+        ("응답 전체 덤프",
+         lambda i: app.log_message(f"📜 1단계 응답 전체: {response_text}", message_queue),
+         lambda i: hot_log.log(app.EVT_RESPONSE_DUMP, "1단계 응답", response_text)),
+    ]
+
+    print(f"로그 1건당 기록 비용 ({args.repeat}회 반복)")
+    for name, legacy, hot in cases:
+        legacy_stats = timed(legacy)
+        hot_stats = timed(hot)
+        hot_log.min_level = app.LOG_INFO  # 골든 타임 구간 레벨 (DEBUG 덤프는 버림)
+        critical_stats = timed(hot)
+        hot_log.min_level = app.LOG_DEBUG
+        print(f"  {name:<20} log_message p50={legacy_stats['p50'] * 1000:.2f}µs  "
+              f"링 버퍼 p50={hot_stats['p50'] * 1000:.2f}µs  "
+              f"골든 타임 레벨 p50={critical_stats['p50'] * 1000:.2f}µs")
+        hot_log.drain()
+        while not message_queue.empty():
+            message_queue.get_nowait()
+
+    for i in range(args.repeat):
+        hot_log.log(app.EVT_GETLIST_TRY, i, 1, 3)
+    start = time.perf_counter()
+    lines = hot_log.drain()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"  UI drain 포맷팅: {len(lines)}건 {elapsed_ms:.1f}ms ({elapsed_ms * 1000 / max(1, len(lines)):.2f}µs/건)")
+
+
+# ============================================================
+# 8. 로그 화면 CPU: 0.1초마다 전체 재실행 + 줄별 st.markdown vs fragment + 단일 HTML 블록
+# ============================================================
+def _legacy_log_view(messages):
+    """변경 전 로그 영역: 매 재실행마다 줄별 색상 판정 + st.markdown 호출."""
+    import streamlit as st
+    with st.container(height=300):
+        for msg in reversed(messages[-500:]):
+            safe_msg = msg.replace("<", "&lt;").replace(">", "&gt;")
+            color = "black"
+            if "[UI ALERT]" in msg or "❌" in msg or "UI_ERROR" in msg:
+                color = "red"
+            elif "🎉" in msg or "✅" in msg and "대기중" not in msg:
+                color = "green"
+            elif "💚 [세션 유지]" in msg or "📜" in msg or "⛳ **[Target]**" in msg:
+                color = "#007bff"
+            elif "⏳" in msg or "🔄" in msg:
+                color = "gray"
+            st.markdown(f'<div style="color: {color}; font-size: 12px; font-family: monospace;">{safe_msg}</div>',
+                        unsafe_allow_html=True)
+
+
+def _fragment_log_view(log_html):
+    """변경 후 로그 영역 fragment 본문: 미리 만들어 둔 HTML 블록 하나만 표시."""
+    import streamlit as st
+    with st.container(height=300):
+        st.markdown(log_html, unsafe_allow_html=True)
+
+
+def bench_ui(args):
+    from streamlit.testing.v1 import AppTest
+
+    def cpu_per_run(app_test):
+        app_test.run()
+        start = time.process_time()
+        for _ in range(args.repeat):
+            app_test.run()
+        return (time.process_time() - start) / args.repeat * 1000
+
+    messages = [f"[09:00:{i // 1000:02d}.{i % 1000:03d}] 🔄 티 타임 조회 시도 ({i % 4 + 1}페이지, 시도 1/3)..."
+                for i in range(args.lines)]
+    rendered = deque((app.render_log_line(msg) for msg in messages), maxlen=app.LOG_HISTORY_MAX)
+
+    full_rerun_ms = cpu_per_run(AppTest.from_file("streamlit_app.py", default_timeout=60))
+    legacy_ms = cpu_per_run(AppTest.from_function(_legacy_log_view, args=(messages,)))
+    fragment_ms = cpu_per_run(AppTest.from_function(_fragment_log_view, args=(app.render_log_html(rendered),)))
+
+    # 변경 전: 대기 중에도 (전체 재실행 + 로그 영역) 후 0.1초 sleep 반복 / 변경 후: LOG_REFRESH_SECONDS마다 fragment만 실행
+    legacy_cycle_ms = full_rerun_ms + legacy_ms
+    legacy_percent = legacy_cycle_ms / (legacy_cycle_ms + 100.0) * 100
+    fragment_percent = fragment_ms / (app.LOG_REFRESH_SECONDS * 1000) * 100
+    print(f"로그 화면 갱신 CPU ({args.lines}줄, AppTest {args.repeat}회 평균, 테스트 하네스 비용 포함)")
+    print(f"  전체 스크립트 재실행            {full_rerun_ms:.1f}ms")
+    print(f"  로그 영역 (줄별 st.markdown)    {legacy_ms:.1f}ms")
+    print(f"  로그 영역 (단일 HTML 블록)      {fragment_ms:.1f}ms")
+    print(f"  → 대기 중 CPU 추정: 변경 전 {legacy_percent:.0f}% (0.1초 주기 전체 재실행) → "
+          f"변경 후 {fragment_percent:.1f}% ({app.LOG_REFRESH_SECONDS}초 주기 fragment)")
+
+
+# ============================================================
+# 9. 로그인: 전체 로그인 vs 저장된 세션 재사용 (확인 요청 1회)
+# ============================================================
+def bench_login(args):
+    if not app.SessionCache().enabled:
+        raise SystemExit("❌ cryptography 패키지가 없어 세션 캐시를 측정할 수 없습니다. (pip install cryptography)")
+
+    def timed_login(core):
+        start = time.perf_counter()
+        result = core.login_with_cache("bench", "bench")
+        return (time.perf_counter() - start) * 1000, result
+
+    samples = {'전체 로그인 (캐시 없음)': [], '저장된 세션 재사용': [], '만료된 세션 → 전체 로그인': []}
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for _ in range(args.runs):
+            server = MockGolfzonServer(latency=args.latency).start()
+            try:
+                app.SessionCache(cache_dir).clear(server.base_url, "bench")
+                for label, expect_cached in (('전체 로그인 (캐시 없음)', False), ('저장된 세션 재사용', True)):
+                    core = make_core(api_domain=server.base_url)
+                    core.session_cache = app.SessionCache(cache_dir)
+                    elapsed_ms, result = timed_login(core)
+                    if result['result'] != 'success' or bool(result.get('cached')) != expect_cached:
+                        raise SystemExit(f"❌ {label}: 예상과 다른 결과 {result}")
+                    samples[label].append(elapsed_ms)
+            finally:
+                server.stop()
+
+            # 서버 재시작으로 기존 세션이 무효화된 경우 (포트가 같아야 같은 캐시 파일을 사용)
+            server = MockGolfzonServer(latency=args.latency, port=server.port).start()
+            try:
+                core = make_core(api_domain=server.base_url)
+                core.session_cache = app.SessionCache(cache_dir)
+                elapsed_ms, result = timed_login(core)
+                if result['result'] != 'success' or result.get('cached'):
+                    raise SystemExit(f"❌ 만료된 세션이 재사용되었습니다: {result}")
+                samples['만료된 세션 → 전체 로그인'].append(elapsed_ms)
+            finally:
+                server.stop()
+
+    print(f"로그인 소요 ({args.runs}회, 주입 지연 {args.latency * 1000:.0f}ms, 전체 로그인 후 2.0초 대기 별도)")
+    for label, values in samples.items():
+        stats = summarize(values)
+        print(f"  {label:<20} p50={stats['p50']:.1f}ms  mean={stats['mean']:.1f}ms")
+
+
+# ============================================================
+# 10. 후보 선택: 필터링 + 전체 정렬 vs 컴파일된 선호도 순위표 (정렬 없이 상위 K개)
+# ============================================================
+def bench_rank(args):
+    pages = [make_teetime_page_html(page_no, slots=args.slots) for page_no in range(1, args.pages + 1)]
+    page_items = [app.extract_teetime_items(page_html) for page_html in pages]
+    items = [item for page in page_items for item in page]
+    start_str, end_str = "06:00", "23:59"
+    start_minutes, end_minutes = app.parse_minutes(start_str), app.parse_minutes(end_str)
+
+    def legacy(is_reverse):
+        selected = [t for t in items if start_minutes <= t.minutes <= end_minutes]
+        selected.sort(key=app.TEETIME_SORT_KEY, reverse=is_reverse)
+        return selected[:app.RANKING_TOP_K]
+
+    def streamed(ranking, order):
+        """페이지가 order 순서로 도착할 때 stream_sorted_candidates의 결과와 조기 확정 수"""
+        core = make_core()
+        core.MAX_LIST_PAGES = len(pages)
+        logs = []
+        core.log_message = lambda msg, level=app.LOG_INFO: logs.append(msg)
+        core.iter_list_pages = lambda date: ((page_no, pages[page_no - 1]) for page_no in order)
+        result = list(core.stream_sorted_candidates("20260101", start_str, end_str, "ALL", False, ranking=ranking))
+        return result, sum("순위 확정" in line for line in logs)
+
+    rankings = {
+        "순차": app.SlotRanking(start_minutes, end_minutes),
+        "역순": app.SlotRanking(start_minutes, end_minutes, is_reverse=True),
+        "선호 시간대+코스+첫/마지막 회피": app.SlotRanking(
+            start_minutes, end_minutes, windows=[((app.parse_minutes("0900"), app.parse_minutes("1000")), 2)],
+            course_weights=[("IN", 1)], avoid_edges=True),
+    }
+    for name, is_reverse in (("순차", False), ("역순", True)):
+        ranked = [t for _, t in rankings[name].rank(items)[0]]
+        if ranked != legacy(is_reverse):
+            raise SystemExit(f"❌ {name} 순위표 결과가 기존 필터링+정렬 결과와 다릅니다.")
+
+    print(f"스트리밍 조기 확정 (페이지 {len(pages)}개 역순 도착 vs 순서대로 도착)")
+    for name, ranking in rankings.items():
+        expected = [t for _, t in ranking.rank(items, top_k=len(items))[0]]
+        for order in (list(range(len(pages), 0, -1)), list(range(1, len(pages) + 1))):
+            result, early = streamed(ranking, order)
+            if result != expected:
+                raise SystemExit(f"❌ {name}: 스트리밍 순위가 일괄 순위와 다릅니다.")
+            print(f"  {name:<24} 도착 순서 {order}: 조기 확정 {early}개 / 1순위 {result[0].label if result else '-'}")
+
+    print(f"후보 선택 시간 (슬롯 {len(items)}개, {args.repeat}회 반복)")
+    results = {
+        "필터링 + 전체 정렬": lambda: legacy(False),
+        "순위표 (순차)": lambda: rankings["순차"].rank(items),
+        "순위표 (선호도 포함)": lambda: rankings["선호 시간대+코스+첫/마지막 회피"].rank(items),
+    }
+    for label, func in results.items():
+        samples = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - start) * 1000)
+        stats = summarize(samples)
+        print(f"  {label:<20} p50={stats['p50'] * 1000:.1f}µs  p99={stats['p99'] * 1000:.1f}µs")
+
+    compile_samples = []
+    for _ in range(max(1, args.repeat // 10)):
+        start = time.perf_counter()
+        app.SlotRanking(start_minutes, end_minutes, windows=[((540, 600), 2)], course_weights=[("IN", 1)])
+        compile_samples.append((time.perf_counter() - start) * 1000)
+    print(f"  순위표 컴파일 (골든 타임 전 1회)  p50={summarize(compile_samples)['p50'] * 1000:.1f}µs")
+
+
+# ============================================================
+# 11. getList 페이지 수: 항상 최대 페이지 요청 vs 골프장별 페이지 수 기록 사용
+# ============================================================
+def bench_pages(args):
+    path = "/reserve/golfclub/teetime/getList"
+    modes = {
+        app.FETCH_MODE_SEQUENTIAL: lambda core: core.get_all_available_times("20260101"),
+        app.FETCH_MODE_CONCURRENT: lambda core: core.get_all_available_times("20260101", concurrent=True),
+        app.FETCH_MODE_STREAMING: lambda core: list(
+            core.stream_sorted_candidates("20260101", "00:00", "23:59", "ALL", False)),
+    }
+    max_pages = make_core().MAX_LIST_PAGES
+    print(f"getList 요청 수 / 조회 소요 ({args.runs}회, 주입 지연 {args.latency * 1000:.0f}ms, 최대 {max_pages}페이지)")
+    with tempfile.TemporaryDirectory() as store_dir:
+        for real_pages in (1, 2, max_pages):
+            server = MockGolfzonServer(latency=args.latency, pages=real_pages).start()
+            try:
+                for mode, fetch in modes.items():
+                    for label, use_store in (("기록 없음", False), ("기록 사용", True)):
+                        store = app.PageCountStore(f"{store_dir}/{real_pages}.json") if use_store else None
+                        counts, samples, results = [], [], set()
+                        for run in range(args.runs + use_store):
+                            core = make_core(api_domain=server.base_url)
+                            core.page_counts = store
+                            core.login_with_cache("bench", "bench")
+                            server.reset()
+                            start = time.perf_counter()
+                            result = fetch(core)
+                            elapsed_ms = (time.perf_counter() - start) * 1000
+                            if core.page_executor is not None:
+                                core.page_executor.shutdown(wait=True)  # 이미 보낸 요청까지 도착 기록에 포함
+                            if use_store and run == 0:
+                                continue  # 첫 실행은 기록을 남기는 용도
+                            counts.append(len(server.arrival_times(path)))
+                            samples.append(elapsed_ms)
+                            results.add(repr(result))
+                        if len(results) != 1:
+                            raise SystemExit(f"❌ {mode} {label}: 실행마다 조회 결과가 다릅니다.")
+                        print(f"  실제 {real_pages}페이지 {mode:<16} {label}: 요청 {statistics.fmean(counts):.1f}회  "
+                              f"p50={summarize(samples)['p50']:.1f}ms")
+            finally:
+                server.stop()
+
+
+# ============================================================
+# 12. getList 서버 측 검색 조건: 전체 조회 vs 조건 전송 (서버가 조건을 따르는/무시하는/너무 좁게 적용하는 경우)
+# ============================================================
+def bench_filter(args):
+    path = "/reserve/golfclub/teetime/getList"
+    base_inputs = {'start_time': "07:00", 'end_time': "09:00", 'course_type': "ALL", 'order': "순차 (빠른 시간 순)",
+                   'hole_cnt': "18홀"}
+    expected = None
+    print(f"getList 검색 조건 ({args.runs}회, 주입 지연 {args.latency * 1000:.0f}ms, 07:00~09:00 18홀, "
+          f"{args.nine_hole_every}번째 슬롯마다 9홀, 순차 조회: 목록 없는 페이지에서 종료)")
+    # 구간 좁음: 서버의 1부가 07:59에 끝나 조건 조회가 08:00~09:00 티 타임을 빠뜨림 → 실행 전 확인에서 전체 조회로 전환
+    servers = [("서버가 조건 적용", {}), ("서버가 조건 무시", {'ignore_filters': True}),
+               ("서버 구간 좁음", {'time_sections': {"1": (0, 7 * 60 + 59), "2": (8 * 60, 17 * 60 + 59)}})]
+    for server_label, server_options in servers:
+        server = MockGolfzonServer(latency=args.latency, nine_hole_every=args.nine_hole_every,
+                                   **server_options).start()
+        try:
+            for server_filter in (False, True):
+                inputs = dict(base_inputs, server_filter=server_filter)
+                ranking = app.SlotRanking.from_inputs(inputs)
+                counts, sizes, samples, fallbacks = [], [], [], 0
+                for _ in range(args.runs):
+                    core = make_core(api_domain=server.base_url)
+                    core.list_filter = app.ListFilter.from_inputs(inputs)
+                    core.login_with_cache("bench", "bench")
+                    core.verify_list_filter()
+                    server.reset()
+                    start = time.perf_counter()
+                    all_times_html = core.get_all_available_times("20260101")
+                    ranked, _ = ranking.rank(core.parse_teetime_items(all_times_html) or [], top_k=1000)
+                    samples.append((time.perf_counter() - start) * 1000)
+                    counts.append(len(server.arrival_times(path)))
+                    sizes.append(len(all_times_html.encode()))
+                    fallbacks += server_filter and not core.list_filter.server_side
+                    candidates = [t for _, t in ranked]
+                    if expected is None:
+                        expected = candidates
+                    elif candidates != expected:
+                        raise SystemExit("❌ 검색 조건 사용 여부에 따라 후보 목록이 다릅니다.")
+                label = f"{server_label} / {'조건 전송' if server_filter else '전체 조회'}"
+                print(f"  {label:<22} 요청 {statistics.fmean(counts):.1f}회  응답 {statistics.fmean(sizes) / 1024:.1f}KB  "
+                      f"p50={summarize(samples)['p50']:.1f}ms  후보 {len(expected)}개"
+                      f"{f'  (전체 조회 전환 {fallbacks}회)' if fallbacks else ''}")
+        finally:
+            server.stop()
+
+
+# ============================================================
+# 13. getList 응답 압축: 전송 크기 / 풀기 시간 / 조회 소요 (설치된 디코더별)
+# ============================================================
+def bench_encoding(args):
+    encodings = ["identity"] + app.ACCEPT_ENCODING.split(",")
+    bandwidth_label = f"{args.bandwidth * 8 / 1e6:g}Mbps" if args.bandwidth else "제한 없음"
+    print(f"getList 응답 압축 ({args.runs}회, 주입 지연 {args.latency * 1000:.0f}ms, 대역폭 {bandwidth_label}, "
+          f"{args.pages}페이지 동시 조회, 광고: {app.ACCEPT_ENCODING})")
+    results = {}
+    for encoding in encodings:
+        server = MockGolfzonServer(latency=args.latency, pages=args.pages, bandwidth=args.bandwidth,
+                                   encodings=() if encoding == "identity" else (encoding,)).start()
+        try:
+            core = make_core(api_domain=server.base_url)
+            core.accept_encoding = encoding
+            core.login_with_cache("bench", "bench")
+            samples, wire, decoded, decode_ms = [], [], [], []
+            for run in range(args.runs + 1):
+                core.tracer = app.PipelineTracer()
+                start = time.perf_counter()
+                core.get_all_available_times("20260101", concurrent=True)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                pages = [span['args'] for span in core.tracer.spans if span['name'] == "getList"]
+                if any(page.get('encoding') != encoding for page in pages if page.get('bytes_in', 0) >= 100):
+                    raise SystemExit(f"❌ {encoding}: 서버가 다른 방식으로 압축했습니다: {pages}")
+                if run == 0:
+                    continue  # 첫 실행은 커넥션 준비 포함이라 제외
+                samples.append(elapsed_ms)
+                wire.append(sum(page['bytes_wire'] for page in pages))
+                decoded.append(sum(page['bytes_in'] for page in pages))
+                decode_ms.append(sum(page['decode_ms'] for page in pages))
+        finally:
+            server.stop()
+        results[encoding] = summarize(samples)['p50']
+        print(f"  {encoding:<9} 전송 {statistics.fmean(wire) / 1024:6.1f}KB (원본 {statistics.fmean(decoded) / 1024:.1f}KB)  "
+              f"풀기 합계 p50={statistics.median(decode_ms):.3f}ms  조회 p50={results[encoding]:.1f}ms")
+    best = min(results, key=results.get)
+    print(f"  → 가장 빠른 방식: {best} (고정하려면 inputs['accept_encoding'] = '{best}', 기본은 {app.ACCEPT_ENCODING} 광고)")
+
+
+# ============================================================
+# 14. 전송 프로토콜: HTTP/1.1 커넥션 풀 vs HTTP/2 멀티플렉싱 (TLS 대체 서버, ALPN 협상)
+# ============================================================
+def _concurrent_checks(core, executor, count):
+    """확인 요청 'count'개를 동시에 보냅니다. (투기적 확인과 같은 패턴)"""
+    def check(time_table_id):
+        url, headers, params = core._build_check_request(time_table_id)
+        return core.session.get(url, headers=headers, params=params, timeout=5, verify=False).status_code
+    return list(executor.map(check, [f"T{i}" for i in range(count)]))
+
+
+def bench_transport(args):
+    if not app.HTTP2_AVAILABLE:
+        raise SystemExit("❌ HTTP/2 측정에는 httpx와 h2 패키지가 필요합니다.")
+    print(f"전송 프로토콜 (TLS 대체 서버, {args.runs}회, 주입 지연 {args.latency * 1000:.0f}ms, "
+          f"getList {args.pages}페이지 동시 조회, 확인 {args.checks}개 동시)")
+    for server_http2 in (True, False):
+        server = MockGolfzonServer(latency=args.latency, pages=args.pages, tls=True, http2=server_http2).start()
+        print(f"  [서버 ALPN: {'h2, http/1.1' if server_http2 else 'http/1.1 (HTTP/2 미지원 → 전환 확인)'}]")
+        try:
+            for transport in app.TRANSPORT_OPTIONS:
+                cold, warm, checks, connections, versions = [], [], [], [], set()
+                for _ in range(args.runs):
+                    core = make_core(api_domain=server.base_url)
+                    core.transport = transport
+                    core.login_with_cache("bench", "bench")
+                    server.reset()
+                    # 콜드: 로그인 커넥션 1개만 있는 상태에서 동시 조회 (HTTP/1.1은 나머지 페이지용 핸드셰이크 필요)
+                    start = time.perf_counter()
+                    core.get_all_available_times("20260101", concurrent=True)
+                    cold.append((time.perf_counter() - start) * 1000)
+                    # 웜: 같은 커넥션(들)으로 다시 조회
+                    start = time.perf_counter()
+                    core.get_all_available_times("20260101", concurrent=True)
+                    warm.append((time.perf_counter() - start) * 1000)
+                    with ThreadPoolExecutor(max_workers=args.checks) as executor:
+                        start = time.perf_counter()
+                        _concurrent_checks(core, executor, args.checks)
+                        checks.append((time.perf_counter() - start) * 1000)
+                    connections.append(server.connection_count())
+                    versions.add(core.pool_adapter.http_version)
+                    core.page_executor.shutdown(wait=True)
+                    core.session.close()
+                if server_http2 and transport == app.TRANSPORT_HTTP2 and versions != {"HTTP/2"}:
+                    raise SystemExit(f"❌ HTTP/2가 협상되지 않았습니다: {versions}")
+                print(f"    {transport:<18} 협상 {'/'.join(sorted(versions)):<8}  "
+                      f"콜드 조회 p50={summarize(cold)['p50']:.1f}ms  웜 조회 p50={summarize(warm)['p50']:.1f}ms  "
+                      f"확인 p50={summarize(checks)['p50']:.1f}ms  새 연결 {statistics.fmean(connections):.1f}개")
+        finally:
+            server.stop()
+
+
+# ============================================================
+# 15. DNS: 새 커넥션마다 시스템 조회 vs 사전 조회 + 주소 고정 (느린 resolver 주입)
+#     캐시/고정/조회 실패/주소 정렬 동작 확인: tests/test_dns.py (python -m pytest -q)
+# ============================================================
+@contextmanager
+def slow_system_dns(host, delay, calls):
+    """socket.getaddrinfo로 'host'를 조회할 때마다 delay초 지연하고 호출 수를 calls에 기록합니다."""
+    original = socket.getaddrinfo
+
+    def getaddrinfo(name, *args, **kwargs):
+        if name == host:
+            calls.append(time.perf_counter())
+            time.sleep(delay)
+        return original(name, *args, **kwargs)
+
+    socket.getaddrinfo = getaddrinfo
+    try:
+        yield
+    finally:
+        socket.getaddrinfo = original
+
+
+def bench_dns(args):
+    print(f"DNS 조회 ({args.runs}회, 주입 지연 {args.latency * 1000:.0f}ms, 시스템 DNS 조회 지연 {args.dns_delay * 1000:.0f}ms, "
+          f"getList {args.pages}페이지 동시 조회, 로그인 커넥션 외 새 커넥션 필요)")
+    server = MockGolfzonServer(latency=args.latency, pages=args.pages).start()
+    api_domain = f"http://localhost:{server.port}"
+    try:
+        for label, use_pinner in (("새 커넥션마다 시스템 조회", False), ("사전 조회 + 고정", True)):
+            samples, lookups = [], []
+            for _ in range(args.runs):
+                calls = []
+                with slow_system_dns("localhost", args.dns_delay, calls):
+                    core = make_core(api_domain=api_domain)
+                    core.dns = app.DNSPinner() if use_pinner else None
+                    core.login_with_cache("bench", "bench")
+                    core.resolve_api_host(pin_until_dt=datetime.datetime.now(app.KST) + datetime.timedelta(seconds=60))
+                    calls.clear()
+                    start = time.perf_counter()
+                    core.get_all_available_times("20260101", concurrent=True)
+                    samples.append((time.perf_counter() - start) * 1000)
+                    lookups.append(len(calls))
+                core.page_executor.shutdown(wait=True)
+                core.session.close()
+            print(f"  {label:<18} 콜드 동시 조회 p50={summarize(samples)['p50']:.1f}ms  "
+                  f"조회 중 DNS 요청 {statistics.fmean(lookups):.1f}회")
+
+        # 주소가 여러 개: 연결 시간 측정으로 응답하는 주소를 먼저 사용 (127.0.0.2는 연결 거부)
+        pinner = app.DNSPinner(resolver=lambda host, port: (["127.0.0.2", "127.0.0.1"], 30.0))
+        entry = pinner.resolve("localhost", server.port)
+        probes = ", ".join(f"{address} {'거부' if latency == float('inf') else f'{latency * 1000:.2f}ms'}"
+                           for address, latency in entry.latencies.items())
+        print(f"  주소 2개 조회 → 연결 순서 {entry.addresses} ({probes})")
+    finally:
+        server.stop()
+
+
+# ============================================================
+# 16. 세션 유지 스레드: 예약 세션 공유(기존) vs 전용 세션 (쿠키 저장소 공유, 커넥션 풀 분리)
+#     쿠키 공유/요청 틀 Cookie 헤더 갱신 확인: tests/test_cookies.py (python -m pytest -q)
+# ============================================================
+KEEP_ALIVE_PATH = "/reserve/main/teetimeList"
+
+
+def bench_session(args):
+    print(f"세션 유지 요청과 예약 요청의 소켓 경쟁 (TLS 대체 서버, {args.runs}회, 주입 지연 {args.latency * 1000:.0f}ms, "
+          f"웜업 커넥션 {args.checks}개, 세션 유지 요청이 진행 중일 때 확인 {args.checks}개 동시 발사)")
+    server = MockGolfzonServer(latency=args.latency, tls=True).start()
+    keep_alive_url = f"{server.base_url}{KEEP_ALIVE_PATH}"
+    try:
+        for label, shared in (("예약 세션 공유 (기존)", True), ("전용 세션 (풀 분리)", False)):
+            core = make_core(api_domain=server.base_url)
+            core.login_with_cache("bench", "bench")
+            keepalive = core.session if shared else core._get_keepalive_session()
+            samples, new_connections = [], []
+            with ThreadPoolExecutor(max_workers=args.checks) as executor:
+                for run in range(args.runs + 1):
+                    core.pool_adapter.close()
+                    core._mount_connection_pool()  # 매 회 예약 풀을 정확히 'checks'개로 웜업 (이전 회 세션 유지 커넥션 제외)
+                    core.open_connections(args.checks, executor)
+                    pinger = threading.Thread(target=keepalive.get, args=(keep_alive_url,),
+                                              kwargs={'headers': core.get_base_headers(keep_alive_url), 'timeout': 5, 'verify': False})
+                    pinger.start()
+                    time.sleep(args.latency / 4)  # 세션 유지 요청이 커넥션을 잡고 응답을 기다리는 중
+                    server.reset()
+                    start = time.perf_counter()
+                    _concurrent_checks(core, executor, args.checks)
+                    elapsed_ms = (time.perf_counter() - start) * 1000
+                    pinger.join()
+                    if run == 0:
+                        continue  # 첫 실행은 세션 유지 전용 커넥션 연결 포함이라 제외
+                    samples.append(elapsed_ms)
+                    new_connections.append(server.connection_count())
+            stats = summarize(samples)
+            print(f"  {label:<16} 확인 {args.checks}개 p50={stats['p50']:.1f}ms p99={stats['p99']:.1f}ms  "
+                  f"발사 중 새 연결 {statistics.fmean(new_connections):.2f}개")
+            core.session.close()
+    finally:
+        server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="골프존 카운티 예약 앱 성능 측정")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    parse_parser = subparsers.add_parser("parse", help="getList HTML 파싱 속도 비교")
+    parse_parser.add_argument("--pages", type=int, default=4)
+    parse_parser.add_argument("--slots", type=int, default=30)
+    parse_parser.add_argument("--repeat", type=int, default=200)
+    parse_parser.set_defaults(func=bench_parse)
+
+    clock_parser = subparsers.add_parser("clock", help="서버 시계 오프셋 추정 정확도 (로컬 대체 서버)")
+    clock_parser.add_argument("--skews", type=float, nargs="+", default=[0.3717, -1.2504])
+    clock_parser.add_argument("--latency", type=float, default=0.02)
+    clock_parser.set_defaults(func=bench_clock)
+
+    wait_parser = subparsers.add_parser("wait", help="wait_until 발사 지연 p50/p99 비교")
+    wait_parser.add_argument("--runs", type=int, default=200)
+    wait_parser.add_argument("--load", action="store_true", help="GIL을 점유하는 CPU 부하 스레드 추가")
+    wait_parser.set_defaults(func=bench_wait)
+
+    e2e_parser = subparsers.add_parser("e2e", help="로컬 대체 서버 상대 T-0 → Submit 전체 소요 시간")
+    e2e_parser.add_argument("--runs", type=int, default=3)
+    e2e_parser.add_argument("--lead", type=float, default=12.0, help="실행 시작부터 T-0까지의 여유(초)")
+    e2e_parser.add_argument("--modes", nargs="+", default=app.FETCH_MODE_OPTIONS, choices=app.FETCH_MODE_OPTIONS)
+    e2e_parser.add_argument("--async-engine", action="store_true", help="asyncio 엔진도 함께 측정")
+    e2e_parser.add_argument("--warm", type=int, default=4, help="웜업 커넥션 수")
+    e2e_parser.add_argument("--speculative", type=int, default=1, help="동시 확인 후보 수 (1이면 순차 시도)")
+    e2e_parser.add_argument("--check-concurrency", type=int, default=3, help="투기적 확인 동시 요청 한도")
+    e2e_parser.add_argument("--start-time", default="07:00")
+    e2e_parser.add_argument("--end-time", default="09:00")
+    e2e_parser.add_argument("--clock-skew", type=float, default=0.0)
+    e2e_parser.add_argument("--latency", type=float, default=0.02)
+    e2e_parser.add_argument("--jitter", type=float, default=0.0)
+    e2e_parser.add_argument("--pages", type=int, default=4)
+    e2e_parser.add_argument("--slots", type=int, default=30)
+    e2e_parser.add_argument("--contention", type=float, default=0.0)
+    e2e_parser.add_argument("--failure-rate", type=float, default=0.0)
+    e2e_parser.add_argument("--seed", type=int, default=None)
+    e2e_parser.add_argument("--verbose", action="store_true", help="실행 로그 전체 출력 (T-0 이후 구간별 소요 포함)")
+    e2e_parser.add_argument("--trace-dir", default="", help="실행별 Chrome trace JSON 저장 폴더 (기본: 저장 안함)")
+    e2e_parser.add_argument("--session-cache", default="", help="로그인 세션 캐시 폴더 (기본: 사용 안함)")
+    e2e_parser.add_argument("--preferred-windows", default="", help="선호 시간대 가중치 (예: 08:00-08:30=2)")
+    e2e_parser.add_argument("--course-weights", default="", help="코스 가중치 (예: IN=1)")
+    e2e_parser.add_argument("--avoid-edge-tees", action="store_true", help="첫/마지막 티 피하기")
+    e2e_parser.add_argument("--booking-delay", type=float, default=0.0, help="T-0 이후 getList 전 지연(초)")
+    e2e_parser.add_argument("--fire-offset", type=float, default=0.0, help="발사 오프셋(초, 음수면 먼저 발사)")
+    e2e_parser.add_argument("--gate-open", action="store_true", help="서버가 T-0 전 getList에 빈 목록을 반환")
+    e2e_parser.add_argument("--rehearsal", action="store_true", help="먼저 리허설을 실행하고 추천값으로 측정")
+    e2e_parser.add_argument("--rehearsal-before-open", action="store_true",
+                            help="실행 중 리허설로 자동 설정 (--lead 60초 이상 필요)")
+    e2e_parser.add_argument("--rehearsal-rounds", type=int, default=app.REHEARSAL_ROUNDS)
+    e2e_parser.add_argument("--page-count-file", default="", help="골프장별 페이지 수 기록 파일 (기본: 사용 안함)")
+    e2e_parser.add_argument("--hole-cnt", default="전체", choices=list(app.HOLE_CNT_OPTIONS))
+    e2e_parser.add_argument("--server-filter", action="store_true", help="getList 검색 조건을 보냄 (실행 전 확인 포함)")
+    e2e_parser.add_argument("--nine-hole-every", type=int, default=0, help="대체 서버: N번째 슬롯마다 9홀")
+    e2e_parser.add_argument("--ignore-filters", action="store_true", help="대체 서버가 검색 조건을 무시")
+    e2e_parser.add_argument("--accept-encoding", default="", help="광고할 압축 방식 (기본: 설치된 디코더 전체)")
+    e2e_parser.add_argument("--encodings", nargs="*", default=[], help="대체 서버가 쓸 압축 방식 (선호 순서)")
+    e2e_parser.add_argument("--bandwidth", type=int, default=0, help="대체 서버 응답 전송 속도(바이트/초)")
+    e2e_parser.add_argument("--transport", default=app.TRANSPORT_HTTP1, choices=app.TRANSPORT_OPTIONS)
+    e2e_parser.add_argument("--tls", action="store_true", help="대체 서버를 HTTPS로 실행")
+    e2e_parser.add_argument("--http2", action="store_true", help="대체 서버가 ALPN으로 HTTP/2 제공 (--tls 포함)")
+    e2e_parser.set_defaults(func=bench_e2e)
+
+
+    prep_parser = subparsers.add_parser("prep", help="요청 준비 비용: 매 요청 생성 vs 사전 준비된 요청 틀")
+    prep_parser.add_argument("--repeat", type=int, default=2000)
+    prep_parser.set_defaults(func=bench_prep)
+
+    log_parser = subparsers.add_parser("log", help="핫 패스 로깅 비용: log_message vs 링 버퍼 로거")
+    log_parser.add_argument("--repeat", type=int, default=20000)
+    log_parser.set_defaults(func=bench_log)
+
+    ui_parser = subparsers.add_parser("ui", help="로그 화면 갱신 CPU: 전체 재실행 vs fragment")
+    ui_parser.add_argument("--repeat", type=int, default=10)
+    ui_parser.add_argument("--lines", type=int, default=500)
+    ui_parser.set_defaults(func=bench_ui)
+
+    login_parser = subparsers.add_parser("login", help="로그인: 전체 로그인 vs 저장된 세션 재사용")
+    login_parser.add_argument("--runs", type=int, default=5)
+    login_parser.add_argument("--latency", type=float, default=0.02)
+    login_parser.set_defaults(func=bench_login)
+
+    rank_parser = subparsers.add_parser("rank", help="후보 선택: 필터링+정렬 vs 컴파일된 선호도 순위표")
+    rank_parser.add_argument("--pages", type=int, default=4)
+    rank_parser.add_argument("--slots", type=int, default=30)
+    rank_parser.add_argument("--repeat", type=int, default=2000)
+    rank_parser.set_defaults(func=bench_rank)
+
+    pages_parser = subparsers.add_parser("pages", help="getList 페이지 수: 항상 최대 페이지 vs 페이지 수 기록")
+    pages_parser.add_argument("--runs", type=int, default=5)
+    pages_parser.add_argument("--latency", type=float, default=0.02)
+    pages_parser.set_defaults(func=bench_pages)
+
+    filter_parser = subparsers.add_parser("filter", help="getList 검색 조건: 전체 조회 vs 서버 측 필터")
+    filter_parser.add_argument("--runs", type=int, default=5)
+    filter_parser.add_argument("--latency", type=float, default=0.02)
+    filter_parser.add_argument("--nine-hole-every", type=int, default=3)
+    filter_parser.set_defaults(func=bench_filter)
+
+    encoding_parser = subparsers.add_parser("encoding", help="getList 응답 압축: 전송 크기/풀기 시간/조회 소요")
+    encoding_parser.add_argument("--runs", type=int, default=20)
+    encoding_parser.add_argument("--latency", type=float, default=0.02)
+    encoding_parser.add_argument("--pages", type=int, default=4)
+    encoding_parser.add_argument("--bandwidth", type=int, default=0, help="응답 전송 속도(바이트/초, 0이면 제한 없음)")
+    encoding_parser.set_defaults(func=bench_encoding)
+
+    transport_parser = subparsers.add_parser("transport", help="전송 프로토콜: HTTP/1.1 커넥션 풀 vs HTTP/2 멀티플렉싱")
+    transport_parser.add_argument("--runs", type=int, default=10)
+    transport_parser.add_argument("--latency", type=float, default=0.02)
+    transport_parser.add_argument("--pages", type=int, default=4)
+    transport_parser.add_argument("--checks", type=int, default=3, help="동시에 보낼 확인 요청 수")
+    transport_parser.set_defaults(func=bench_transport)
+
+    dns_parser = subparsers.add_parser("dns", help="DNS: 새 커넥션마다 시스템 조회 vs 사전 조회 + 주소 고정")
+    dns_parser.add_argument("--runs", type=int, default=10)
+    dns_parser.add_argument("--latency", type=float, default=0.02)
+    dns_parser.add_argument("--pages", type=int, default=4)
+    dns_parser.add_argument("--dns-delay", type=float, default=0.08, help="시스템 DNS 조회 1회에 더할 지연(초)")
+    dns_parser.set_defaults(func=bench_dns)
+
+    session_parser = subparsers.add_parser("session", help="세션 유지: 예약 세션 공유 vs 전용 세션 (풀 분리)")
+    session_parser.add_argument("--runs", type=int, default=20)
+    session_parser.add_argument("--latency", type=float, default=0.03)
+    session_parser.add_argument("--checks", type=int, default=3, help="웜업 커넥션 수 = 동시에 보낼 확인 요청 수")
+    session_parser.set_defaults(func=bench_session)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,605 @@
+# 골프존 카운티 로컬 대체 서버 (성능 측정/검증용)
+# 사용법: python mock_server.py [--port 8080] [--clock-skew 0.37] [--latency 0.02]
+#         [--pages 4] [--slots 30] [--contention 0.2] [--failure-rate 0.05]
+#         [--nine-hole-every 3] [--ignore-filters] [--encodings gzip br] [--bandwidth 1250000]
+#         [--tls] [--http2]
+import argparse
+import datetime
+import gzip
+import os
+import random
+import socket
+import ssl
+import tempfile
+import threading
+import time
+import zlib
+import ujson as json
+from collections import namedtuple
+from email.utils import formatdate
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+try:
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+except ImportError:
+    x509 = None
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+    import h2.exceptions
+except ImportError:
+    h2 = None
+
+# 라우팅 결과: 상태 코드, 본문(bytes), Content-Type, 추가 헤더 목록
+MockResponse = namedtuple("MockResponse", ["status", "body", "content_type", "headers"])
+
+HTML_TYPE = "text/html;charset=UTF-8"
+
+# HTML 응답 압축기 (설치된 것만)
+COMPRESSORS = {"gzip": lambda body: gzip.compress(body, compresslevel=6), "deflate": zlib.compress}
+if brotli is not None:
+    COMPRESSORS["br"] = lambda body: brotli.compress(body, quality=5)
+if zstandard is not None:
+    COMPRESSORS["zstd"] = lambda body: zstandard.ZstdCompressor(level=3).compress(body)
+JSON_TYPE = "application/json;charset=UTF-8"
+
+LOGIN_PAGE_HTML = (
+    '<html><head><title>로그인 | 골프존카운티</title></head><body>'
+    '<form id="loginForm" method="post" action="/login/userLogin">'
+    '<input type="hidden" name="gfsReturn" value="/setting/account">'
+    '<input type="hidden" name="loginType" value="NORMAL">'
+    '<input type="text" name="userId"><input type="password" name="userPw">'
+    '</form></body></html>'
+)
+TEETIME_MAIN_HTML = '<html><body><div id="teetimeList">티타임 예약</div></body></html>'
+
+
+# selectTimeSection 코드별 시간대 (분, 양끝 포함). 앱의 LIST_TIME_SECTIONS와 같은 추정값 (실제 서버 미확인)
+TIME_SECTIONS = {"1": (0, 11 * 60 + 59), "2": (12 * 60, 17 * 60 + 59), "3": (18 * 60, 23 * 60 + 59)}
+
+
+def make_teetime_slots(page_no, slots=30, nine_hole_every=0):
+    """
+    'page_no' 페이지(필터 없는 목록 기준)의 슬롯 목록 [(time_table_id, 분, 홀 수, <li> HTML), ...]을 생성합니다.
+    nine_hole_every: N이면 N번째 슬롯마다 9홀 (0이면 모두 18홀).
+    """
+    result = []
+    for i in range(slots):
+        time_table_id = str(12090000 + page_no * 1000 + i)
+        minutes = 6 * 60 + (page_no - 1) * slots * 7 + i * 7
+        hhmm = f"{minutes // 60 % 24:02d}{minutes % 60:02d}"
+        course_cd, course_nm = ("A", "OUT") if i % 2 == 0 else ("B", "IN")
+        hole_cnt = "9" if nine_hole_every and i % nine_hole_every == nine_hole_every - 1 else "18"
+        result.append((time_table_id, minutes % (24 * 60), hole_cnt, (
+            f'<li class="teetime-item" onclick="teetimeReserveConfirm(this)" data-bookg-time="{hhmm}" '
+            f'data-time-table-id="{time_table_id}" data-course-cd-code="{course_cd}" '
+            f'data-hole-cnt="{hole_cnt}" data-green-fee="150000">'
+            f'<div class="time"><strong>{hhmm[:2]}:{hhmm[2:]}</strong></div>'
+            f'<div class="info"><span>{course_nm}</span><span class="hole">{hole_cnt}홀</span><em>4인 필수</em></div>'
+            f'<div class="price"><del>180,000원</del><strong>150,000원</strong></div>'
+            f'</li>'
+        )))
+    return result
+
+
+def render_teetime_page_html(slot_items, closed_slots=5, booked_ids=()):
+    """슬롯 목록을 실제 'getList' 응답과 비슷한 구조의 HTML 조각으로 만듭니다. (예약된 타임은 제외)"""
+    parts = ['<ul class="teetime-list">']
+    parts += [li_html for time_table_id, _, _, li_html in slot_items if time_table_id not in booked_ids]
+    for i in range(closed_slots):
+        parts.append(
+            '<li class="teetime-item disabled"><div class="time"><strong>마감</strong></div>'
+            '<div class="info"><span>IN</span></div></li>'
+        )
+    parts.append('</ul>')
+    return "".join(parts)
+
+
+def make_teetime_page_html(page_no, slots=30, closed_slots=5, booked_ids=(), nine_hole_every=0):
+    """실제 'getList' 응답과 비슷한 구조의 티 타임 목록 HTML 조각을 생성합니다. (예약된 타임은 제외)"""
+    return render_teetime_page_html(make_teetime_slots(page_no, slots, nine_hole_every), closed_slots, booked_ids)
+
+
+class MockGolfzonServer:
+    """
+    골프존 카운티 API를 흉내내는 로컬 HTTP 서버.
+    clock_skew: 서버 시계가 로컬 시계보다 앞선 정도(초). Date 헤더에 그대로 반영됩니다.
+    latency: 요청당 인위적 지연(초). Date 헤더가 찍히는 시점을 기준으로 앞/뒤 절반씩 나눠 적용합니다.
+    jitter: latency에 더해지는 0~jitter초의 무작위 지연.
+    pages / slots: 'getList' 페이지 수와 페이지당 예약 가능 슬롯 수.
+    contention: Check/Submit 시 다른 사용자가 먼저 예약한 것으로 처리할 확률.
+    failure_rate: 예약 관련 요청에 503 오류를 돌려줄 확률.
+    open_at: 서버 시계(epoch 초) 기준 티 타임 오픈 시각. 그 전의 'getList'는 빈 목록을 반환합니다.
+    nine_hole_every: N이면 N번째 슬롯마다 9홀 티 타임 (0이면 모두 18홀).
+    ignore_filters: True면 'getList' 검색 조건(selectTimeSection/selectHoleCnt)을 무시하고 전체 목록을 반환합니다.
+    time_sections: selectTimeSection 코드별 시간대 {코드: (시작 분, 끝 분)} (기본: TIME_SECTIONS).
+        앱의 추정값과 다르게 주면 조건 조회가 티 타임을 빠뜨리는(너무 좁은) 서버를 흉내냅니다.
+    encodings: HTML 응답에 쓸 압축 방식 (선호 순서). 클라이언트 Accept-Encoding에 있는 첫 번째를 사용합니다.
+        압축 결과는 본문별로 캐시하므로 서버 측 압축 비용은 측정에 포함되지 않습니다.
+    bandwidth: 응답 본문 전송 속도(바이트/초, 0이면 제한 없음). 전송 크기에 비례한 지연을 흉내냅니다.
+    tls: True면 자체 서명 인증서로 HTTPS를 제공합니다. (cryptography 필요)
+    http2: True면 TLS ALPN으로 'h2'를 함께 제공합니다. (h2 필요, tls를 켬)
+        False면 ALPN에 'http/1.1'만 있어 HTTP/2를 지원하지 않는 서버를 흉내냅니다.
+    """
+
+    def __init__(self, clock_skew=0.0, latency=0.0, host="127.0.0.1", port=0, jitter=0.0,
+                 pages=4, slots=30, closed_slots=5, contention=0.0, failure_rate=0.0, open_at=None, seed=None,
+                 nine_hole_every=0, ignore_filters=False, time_sections=None, encodings=(), bandwidth=0, tls=False, http2=False):
+        self.clock_skew = clock_skew
+        self.latency = latency
+        self.jitter = jitter
+        self.host = host
+        self.port = port
+        self.pages = pages
+        self.slots = slots
+        self.closed_slots = closed_slots
+        self.contention = contention
+        self.failure_rate = failure_rate
+        self.open_at = open_at
+        self.nine_hole_every = nine_hole_every
+        self.ignore_filters = ignore_filters
+        self.time_sections = dict(time_sections or TIME_SECTIONS)
+        self.encodings = tuple(encodings)
+        self.bandwidth = bandwidth
+        self.compressed = {}  # (압축 방식, 본문) -> 압축된 본문
+        self.tls = tls or http2
+        self.http2 = http2
+        self.random = random.Random(seed)
+        self.httpd = None
+        self.thread = None
+
+        self.lock = threading.Lock()
+        self.sessions = {}  # JSESSIONID -> 로그인 여부
+        self.booked_ids = set()
+        self.arrivals = []  # (path, 로컬 epoch 초) - 요청 도착 기록
+        self.scripted = {}  # path -> [MockResponse, ...] - 기록된 응답 재생 대기열
+        self.connections = []  # 연결별 프로토콜 ('http/1.1' 또는 'h2') - 새 연결 기록
+
+    def now(self):
+        """서버 시계 (epoch 초)."""
+        return time.time() + self.clock_skew
+
+    @property
+    def base_url(self):
+        return f"{'https' if self.tls else 'http'}://{self.host}:{self.port}"
+
+    def start(self):
+        self.httpd = _MockHTTPServer((self.host, self.port), self, self._ssl_context() if self.tls else None)
+        self.port = self.httpd.server_port
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+
+    def reset(self):
+        """예약 상태와 도착 기록을 초기화합니다. (세션은 유지)"""
+        with self.lock:
+            self.booked_ids.clear()
+            self.arrivals.clear()
+            self.compressed.clear()
+            self.connections.clear()
+
+    def _ssl_context(self):
+        """자체 서명 인증서(EC P-256)로 서버용 SSLContext를 만들고 ALPN 프로토콜을 지정합니다."""
+        if x509 is None:
+            raise RuntimeError("TLS 대체 서버에는 cryptography 패키지가 필요합니다.")
+        if self.http2 and h2 is None:
+            raise RuntimeError("HTTP/2 대체 서버에는 h2 패키지가 필요합니다.")
+        key = ec.generate_private_key(ec.SECP256R1())
+        name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, self.host)])
+        now = datetime.datetime.now(datetime.timezone.utc)
+        cert = (x509.CertificateBuilder().subject_name(name).issuer_name(name).public_key(key.public_key())
+                .serial_number(x509.random_serial_number())
+                .not_valid_before(now - datetime.timedelta(days=1)).not_valid_after(now + datetime.timedelta(days=1))
+                .sign(key, hashes.SHA256()))
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        with tempfile.TemporaryDirectory() as directory:
+            cert_path, key_path = os.path.join(directory, "cert.pem"), os.path.join(directory, "key.pem")
+            with open(cert_path, "wb") as f:
+                f.write(cert.public_bytes(serialization.Encoding.PEM))
+            with open(key_path, "wb") as f:
+                f.write(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                          serialization.NoEncryption()))
+            context.load_cert_chain(cert_path, key_path)
+        context.set_alpn_protocols(["h2", "http/1.1"] if self.http2 else ["http/1.1"])
+        return context
+
+    def connection_count(self, protocol=None):
+        """reset 이후 새로 연결된 커넥션 수 (protocol: 'http/1.1' / 'h2', None이면 전체)."""
+        with self.lock:
+            return sum(1 for p in self.connections if protocol is None or p == protocol)
+
+    def script(self, path, *responses):
+        """'path'로 오는 다음 요청들에 기록된 응답(MockResponse)을 순서대로 재생합니다."""
+        with self.lock:
+            self.scripted.setdefault(path, []).extend(responses)
+
+    def encode_body(self, body, accept_encoding):
+        """클라이언트가 받는 압축 방식 중 서버 선호 순서로 첫 번째를 골라 (본문, 압축 방식 또는 None)을 반환합니다."""
+        accepted = {e.split(";")[0].strip() for e in accept_encoding.split(",")}
+        encoding = next((e for e in self.encodings if e in accepted and e in COMPRESSORS), None)
+        if encoding is None:
+            return body, None
+        key = (encoding, body)
+        compressed = self.compressed.get(key)
+        if compressed is None:
+            compressed = self.compressed[key] = COMPRESSORS[encoding](body)
+        return compressed, encoding
+
+    def request_delay(self):
+        """이번 요청에 적용할 지연(초)."""
+        if self.jitter > 0:
+            return self.latency + self.random.uniform(0, self.jitter)
+        return self.latency
+
+    def arrival_times(self, path):
+        """'path'로 도착한 요청들의 도착 시각(로컬 epoch 초) 목록."""
+        with self.lock:
+            return [arrived_at for arrived_path, arrived_at in self.arrivals if arrived_path == path]
+
+    # ----------------------------------------------------
+    # 라우팅 (HTTP 서버와 분리된 순수 상태 처리)
+    # ----------------------------------------------------
+    def handle(self, method, path, query, form, cookies):
+        """
+        요청 하나를 처리하여 MockResponse를 반환합니다.
+        query/form은 parse_qs 결과(dict of list), cookies는 {이름: 값} 입니다.
+        """
+        with self.lock:
+            self.arrivals.append((path, time.time()))
+            if self.scripted.get(path):
+                return self.scripted[path].pop(0)
+
+        session_id = cookies.get("JSESSIONID")
+        logged_in = self.sessions.get(session_id, False)
+
+        if path == "/login":
+            if method == "HEAD" or session_id in self.sessions:
+                return MockResponse(200, LOGIN_PAGE_HTML.encode(), HTML_TYPE, [])
+            return self._new_session_page()
+        if path == "/login/userLogin" and method == "POST":
+            return self._login(session_id, form)
+        if path == "/reserve/main/teetimeList":
+            # 로그인이 풀리면 실제 사이트처럼 로그인 페이지 HTML을 돌려줌 (세션 확인 요청 대상)
+            page = TEETIME_MAIN_HTML if logged_in else LOGIN_PAGE_HTML
+            return MockResponse(200, page.encode(), HTML_TYPE, [])
+
+        if path.startswith("/reserve/"):
+            if not logged_in:
+                # 세션 만료: 실제 사이트처럼 로그인 페이지 HTML을 돌려줌
+                return MockResponse(200, LOGIN_PAGE_HTML.encode(), HTML_TYPE, [])
+            if self.failure_rate and self.random.random() < self.failure_rate:
+                return MockResponse(503, b"Service Temporarily Unavailable", HTML_TYPE, [])
+            if path == "/reserve/golfclub/teetime/getList" and method == "POST":
+                return self._get_list(form)
+            if path == "/reserve/checkReserveTeetimeAble":
+                return self._check(query)
+            if path == "/reserve/postReserveConfirmSubmit" and method == "POST":
+                return self._submit(form)
+
+        return MockResponse(404, b"not found", HTML_TYPE, [])
+
+    def _new_session_page(self):
+        session_id = f"{self.random.getrandbits(64):016X}"
+        with self.lock:
+            self.sessions[session_id] = False
+        return MockResponse(200, LOGIN_PAGE_HTML.encode(), HTML_TYPE,
+                            [("Set-Cookie", f"JSESSIONID={session_id}; Path=/; HttpOnly")])
+
+    def _login(self, session_id, form):
+        if session_id not in self.sessions:
+            return self._json({"result": 1, "message": "세션이 유효하지 않습니다."})
+        if not form.get("userId", [""])[0] or not form.get("userPw", [""])[0]:
+            return self._json({"result": 1, "message": "아이디 또는 비밀번호를 입력해 주세요."})
+        with self.lock:
+            self.sessions[session_id] = True
+        return self._json({"result": 0, "data": {"userInfo": {"personId": "900001"}}})
+
+    def _get_list(self, form):
+        page_no = int(form.get("pageNo", ["1"])[0] or 1)
+        time_section = form.get("selectTimeSection", [""])[0]
+        hole_cnt = form.get("selectHoleCnt", [""])[0]
+        if self.ignore_filters or not (time_section or hole_cnt):
+            slot_items = make_teetime_slots(page_no, self.slots, self.nine_hole_every) if page_no <= self.pages else []
+        else:
+            # 검색 조건에 맞는 슬롯만 모아 페이지를 다시 나눔
+            lo, hi = self.time_sections.get(time_section, (0, 24 * 60 - 1))
+            matched = [slot for p in range(1, self.pages + 1)
+                       for slot in make_teetime_slots(p, self.slots, self.nine_hole_every)
+                       if lo <= slot[1] <= hi and (not hole_cnt or slot[2] == hole_cnt)]
+            slot_items = matched[(page_no - 1) * self.slots:page_no * self.slots]
+        if (self.open_at is not None and self.now() < self.open_at) or not slot_items:
+            return MockResponse(200, b"<ul></ul>", HTML_TYPE, [])
+        with self.lock:
+            booked_ids = set(self.booked_ids)
+        page_html = render_teetime_page_html(slot_items, self.closed_slots, booked_ids)
+        return MockResponse(200, page_html.encode(), HTML_TYPE, [])
+
+    def _taken(self, time_table_id):
+        """다른 사용자가 먼저 예약했는지 여부 (contention 확률로 선점 발생)."""
+        with self.lock:
+            if time_table_id in self.booked_ids:
+                return True
+            if self.contention and self.random.random() < self.contention:
+                self.booked_ids.add(time_table_id)
+                return True
+            return False
+
+    def _check(self, query):
+        time_table_id = query.get("timeTableId", [""])[0]
+        if self._taken(time_table_id):
+            return self._json({"result": 0, "data": {"success": False}, "message": "이미 예약되어 있습니다."})
+        return self._json({"result": 0, "data": {"success": True}})
+
+    def _submit(self, form):
+        time_table_id = form.get("timeTableId", [""])[0]
+        if self._taken(time_table_id):
+            return self._json({"result": 1, "resultCode": "E0101", "data": {}, "message": "이미 예약되어 있습니다."})
+        with self.lock:
+            self.booked_ids.add(time_table_id)
+            bookg_no = len(self.booked_ids)
+        return self._json({"result": 0, "data": {"success": True, "reserveCompleteInfo": {
+            "bookgInfoId": f"BK{time_table_id}", "bookgNo": f"{bookg_no:08d}"}}})
+
+    @staticmethod
+    def _json(payload):
+        return MockResponse(200, json.dumps(payload, ensure_ascii=False).encode(), JSON_TYPE, [])
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # 헤더/본문 분할 전송 시 지연 ACK(~40ms)로 측정이 왜곡되지 않도록
+
+    def log_message(self, format, *args):
+        pass
+
+    def date_time_string(self, timestamp=None):
+        # Date 헤더를 서버 시계(clock_skew 반영) 기준으로 생성
+        return super().date_time_string(self.server.mock.now())
+
+    def _respond(self, response, send_body=True):
+        mock = self.server.mock
+        body, encoding = response.body, None
+        if mock.encodings and response.content_type == HTML_TYPE:
+            body, encoding = mock.encode_body(body, self.headers.get("Accept-Encoding", ""))
+        half_latency = mock.request_delay() / 2
+        if half_latency > 0:
+            time.sleep(half_latency)
+        self.send_response(response.status)
+        self.send_header("Content-Type", response.content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if encoding is not None:
+            self.send_header("Content-Encoding", encoding)
+        for name, value in response.headers:
+            self.send_header(name, value)
+        if half_latency > 0:
+            time.sleep(half_latency)
+        self.end_headers()
+        if send_body and body:
+            if mock.bandwidth > 0:
+                time.sleep(len(body) / mock.bandwidth)
+            self.wfile.write(body)
+
+    def _dispatch(self, method):
+        url = urlsplit(self.path)
+        form = {}
+        content_length = int(self.headers.get("Content-Length") or 0)
+        if content_length:
+            form = parse_qs(self.rfile.read(content_length).decode("utf-8"), keep_blank_values=True)
+        cookies = {name: morsel.value for name, morsel in SimpleCookie(self.headers.get("Cookie", "")).items()}
+        response = self.server.mock.handle(method, url.path, parse_qs(url.query, keep_blank_values=True),
+                                           form, cookies)
+        self._respond(response, send_body=method != "HEAD")
+
+    def do_HEAD(self):
+        self._dispatch("HEAD")
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    """
+    연결마다 스레드로 처리하는 서버. TLS면 연결 스레드에서 핸드셰이크 후 ALPN 결과에 따라
+    'h2'는 _H2Connection으로, 그 외는 _MockHandler(HTTP/1.1)로 처리하고, 연결별 프로토콜을 기록합니다.
+    """
+    daemon_threads = True
+
+    def __init__(self, address, mock, ssl_context=None):
+        super().__init__(address, _MockHandler)
+        self.mock = mock
+        self.ssl_context = ssl_context
+
+    def get_request(self):
+        sock, address = super().get_request()
+        if self.ssl_context is not None:
+            # 핸드셰이크는 accept 루프가 아닌 연결 스레드(finish_request)에서
+            sock = self.ssl_context.wrap_socket(sock, server_side=True, do_handshake_on_connect=False)
+        return sock, address
+
+    def finish_request(self, request, client_address):
+        protocol = "http/1.1"
+        if self.ssl_context is not None:
+            request.do_handshake()
+            protocol = request.selected_alpn_protocol() or protocol
+        with self.mock.lock:
+            self.mock.connections.append(protocol)
+        if protocol == "h2":
+            _H2Connection(request, self.mock).serve()
+        else:
+            super().finish_request(request, client_address)
+
+    def handle_error(self, request, client_address):
+        pass  # 클라이언트가 끊은 연결, 핸드셰이크 실패 등은 측정과 무관
+
+
+class _H2Connection:
+    """
+    ALPN으로 'h2'가 협상된 연결 하나를 처리합니다. (h2 패키지)
+    스트림마다 별도 스레드에서 MockGolfzonServer.handle을 호출하고, _MockHandler._respond와 같은 순서
+    (지연 절반 → Date 기록 → 지연 절반 → 헤더 → 본문)로 응답하여 HTTP/1.1과 같은 조건에서 비교합니다.
+    """
+
+    def __init__(self, sock, mock):
+        self.sock = sock
+        self.mock = mock
+        self.conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False, header_encoding="utf-8"))
+        self.lock = threading.Lock()
+        self.window_open = threading.Condition(self.lock)  # 흐름 제어 창이 열리면 알림
+        self.requests = {}  # stream_id -> (헤더 목록, 본문 bytearray)
+        self.closed = False
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _flush(self):
+        """쌓인 프레임을 전송합니다. (self.lock을 잡은 상태에서 호출)"""
+        data = self.conn.data_to_send()
+        if data:
+            self.sock.sendall(data)
+
+    def serve(self):
+        try:
+            with self.lock:
+                self.conn.initiate_connection()
+                self._flush()
+            while not self.closed:
+                data = self.sock.recv(65536)
+                if not data:
+                    break
+                with self.lock:
+                    for event in self.conn.receive_data(data):
+                        self._on_event(event)
+                    self._flush()
+        except (OSError, h2.exceptions.H2Error):
+            pass
+        finally:
+            with self.lock:
+                self.closed = True
+                self.window_open.notify_all()
+
+    def _on_event(self, event):
+        if isinstance(event, h2.events.RequestReceived):
+            self.requests[event.stream_id] = (event.headers, bytearray())
+        elif isinstance(event, h2.events.DataReceived):
+            self.requests[event.stream_id][1].extend(event.data)
+            self.conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+        elif isinstance(event, h2.events.StreamEnded):
+            headers, body = self.requests.pop(event.stream_id)
+            threading.Thread(target=self._respond, args=(event.stream_id, headers, bytes(body)), daemon=True).start()
+        elif isinstance(event, h2.events.StreamReset):
+            self.requests.pop(event.stream_id, None)
+        elif isinstance(event, (h2.events.WindowUpdated, h2.events.RemoteSettingsChanged)):
+            self.window_open.notify_all()
+        elif isinstance(event, h2.events.ConnectionTerminated):
+            self.closed = True
+
+    def _respond(self, stream_id, headers, body):
+        mock = self.mock
+        fields, cookie_headers = {}, []
+        for name, value in headers:
+            if name == "cookie":  # HTTP/2에서는 쿠키가 여러 헤더로 나뉘어 올 수 있음
+                cookie_headers.append(value)
+            else:
+                fields[name] = value
+        method, url = fields[":method"], urlsplit(fields[":path"])
+        form = parse_qs(body.decode("utf-8"), keep_blank_values=True) if body else {}
+        cookies = {name: morsel.value for name, morsel in SimpleCookie("; ".join(cookie_headers)).items()}
+        response = mock.handle(method, url.path, parse_qs(url.query, keep_blank_values=True), form, cookies)
+
+        payload, encoding = response.body, None
+        if mock.encodings and response.content_type == HTML_TYPE:
+            payload, encoding = mock.encode_body(payload, fields.get("accept-encoding", ""))
+        half_latency = mock.request_delay() / 2
+        if half_latency > 0:
+            time.sleep(half_latency)
+        response_headers = [(":status", str(response.status)), ("date", formatdate(mock.now(), usegmt=True)),
+                            ("content-type", response.content_type), ("content-length", str(len(payload)))]
+        if encoding is not None:
+            response_headers.append(("content-encoding", encoding))
+        response_headers.extend((name.lower(), value) for name, value in response.headers)
+        if half_latency > 0:
+            time.sleep(half_latency)
+
+        send_body = method != "HEAD" and bool(payload)
+        try:
+            with self.lock:
+                self.conn.send_headers(stream_id, response_headers, end_stream=not send_body)
+                self._flush()
+            if not send_body:
+                return
+            if mock.bandwidth > 0:
+                time.sleep(len(payload) / mock.bandwidth)
+            view = memoryview(payload)
+            with self.lock:
+                while view:
+                    size = min(len(view), self.conn.local_flow_control_window(stream_id),
+                               self.conn.max_outbound_frame_size)
+                    if size <= 0:
+                        if self.closed:
+                            return
+                        self.window_open.wait()
+                        continue
+                    self.conn.send_data(stream_id, view[:size].tobytes())
+                    view = view[size:]
+                    self._flush()
+                self.conn.end_stream(stream_id)
+                self._flush()
+        except (OSError, h2.exceptions.H2Error):
+            pass  # 클라이언트가 스트림/연결을 닫음
+
+
+def main():
+    parser = argparse.ArgumentParser(description="골프존 카운티 로컬 대체 서버")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--clock-skew", type=float, default=0.0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--pages", type=int, default=4)
+    parser.add_argument("--slots", type=int, default=30)
+    parser.add_argument("--contention", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--nine-hole-every", type=int, default=0)
+    parser.add_argument("--ignore-filters", action="store_true")
+    parser.add_argument("--encodings", nargs="*", default=[], choices=list(COMPRESSORS))
+    parser.add_argument("--bandwidth", type=int, default=0, help="응답 본문 전송 속도(바이트/초)")
+    parser.add_argument("--tls", action="store_true", help="자체 서명 인증서로 HTTPS 제공")
+    parser.add_argument("--http2", action="store_true", help="TLS ALPN으로 HTTP/2(h2)도 제공 (--tls 포함)")
+    args = parser.parse_args()
+
+    server = MockGolfzonServer(clock_skew=args.clock_skew, latency=args.latency, port=args.port,
+                               jitter=args.jitter, pages=args.pages, slots=args.slots,
+                               contention=args.contention, failure_rate=args.failure_rate,
+                               nine_hole_every=args.nine_hole_every, ignore_filters=args.ignore_filters,
+                               encodings=args.encodings, bandwidth=args.bandwidth,
+                               tls=args.tls, http2=args.http2).start()
+    print(f"✅ 로컬 대체 서버 실행 중: {server.base_url} (Ctrl+C로 종료)")
+    try:
+        server.thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
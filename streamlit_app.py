@@ -1,14 +1,6 @@
 # 골프존 카운티 전체 예약 Streamlit 앱 (UI: 뉴서울CC 스타일 적용)
-import warnings
-
-# RuntimeWarning: coroutine '...' was never awaited 경고를 무시하도록 설정
-warnings.filterwarnings(
-    "ignore",
-    message="coroutine '.*' was never awaited",
-    category=RuntimeWarning
-)
-
 import streamlit as st
+import asyncio
 import datetime
 import threading
 import time
@@ -16,15 +8,64 @@ import queue
 import sys
 import traceback
 import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
 import ujson as json
 import urllib3
+import urllib3.connection
+import urllib3.util.connection
+import urllib3.util.request
 import re
 import pytz
+import base64
 import hashlib
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import heapq
+import ipaddress
+import itertools
+import math
+import random
+import os
+import socket
+import zlib
+import http.client
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from email.utils import parsedate_to_datetime
+from html import unescape
+from operator import itemgetter
+from types import SimpleNamespace
+from urllib.parse import urlencode, urlparse
 from bs4 import BeautifulSoup
 
+try:
+    import httpx  # [추가] asyncio 엔진용 (선택 설치)
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # [추가] HTTP/2 전송용 (선택 설치, httpx[http2])
+except ImportError:
+    h2 = None
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken  # [추가] 로그인 세션 캐시 암호화용 (선택 설치)
+except ImportError:
+    Fernet = None
+    InvalidToken = ValueError
+
+try:
+    import brotli  # [추가] 'br' 응답 풀기용 (선택 설치, urllib3/httpx도 같은 패키지로 'br'을 지원)
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+try:
+    import zstandard  # [추가] 'zstd' 응답 풀기용 (선택 설치)
+except ImportError:
+    zstandard = None
+
 # InsecureRequestWarning 비활성화
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -64,6 +105,23 @@ GOLFZON_CLUB_MAP = {
 }
 # ============================================================
 
+# [추가] 'getList' 조회 방식 (UI 선택값)
+FETCH_MODE_SEQUENTIAL = '순차 (페이지별 조회)'
+FETCH_MODE_CONCURRENT = '동시 (병렬 조회)'
+FETCH_MODE_STREAMING = '스트리밍 (도착 즉시 예약)'
+FETCH_MODE_OPTIONS = [FETCH_MODE_SEQUENTIAL, FETCH_MODE_CONCURRENT, FETCH_MODE_STREAMING]
+
+# [추가] 예약 엔진 (UI 선택값)
+ENGINE_THREAD = '스레드 (requests)'
+ENGINE_ASYNC = 'asyncio (httpx)'
+ENGINE_OPTIONS = [ENGINE_THREAD, ENGINE_ASYNC]
+
+# [추가] 전송 프로토콜 (UI 선택값)
+TRANSPORT_HTTP1 = 'HTTP/1.1 (커넥션 풀)'
+TRANSPORT_HTTP2 = 'HTTP/2 (멀티플렉싱)'
+TRANSPORT_OPTIONS = [TRANSPORT_HTTP1, TRANSPORT_HTTP2]
+HTTP2_AVAILABLE = httpx is not None and h2 is not None
+
 
 # [수정] 앱 제목 변경
 st.set_page_config(
@@ -93,8 +151,139 @@ def log_message(message, message_queue):
         pass
 
 
+# ============================================================
+# [추가] 핫 패스 로거 (T-0 ~ Submit 구간용 링 버퍼)
+# ============================================================
+LOG_DEBUG = 10  # 응답/Payload 전체 덤프 (골든 타임 구간에서는 기본적으로 버림)
+LOG_INFO = 20
+LOG_ERROR = 40
+
+# 이벤트 코드 → (레벨, 포맷). 포맷팅은 UI(소비자) 쪽에서 drain 할 때 수행합니다.
+EVT_TEXT = 0
+EVT_GETLIST_TRY = 1
+EVT_GETLIST_OK = 2
+EVT_CHECK_OK = 3
+EVT_CHECK_FAIL = 4
+EVT_SUBMIT_SEND = 5
+EVT_SUBMIT_PAYLOAD = 6
+EVT_SUBMIT_FAIL = 7
+EVT_RESPONSE_DUMP = 8
+EVT_RESPONSE_SNIPPET = 9
+EVT_ATTEMPT = 10
+EVT_ATTEMPT_FAIL = 11
+EVT_RETRY_BACKOFF = 12
+
+LOG_EVENTS = {
+    EVT_TEXT: (LOG_INFO, "{}"),
+    EVT_GETLIST_TRY: (LOG_INFO, "🔄 티 타임 조회 시도 ({}페이지, 시도 {}/{})..."),
+    EVT_GETLIST_OK: (LOG_INFO, "✅ 'getList' {}페이지 HTML 응답 수신 성공."),
+    EVT_CHECK_OK: (LOG_INFO, "✅ 1단계('checkReserveTeetimeAble') 성공: 예약 가능 확인됨 (Result: 0)"),
+    EVT_CHECK_FAIL: (LOG_INFO, "❌ 1단계 실패 (Result Code: {}, Data Success: {}, 분류: {}): {}"),
+    EVT_SUBMIT_SEND: (LOG_INFO, "🚀 **[최종 시도]** {} ({}) 예약 요청 전송..."),
+    EVT_SUBMIT_PAYLOAD: (LOG_DEBUG, "🔎 2단계 PayLoad 전송 값: {}"),
+    EVT_SUBMIT_FAIL: (LOG_INFO, "❌ 2단계('postReserveConfirmSubmit') 실패 (Result Code: {}/Result: {}, 분류: {}): {}"),
+    EVT_RESPONSE_DUMP: (LOG_DEBUG, "📜 {} 전체: {}"),
+    EVT_RESPONSE_SNIPPET: (LOG_DEBUG, "📜 응답 스니펫 (HTML/Text): {:.100}..."),
+    EVT_ATTEMPT: (LOG_INFO, "⭐ {}순위({}, {}) 예약 시도 ({}회차)..."),
+    EVT_ATTEMPT_FAIL: (LOG_INFO, "❌ 예약 시도 실패 [{}]: {}"),
+    EVT_RETRY_BACKOFF: (LOG_INFO, "🔄 [{}] {:.0f}ms 후 재시도 (지터 백오프)..."),
+}
+
+
+class HotPathLogger:
+    """
+    미리 할당된 링 버퍼에 (순번, monotonic 시각, 이벤트 코드, 인자) 레코드만 저장하는 로거입니다.
+    기록 시점에는 시각 변환/strftime/문자열 포맷팅/queue.put을 하지 않고, drain() 하는 쪽에서 포맷팅합니다.
+    순번 발급(itertools.count)과 슬롯 저장은 GIL 아래에서 각각 원자적이므로 잠금 없이 여러 스레드가 기록할 수 있습니다.
+    min_level보다 낮은 레벨(예: 응답 전체 덤프)은 기록하지 않습니다.
+    """
+
+    def __init__(self, capacity=4096):
+        capacity = 1 << max(4, (capacity - 1).bit_length())  # 2의 거듭제곱으로 올림 (인덱스 마스킹)
+        self.capacity = capacity
+        self._mask = capacity - 1
+        self._buffer = [None] * capacity
+        self._seq = itertools.count()
+        self._read_seq = 0
+        self.dropped = 0
+        self.min_level = LOG_DEBUG
+        # monotonic 시각 → KST 벽시계 변환 기준점
+        self._wall_origin = time.time()
+        self._mono_origin = time.monotonic()
+
+    def log(self, code, *args):
+        if LOG_EVENTS[code][0] < self.min_level:
+            return
+        seq = next(self._seq)
+        self._buffer[seq & self._mask] = (seq, time.monotonic(), code, args)
+
+    def text(self, message, level=LOG_INFO):
+        """이벤트 코드가 없는 일반 문자열 메시지를 기록합니다."""
+        if level < self.min_level:
+            return
+        seq = next(self._seq)
+        self._buffer[seq & self._mask] = (seq, time.monotonic(), EVT_TEXT, (message,))
+
+    def format_record(self, record):
+        _, mono, code, args = record
+        wall = self._wall_origin + (mono - self._mono_origin)
+        timestamp = datetime.datetime.fromtimestamp(wall, KST).strftime('%H:%M:%S.%f')[:-3]
+        try:
+            message = LOG_EVENTS[code][1].format(*args)
+        except (IndexError, KeyError, ValueError) as e:
+            message = f"(로그 포맷 오류 {code}: {e}) {args!r}"
+        return f"[{timestamp}] {message}"
+
+    def drain(self):
+        """
+        아직 읽지 않은 레코드를 포맷팅하여 순서대로 반환합니다.
+        순번만 발급되고 아직 저장되지 않은 슬롯에서 멈추고, 덮어써진(유실된) 레코드는 건너뛰어 개수를 알립니다.
+        """
+        lines = []
+        seq = self._read_seq
+        skipped = 0
+        while True:
+            record = self._buffer[seq & self._mask]
+            if record is None or record[0] < seq:
+                break
+            if record[0] > seq:
+                skipped += record[0] - seq
+                seq = record[0]
+            lines.append(self.format_record(record))
+            seq += 1
+        self._read_seq = seq
+        if skipped:
+            self.dropped += skipped
+            lines.append(f"[{datetime.datetime.now(KST).strftime('%H:%M:%S.%f')[:-3]}] "
+                         f"⚠️ 로그 버퍼가 가득 차 {skipped}건이 유실되었습니다.")
+        return lines
+
+    def flush_to(self, message_queue):
+        """drain 결과를 UI 로그 큐로 옮깁니다. (UI가 직접 drain 하지 않는 경우)"""
+        for line in self.drain():
+            message_queue.put(f"UI_LOG:{line}")
+
+
+# [추가] 자정 기준 분(0~1439) ↔ 'HHMM' / 'HH:MM' 변환표 (정규식 없이 조회)
+TIME_API_BY_MINUTE = tuple(f"{m // 60:02d}{m % 60:02d}" for m in range(24 * 60))
+TIME_DISPLAY_BY_MINUTE = tuple(f"{m // 60:02d}:{m % 60:02d}" for m in range(24 * 60))
+MINUTE_BY_TIME_STR = {text: m for m, text in enumerate(TIME_API_BY_MINUTE)}
+MINUTE_BY_TIME_STR.update({text: m for m, text in enumerate(TIME_DISPLAY_BY_MINUTE)})
+
+
+def parse_minutes(time_str):
+    """'HHMM' / 'HH:MM' / 'HMM' 문자열을 자정 기준 분(int)으로 변환합니다. 인식하지 못하면 None."""
+    minutes = MINUTE_BY_TIME_STR.get(time_str)
+    if minutes is None:
+        minutes = MINUTE_BY_TIME_STR.get(format_time_for_api(time_str))
+    return minutes
+
+
 def format_time_for_api(time_str):
     """Converts HH:MM to HHMM."""
+    minutes = MINUTE_BY_TIME_STR.get(time_str) if isinstance(time_str, str) else None
+    if minutes is not None:  # [추가] 변환표에 있는 값은 정규식 없이 바로 반환
+        return TIME_API_BY_MINUTE[minutes]
     if not isinstance(time_str, str): time_str = str(time_str)
     time_str = time_str.strip().replace(":", "")
     if re.match(r'^\d{3,4}$', time_str) and time_str.isdigit():
@@ -107,6 +296,9 @@ def format_time_for_api(time_str):
 
 def format_time_for_display(time_str):
     """Converts HHMM or HH:MM string to HH:MM display format."""
+    minutes = MINUTE_BY_TIME_STR.get(time_str) if isinstance(time_str, str) else None
+    if minutes is not None:  # [추가] 변환표에 있는 값은 정규식 없이 바로 반환
+        return TIME_DISPLAY_BY_MINUTE[minutes]
     if not isinstance(time_str, str): time_str = time_str.strftime('%H:%M') if isinstance(time_str,
                                                                                           datetime.time) else str(
         time_str)
@@ -118,62 +310,1446 @@ def format_time_for_display(time_str):
     return time_str
 
 
-def wait_until(target_dt_kst, stop_event, message_queue, log_prefix="프로그램 실행", log_countdown=False):
-    """Waits precisely until the target KST datetime, with a countdown."""
-    global KST
+class TeeTime:
+    """
+    [추가] 예약 후보 티 타임 (기존 (bk_time, time_table_id, course_cd_code, course_nm) 4-튜플 대체).
+    시각은 자정 기준 분(int)으로 저장하여 필터링/정렬을 정수 비교로 하고,
+    코스 코드/이름은 intern하여 같은 코스끼리 문자열 객체를 공유합니다.
+    """
+    __slots__ = ('minutes', 'time_table_id', 'course_cd', 'course_nm')
+
+    def __init__(self, minutes, time_table_id, course_cd, course_nm):
+        self.minutes = minutes
+        self.time_table_id = time_table_id
+        self.course_cd = course_cd
+        self.course_nm = course_nm
+
+    @classmethod
+    def from_api(cls, bk_time, time_table_id, course_cd, course_nm):
+        """getList 속성값('HHMM' 시각 문자열 등)으로 생성합니다. 시각을 인식하지 못하면 ValueError."""
+        minutes = parse_minutes(bk_time)
+        if minutes is None:
+            raise ValueError(f"알 수 없는 티 타임 시각: {bk_time!r}")
+        return cls(minutes, time_table_id, sys.intern(course_cd) if course_cd else None, sys.intern(course_nm))
+
+    @property
+    def time_api(self):
+        return TIME_API_BY_MINUTE[self.minutes]
+
+    @property
+    def time_display(self):
+        return TIME_DISPLAY_BY_MINUTE[self.minutes]
+
+    @property
+    def sort_key(self):
+        return self.minutes, self.course_cd or ""
+
+    @property
+    def label(self):
+        return f"{TIME_DISPLAY_BY_MINUTE[self.minutes]} ({self.course_nm})"
+
+    def _fields(self):
+        return self.minutes, self.time_table_id, self.course_cd, self.course_nm
+
+    def __eq__(self, other):
+        return isinstance(other, TeeTime) and self._fields() == other._fields()
+
+    def __hash__(self):
+        return hash(self._fields())
+
+    def __repr__(self):
+        return f"TeeTime({self.time_api}, {self.time_table_id}, {self.course_cd}, {self.course_nm})"
+
+
+TEETIME_SORT_KEY = TeeTime.sort_key.fget  # list.sort(key=...) 용
+
+
+# ============================================================
+# [추가] 선호도 순위 엔진 (골든 타임 전에 분 단위 점수표로 컴파일)
+# ============================================================
+RANKING_WEIGHT_SCALE = 10_000  # 가중치 1 = 시간 순서 점수(최대 1440)보다 큰 단위
+RANKING_TOP_K = 5  # 예약 시도에 넘길 상위 후보 수
+RANKING_EDGE_PENALTY = 1  # '첫/마지막 티 피하기' 감점 (가중치 단위)
+ORDER_REVERSE = '역순 (늦은 시간 순)'
+
+
+def parse_weighted_list(text, parse_key):
+    """
+    [추가] "키=가중치, 키=가중치" 형식의 선호도 입력을 [(키, 가중치), ...]로 변환합니다.
+    가중치를 생략하면 1이며, 형식이 잘못되면 ValueError를 발생시킵니다.
+    """
+    entries = []
+    for part in (text or "").replace(";", ",").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        key_text, _, weight_text = part.partition("=")
+        try:
+            weight = int(weight_text) if weight_text.strip() else 1
+        except ValueError:
+            raise ValueError(f"가중치는 정수여야 합니다: '{part}'") from None
+        entries.append((parse_key(key_text.strip()), weight))
+    return entries
+
+
+def parse_time_window(text):
+    """[추가] 'HH:MM-HH:MM' 구간을 (시작 분, 종료 분)으로 변환합니다."""
+    start_text, sep, end_text = text.partition("-")
+    start_minutes, end_minutes = parse_minutes(start_text.strip()), parse_minutes(end_text.strip())
+    if not sep or start_minutes is None or end_minutes is None or start_minutes > end_minutes:
+        raise ValueError(f"시간대는 'HH:MM-HH:MM' 형식이어야 합니다: '{text}'")
+    return start_minutes, end_minutes
+
+
+class SlotRanking:
+    """
+    [추가] 컴파일된 티 타임 선호도 순위표.
+
+    점수 = 시간 순서 점수(순차: 빠를수록, 역순: 늦을수록 큼, 1~1440)
+         + 선호 시간대 가중치 합 x RANKING_WEIGHT_SCALE
+         + 코스 가중치 x RANKING_WEIGHT_SCALE
+         - (첫/마지막 티이면) RANKING_EDGE_PENALTY x RANKING_WEIGHT_SCALE
+    코스별로 분(0~1439) 단위 점수표를 미리 만들어 두므로, getList 결과는 정렬 없이 한 번 훑으며
+    표만 조회해 상위 K개를 고릅니다. 같은 점수는 getList 순서를 따릅니다.
+    """
+    __slots__ = ('course_tables', 'default_table', 'suffix_best', 'avoid_edges', 'top_k', 'description')
+
+    def __init__(self, start_minutes, end_minutes, course_filter=None, is_reverse=False, windows=(),
+                 course_weights=(), avoid_edges=False, top_k=RANKING_TOP_K):
+        scores = [None] * len(TIME_API_BY_MINUTE)
+        for minutes in range(start_minutes, end_minutes + 1):
+            scores[minutes] = minutes + 1 if is_reverse else len(scores) - minutes
+        for (window_start, window_end), weight in windows:
+            for minutes in range(max(window_start, start_minutes), min(window_end, end_minutes) + 1):
+                scores[minutes] += weight * RANKING_WEIGHT_SCALE
+
+        # 코스별 점수표 (코스 필터가 있으면 다른 코스는 모두 None)
+        course_bonus = {sys.intern(name): weight * RANKING_WEIGHT_SCALE for name, weight in course_weights}
+        if course_filter:
+            course_bonus = {sys.intern(course_filter): course_bonus.get(course_filter, 0)}
+            self.default_table = (None,) * len(scores)
+        else:
+            self.default_table = tuple(scores)
+        self.course_tables = {
+            name: tuple(None if score is None else score + bonus for score in scores)
+            for name, bonus in course_bonus.items()}
+
+        # suffix_best[m]: m분 이후 시각에서 나올 수 있는 최고 점수 (스트리밍 조기 확정용 상한)
+        tables = [*self.course_tables.values(), self.default_table]
+        suffix_best = [None] * (len(scores) + 1)
+        best = None
+        for minutes in range(len(scores) - 1, -1, -1):
+            for table in tables:
+                score = table[minutes]
+                if score is not None and (best is None or score > best):
+                    best = score
+            suffix_best[minutes] = best
+        self.suffix_best = tuple(suffix_best)
+
+        self.avoid_edges = avoid_edges
+        self.top_k = top_k
+
+        parts = [f"{TIME_DISPLAY_BY_MINUTE[start_minutes]}~{TIME_DISPLAY_BY_MINUTE[end_minutes]}",
+                 f"코스 {course_filter or 'ALL'}", "역순" if is_reverse else "순차"]
+        parts += [f"{TIME_DISPLAY_BY_MINUTE[ws]}-{TIME_DISPLAY_BY_MINUTE[we]}={w:+d}" for (ws, we), w in windows]
+        parts += [f"{name}={weight:+d}" for name, weight in course_weights]
+        if avoid_edges:
+            parts.append("첫/마지막 티 피하기")
+        self.description = ", ".join(parts)
+
+    @classmethod
+    def from_inputs(cls, inputs):
+        """UI 입력값으로 순위표를 컴파일합니다. 선호도 입력 형식이 잘못되면 ValueError."""
+        course = inputs['course_type']
+        return cls(
+            parse_minutes(inputs['start_time']), parse_minutes(inputs['end_time']),
+            course_filter=None if course == "ALL" else course,
+            is_reverse=inputs['order'] == ORDER_REVERSE,
+            windows=parse_weighted_list(inputs.get('preferred_windows', ""), parse_time_window),
+            course_weights=parse_weighted_list(inputs.get('course_weights', ""), str),
+            avoid_edges=bool(inputs.get('avoid_edge_tees', False)),
+        )
+
+    def score(self, teetime, edge_minutes=()):
+        """후보의 점수. 시간대/코스 조건 밖이면 None. edge_minutes에 속한 시각은 감점합니다."""
+        score = self.course_tables.get(teetime.course_nm, self.default_table)[teetime.minutes]
+        if score is not None and teetime.minutes in edge_minutes:
+            score -= RANKING_EDGE_PENALTY * RANKING_WEIGHT_SCALE
+        return score
+
+    def upper_bound(self, from_minutes):
+        """from_minutes 이후 시각의 (아직 받지 못한) 후보가 받을 수 있는 최고 점수. 없으면 None."""
+        return self.suffix_best[from_minutes]
+
+    def rank(self, items, top_k=None):
+        """
+        한 번 훑어 점수를 매기고 상위 top_k개(기본: self.top_k)를 점수 내림차순으로 반환합니다.
+        반환값: (상위 후보 [(점수, TeeTime), ...], 조건에 맞는 후보 수)
+        """
+        course_tables, default_table = self.course_tables, self.default_table
+        scored = []
+        append = scored.append
+        for teetime in items:  # score()와 같은 계산 (호출 비용 제거)
+            score = course_tables.get(teetime.course_nm, default_table)[teetime.minutes]
+            if score is not None:
+                append((score, teetime))
+        if self.avoid_edges and scored:
+            first_minutes, last_minutes = min(t.minutes for t in items), max(t.minutes for t in items)
+            edge_penalty = RANKING_EDGE_PENALTY * RANKING_WEIGHT_SCALE
+            scored = [(score - edge_penalty, t) if t.minutes == first_minutes or t.minutes == last_minutes
+                      else (score, t) for score, t in scored]
+        return heapq.nlargest(top_k or self.top_k, scored, key=itemgetter(0)), len(scored)
+
+
+# --- [추가] 고속 티 타임 추출기 (BeautifulSoup 대체) ---
+# 예약 가능한 <li onclick="teetimeReserveConfirm(this)" data-...> 태그와 그 안의 첫 번째 <div class="info"><span>만 읽습니다.
+TEETIME_MARKER = 'teetimeReserveConfirm'
+_TEETIME_LI_RE = re.compile(r'<li\b([^>]*?teetimeReserveConfirm[^>]*)>(.*?)</li\s*>', re.S | re.I)
+_BOOKG_TIME_RE = re.compile(r'\bdata-bookg-time\s*=\s*["\']([^"\']*)["\']')
+_TIME_TABLE_ID_RE = re.compile(r'\bdata-time-table-id\s*=\s*["\']([^"\']*)["\']')
+_COURSE_CD_RE = re.compile(r'\bdata-course-cd-code\s*=\s*["\']([^"\']*)["\']')
+_HOLE_CNT_RE = re.compile(r'\bdata-hole-cnt\s*=\s*["\']([^"\']*)["\']')
+_INFO_SPAN_RE = re.compile(
+    r'<div\b[^>]*\bclass\s*=\s*["\'](?:[^"\']*\s)?info(?:\s[^"\']*)?["\'][^>]*>.*?<span\b[^>]*>(.*?)</span\s*>',
+    re.S | re.I)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def extract_teetime_items(times_html, hole_cnt=None):
+    """
+    'getList' HTML에서 예약 가능한 티 타임(TeeTime)을 한 번의 훑기로 추출합니다.
+    마크업이 예상과 다르면 (태그 수 불일치, 필수 속성/코스 영역 누락) None을 반환하여
+    호출 측이 BeautifulSoup 파서로 전환하도록 합니다.
+    [추가] hole_cnt가 있으면 data-hole-cnt가 다른 티 타임은 제외합니다. (속성이 없으면 포함)
+    """
+    items = []
+    skipped = 0
+    for match in _TEETIME_LI_RE.finditer(times_html):
+        attrs, body = match.group(1), match.group(2)
+        if hole_cnt:
+            hole = _HOLE_CNT_RE.search(attrs)
+            if hole is not None and hole.group(1) != hole_cnt:
+                skipped += 1
+                continue
+        bk_time = _BOOKG_TIME_RE.search(attrs)
+        time_table_id = _TIME_TABLE_ID_RE.search(attrs)
+        course_cd = _COURSE_CD_RE.search(attrs)
+        course_span = _INFO_SPAN_RE.search(body)
+        if bk_time is None or time_table_id is None or course_span is None:
+            return None
+        minutes = parse_minutes(bk_time.group(1))
+        if minutes is None:
+            return None
+
+        course_nm = sys.intern(unescape(_TAG_RE.sub('', course_span.group(1))).strip())
+        items.append(TeeTime(minutes, time_table_id.group(1), sys.intern(course_cd.group(1)) if course_cd else None,
+                             course_nm))
+
+    # onclick 마커 수와 추출된 <li> 수가 다르면 구조가 바뀐 것으로 간주
+    if len(items) + skipped != times_html.count(TEETIME_MARKER):
+        return None
+    return items
+
+
+# ============================================================
+# [추가] 'getList' 서버 측 검색 조건 (조건에 맞는 티 타임만 받아 페이지/바이트 수 감소)
+# ============================================================
+# selectTimeSection 코드별 시간대 (분, 양끝 포함). 사이트의 1부/2부/3부 구분에서 추정한 값으로 실제 서버에서는
+# 확인되지 않았습니다. 조회 시간대가 한 구간 안에 들어갈 때만 전송하고, 실행 전 verify_list_filter로 확인합니다.
+LIST_TIME_SECTIONS = (("1", 0, 11 * 60 + 59), ("2", 12 * 60, 17 * 60 + 59), ("3", 18 * 60, 23 * 60 + 59))
+HOLE_CNT_OPTIONS = {"전체": "", "18홀": "18", "9홀": "9"}
+PLAY_PLAYER_CNT = "4"  # 예약 인원 (postReserveConfirmSubmit의 playPlayerCnt, selectPersonCnt 조건으로도 사용)
+
+
+class ListFilter:
+    """
+    [추가] 'getList' 검색 조건.
+
+    시간대(selectTimeSection), 홀 수(selectHoleCnt), 인원(selectPersonCnt)을 요청 Payload에 넣어
+    서버가 조건에 맞는 티 타임만 보내도록 합니다. 클라이언트 필터(SlotRanking, 홀 수 확인)는 그대로 유지하므로
+    서버 필터는 응답 크기만 줄이며, 서버가 조건을 무시한 응답(조건 밖 티 타임 포함)을 보내면
+    server_side를 끄고 이후 조회는 전체 조회로 돌아갑니다.
+    [수정] 코드가 추정값이라 기본값은 사용 안함입니다. 켜면 실행 전 이미 열린 날짜로 조건 조회가 티 타임을
+    빠뜨리지 않는지(너무 좁은 응답) 확인하고, 빠지거나 확인할 수 없으면 server_side를 끕니다. (APIBookingCore.verify_list_filter)
+    searchTime은 의미(해당 시각 이후/정확히 일치)를 응답으로 확인할 수 없어 보내지 않습니다.
+    """
+    __slots__ = ('time_section', 'section_range', 'hole_cnt', 'person_cnt', 'server_side')
+
+    def __init__(self, start_minutes, end_minutes, hole_cnt="", person_cnt=PLAY_PLAYER_CNT, server_side=False):
+        section = next(((code, lo, hi) for code, lo, hi in LIST_TIME_SECTIONS
+                        if lo <= start_minutes and end_minutes <= hi), None)
+        self.time_section = section[0] if section else ""
+        self.section_range = section[1:] if section else None
+        self.hole_cnt = hole_cnt
+        self.person_cnt = person_cnt
+        self.server_side = server_side
+
+    @classmethod
+    def from_inputs(cls, inputs):
+        """
+        UI 입력값(start_time/end_time, hole_cnt, server_filter)으로 검색 조건을 만듭니다.
+        '첫/마지막 티 피하기'는 하루 전체 목록의 첫/마지막 티가 필요하므로 시간대 조건을 보내지 않습니다.
+        """
+        if inputs.get('avoid_edge_tees'):
+            start_minutes, end_minutes = 0, len(TIME_API_BY_MINUTE) - 1
+        else:
+            start_minutes, end_minutes = parse_minutes(inputs['start_time']), parse_minutes(inputs['end_time'])
+        return cls(start_minutes, end_minutes,
+                   hole_cnt=HOLE_CNT_OPTIONS.get(inputs.get('hole_cnt', "전체"), ""),
+                   server_side=bool(inputs.get('server_filter', False)))
+
+    def payload_fields(self):
+        """'getList' Payload에 덮어쓸 검색 조건. 서버 측 필터를 쓰지 않으면 빈 dict."""
+        if not self.server_side:
+            return {}
+        return {"selectTimeSection": self.time_section, "selectHoleCnt": self.hole_cnt,
+                "selectPersonCnt": self.person_cnt}
+
+    @property
+    def key(self):
+        """페이지 수 기록 등에 쓰는 조건 식별자. 서버 측 필터를 쓰지 않으면 ""."""
+        if not self.server_side:
+            return ""
+        return f"t{self.time_section}h{self.hole_cnt}p{self.person_cnt}"
+
+    @property
+    def description(self):
+        if not self.server_side:
+            return "서버 측 필터 사용 안함" + (f" ({self.hole_cnt}홀만 선택)" if self.hole_cnt else "")
+        parts = [f"시간대 {self.time_section}부" if self.time_section else "시간대 전체",
+                 f"{self.hole_cnt}홀" if self.hole_cnt else "홀 수 전체", f"{self.person_cnt}인"]
+        return ", ".join(parts)
+
+    def in_section(self, minutes):
+        """[추가] 시간대 조건(selectTimeSection) 안의 시각인지. 시간대 조건이 없으면 항상 True."""
+        return self.section_range is None or self.section_range[0] <= minutes <= self.section_range[1]
+
+    def violation(self, page_html):
+        """
+        서버가 조건을 무시했다는 증거(조건 밖 티 타임)를 찾아 설명을 반환합니다. 없으면 None.
+        인원 조건은 응답 마크업으로 확인할 수 없어 시간대/홀 수만 확인합니다.
+        """
+        if self.section_range is not None:
+            lo, hi = self.section_range
+            for value in _BOOKG_TIME_RE.findall(page_html):
+                minutes = parse_minutes(value)
+                if minutes is not None and not lo <= minutes <= hi:
+                    return f"시간대 {self.time_section}부 밖의 티 타임 {TIME_DISPLAY_BY_MINUTE[minutes]}"
+        if self.hole_cnt:
+            for value in _HOLE_CNT_RE.findall(page_html):
+                if value != self.hole_cnt:
+                    return f"{value}홀 티 타임"
+        return None
+
+
+# --- [추가] 고정밀 발사 스케줄러 (monotonic 기준 sleep + 마지막 구간 busy-wait) ---
+FIRE_SPIN_SECONDS = 0.002  # 목표 시각 직전 이 구간은 sleep 대신 busy-wait (OS sleep 지터 제거)
+FIRE_FINAL_WINDOW = 0.050  # 목표 50ms 전부터 GIL 전환 간격을 줄임
+FIRE_SWITCH_INTERVAL = 0.0002  # 발사 직전 구간의 GIL 전환 간격 (기본 5ms)
+
+# [수정] GIL 전환 간격은 프로세스 전체 설정이므로, 여러 Worker(리허설 + 예약 등)가 겹쳐도
+# 마지막 사용자가 빠질 때 한 번만 원래 값으로 되돌리도록 참조 횟수로 관리합니다.
+_switch_interval_lock = threading.Lock()
+_switch_interval_users = 0
+_switch_interval_saved = None
+
+
+@contextmanager
+def fire_switch_interval():
+    """
+    [추가] 블록 동안 GIL 전환 간격을 FIRE_SWITCH_INTERVAL로 줄입니다.
+    주의: sys.setswitchinterval은 프로세스 전체(Streamlit 서버 스레드 포함)에 적용됩니다.
+    """
+    global _switch_interval_users, _switch_interval_saved
+    with _switch_interval_lock:
+        if _switch_interval_users == 0:
+            _switch_interval_saved = sys.getswitchinterval()
+            sys.setswitchinterval(FIRE_SWITCH_INTERVAL)
+        _switch_interval_users += 1
+    try:
+        yield
+    finally:
+        with _switch_interval_lock:
+            _switch_interval_users -= 1
+            if _switch_interval_users == 0:
+                sys.setswitchinterval(_switch_interval_saved)
+
+
+class FireTimingStats:
+    """실행 1회 동안 wait_until의 발사 오차(목표 대비 지연, ms)를 모아 히스토그램으로 보여줍니다."""
+    BUCKETS_MS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+    def __init__(self):
+        self.records = []  # (log_prefix, error_ms)
+
+    def record(self, log_prefix, error_ms):
+        self.records.append((log_prefix, error_ms))
+
+    def histogram_lines(self):
+        if not self.records:
+            return []
+        counts = [0] * (len(self.BUCKETS_MS) + 1)
+        for _, error_ms in self.records:
+            for i, bound in enumerate(self.BUCKETS_MS):
+                if error_ms < bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+
+        lines = []
+        lower = 0.0
+        for bound, count in zip(self.BUCKETS_MS + (None,), counts):
+            label = f"{lower:g}~{bound:g}ms" if bound is not None else f"{lower:g}ms 이상"
+            lines.append(f"   {label:<12} {'█' * count} {count}")
+            lower = bound if bound is not None else lower
+        for log_prefix, error_ms in self.records:
+            lines.append(f"   - {log_prefix}: {error_ms:.3f}ms")
+        return lines
+
+
+# ============================================================
+# [추가] 응답 압축: 설치된 디코더만 Accept-Encoding에 광고하고, 전송/풀린 크기와 풀기 시간을 기록
+# ============================================================
+def _decode_gzip(data):
+    return zlib.decompress(data, 16 + zlib.MAX_WBITS)
+
+
+def _decode_deflate(data):
+    try:
+        return zlib.decompress(data)
+    except zlib.error:
+        return zlib.decompress(data, -zlib.MAX_WBITS)  # zlib 헤더 없는 raw deflate
+
+
+BODY_DECODERS = {"identity": bytes, "gzip": _decode_gzip, "x-gzip": _decode_gzip, "deflate": _decode_deflate}
+if brotli is not None:
+    BODY_DECODERS["br"] = brotli.decompress
+if zstandard is not None:
+    BODY_DECODERS["zstd"] = lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+# urllib3가 풀 수 있다고 판단한 인코딩 중 이 앱도 풀 수 있는 것만 광고 (예: 'gzip,deflate' 또는 'gzip,deflate,br')
+ACCEPT_ENCODING = ",".join(
+    encoding for encoding in (e.strip() for e in urllib3.util.request.ACCEPT_ENCODING.split(","))
+    if encoding in BODY_DECODERS)
+
+
+def decode_body(data, content_encoding):
+    """Content-Encoding(여러 단계면 쉼표로 구분, 적용 역순으로 풂)에 따라 본문을 풉니다. 모르는 인코딩은 ValueError."""
+    for encoding in reversed([e.strip().lower() for e in content_encoding.split(",") if e.strip()]):
+        decoder = BODY_DECODERS.get(encoding)
+        if decoder is None:
+            raise ValueError(f"풀 수 없는 Content-Encoding: {encoding}")
+        data = decoder(data)
+    return data
+
+
+def decode_response_text(raw, headers, encoding):
+    """
+    전송된 그대로의 본문(raw)을 풀어 텍스트로 변환합니다.
+    반환값: (텍스트, {'encoding', 'bytes_wire', 'bytes_in', 'decode_ms'}) - span args에 그대로 기록
+    """
+    content_encoding = headers.get('content-encoding', '')
+    start = time.perf_counter()
+    body = decode_body(raw, content_encoding)
+    decode_ms = (time.perf_counter() - start) * 1000
+    return str(body, encoding or 'utf-8', errors='replace'), {
+        'encoding': content_encoding or 'identity', 'bytes_wire': len(raw), 'bytes_in': len(body),
+        'decode_ms': round(decode_ms, 3)}
+
+
+# ============================================================
+# [추가] 예약 파이프라인 구간별 지연 추적 (span → Chrome trace JSON)
+# ============================================================
+TRACE_DIR = "traces"
+TRACE_SUMMARY_MAX_LINES = 40
+
+
+class PipelineTracer:
+    """
+    로그인, 서버 시간 샘플, getList 페이지/시도, 파싱/필터링, Check/Submit 단계를 span으로 기록합니다.
+    각 span은 monotonic 시작/종료 시각, 실행 주체(스레드 또는 asyncio Task), 송수신 바이트 수를 가지며,
+    실행 1회를 Chrome trace 형식 JSON(chrome://tracing, Perfetto에서 열람 가능)으로 내보냅니다.
+    """
+
+    def __init__(self):
+        self.origin = time.monotonic()
+        self.spans = []  # {'name', 'start', 'end', 'lane', 'args'}
+        self.marks = {}  # 이름 -> monotonic 시각 (예: 'T-0')
 
-    now_kst = datetime.datetime.now(KST)
-    remaining_seconds = (target_dt_kst - now_kst).total_seconds()
+    @staticmethod
+    def _current_lane():
+        """span이 표시될 줄: asyncio Task 안이면 Task별, 아니면 스레드별."""
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        return id(task) if task is not None else threading.get_ident()
+
+    @contextmanager
+    def span(self, name, **args):
+        """with 블록 구간을 span으로 기록합니다. 블록 안에서 yield된 args dict에 값을 추가할 수 있습니다."""
+        start = time.monotonic()
+        try:
+            yield args
+        finally:
+            self.spans.append({'name': name, 'start': start, 'end': time.monotonic(),
+                               'lane': self._current_lane(), 'args': args})
+
+    def mark(self, name):
+        """순간 이벤트(예: 'T-0' 발사 시각)를 기록합니다."""
+        self.marks[name] = time.monotonic()
+
+    @staticmethod
+    def annotate_response(args, res, body_stats=None):
+        """
+        span args에 응답 상태 코드와 송수신 바이트 수를 기록합니다. (requests/httpx 응답 공용)
+        [추가] 전송 크기(bytes_wire, 압축 상태)와 Content-Encoding도 기록합니다. 본문을 직접 풀어 읽은 경우
+        (getList) decode_response_text의 body_stats를 넘기면 풀기 시간(decode_ms)까지 그대로 기록합니다.
+        """
+        args['status'] = res.status_code
+        if body_stats is not None:
+            args.update(body_stats)
+        else:
+            args['bytes_in'] = len(res.content)
+            wire = res.raw.tell() if hasattr(getattr(res, 'raw', None), 'tell') else getattr(
+                res, 'num_bytes_downloaded', None)  # urllib3 응답 / httpx.Response
+            if wire is not None:
+                args['bytes_wire'] = wire
+            args['encoding'] = res.headers.get('content-encoding', 'identity')
+        request_body = getattr(res.request, 'body', None)  # requests.PreparedRequest
+        if request_body is None:
+            request_body = getattr(res.request, 'content', b"")  # httpx.Request
+        args['bytes_out'] = len(request_body or b"")
+
+    def to_chrome_trace(self):
+        """Chrome trace 형식(dict)으로 변환합니다. 시각(ts/dur)은 추적 시작 기준 마이크로초입니다."""
+        lanes = {}
+        events = []
+        for span in sorted(list(self.spans), key=lambda s: s['start']):
+            tid = lanes.setdefault(span['lane'], len(lanes) + 1)
+            events.append({
+                'name': span['name'], 'cat': span['name'].split('.')[0], 'ph': 'X', 'pid': 1, 'tid': tid,
+                'ts': round((span['start'] - self.origin) * 1e6, 1),
+                'dur': round((span['end'] - span['start']) * 1e6, 1),
+                'args': span['args'],
+            })
+        for name, at in self.marks.items():
+            events.append({'name': name, 'ph': 'i', 's': 'g', 'pid': 1, 'tid': 0,
+                           'ts': round((at - self.origin) * 1e6, 1)})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export(self, directory=TRACE_DIR, run_id=None):
+        """추적 결과를 'directory/trace_<run_id>.json' 파일로 저장하고 경로를 반환합니다."""
+        run_id = run_id or datetime.datetime.now(KST).strftime('%Y%m%d_%H%M%S')
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"trace_{run_id}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False)
+        return path
+
+    def summary_lines(self, mark='T-0'):
+        """'mark' 이후에 끝난 span들을 mark 기준 상대 시각(ms)으로 정리합니다."""
+        at = self.marks.get(mark)
+        if at is None:
+            return []
+        spans = sorted((s for s in list(self.spans) if s['end'] >= at), key=lambda s: s['start'])
+        lines = []
+        for span in spans[:TRACE_SUMMARY_MAX_LINES]:
+            detail = ", ".join(f"{key}={value}" for key, value in span['args'].items())
+            lines.append(
+                f"   +{(span['start'] - at) * 1000:7.1f}ms ~ +{(span['end'] - at) * 1000:7.1f}ms "
+                f"({(span['end'] - span['start']) * 1000:6.1f}ms) {span['name']} {detail}")
+        if len(spans) > TRACE_SUMMARY_MAX_LINES:
+            lines.append(f"   ... 외 {len(spans) - TRACE_SUMMARY_MAX_LINES}개 (trace 파일 참고)")
+        return lines
+
+
+def wait_until(target_dt_kst, stop_event, message_queue, log_prefix="프로그램 실행", log_countdown=False,
+               timing_stats=None):
+    """
+    Waits precisely until the target KST datetime, with a countdown.
+    [수정] 목표 시각을 한 번만 monotonic 시계 기준 deadline으로 변환한 뒤, stop_event.wait로 굵게 대기하고
+    마지막 FIRE_SPIN_SECONDS 구간만 busy-wait 합니다. 발사 오차(ms)를 반환하고 timing_stats에 기록합니다.
+    마지막 FIRE_FINAL_WINDOW 동안은 프로세스 전체의 GIL 전환 간격이 줄어듭니다. (fire_switch_interval)
+    중단되었거나 이미 지난 목표이면 None을 반환합니다.
+    """
+    remaining_seconds = (target_dt_kst - datetime.datetime.now(KST)).total_seconds()
+    deadline = time.monotonic() + remaining_seconds
     log_remaining_start = 30
 
     log_message(f"⏳ {log_prefix} 대기중: {target_dt_kst.strftime('%H:%M:%S.%f')[:-3]} (KST 기준)", message_queue)
 
     if remaining_seconds <= 0.001:
         log_message(f"⚠️ 목표 시간이 이미 지났거나 도달했습니다. 즉시 실행.", message_queue)
-        return
+        return None
 
     if log_countdown and remaining_seconds > log_remaining_start:
-        time_to_sleep_long = remaining_seconds - log_remaining_start
         log_message(
             f"⏳ {log_prefix} 대기중: {target_dt_kst.strftime('%H:%M:%S')}까지 {remaining_seconds:.1f}초 남음. ({log_remaining_start}초 전부터 카운트다운 시작)",
             message_queue
         )
-        time.sleep(max(0, time_to_sleep_long))
-
-        if stop_event.is_set():
+        if stop_event.wait(max(0, deadline - log_remaining_start - time.monotonic())):
             log_message("🛑 대기 중 중단 신호 수신.", message_queue)
-            return
+            return None
 
     if log_countdown:
-        remaining_seconds = (target_dt_kst - datetime.datetime.now(KST)).total_seconds()
-        countdown_start = int(remaining_seconds)
+        countdown_start = int(deadline - time.monotonic())
 
         for seconds_left in range(countdown_start, 0, -1):
-            if stop_event.is_set():
+            log_message(f"⏳ 예약시도 대기중 : {seconds_left}초", message_queue)
+
+            # 다음 카운트다운 로그 시각까지 대기 (마지막 1초는 아래 정밀 대기에서 처리)
+            if seconds_left == 1:
+                break
+            if stop_event.wait(max(0, deadline - (seconds_left - 1) - time.monotonic())):
                 log_message("🛑 대기 중 중단 신호 수신.", message_queue)
-                return
+                return None
+
+    # 굵은 대기: 목표 FIRE_FINAL_WINDOW 전까지 (stop_event로 즉시 중단 가능)
+    coarse_wait = deadline - FIRE_FINAL_WINDOW - time.monotonic()
+    if coarse_wait > 0 and stop_event.wait(coarse_wait):
+        log_message("🛑 대기 중 중단 신호 수신.", message_queue)
+        return None
+
+    # 마지막 구간 동안 GIL 전환 간격을 줄여, 다른 스레드(UI 재실행 루프 등)가 GIL을 잡고 있어도 빨리 깨어나도록 함
+    # (프로세스 전체 설정 - fire_switch_interval 참고)
+    with fire_switch_interval():
+        fine_wait = deadline - FIRE_SPIN_SECONDS - time.monotonic()
+        if fine_wait > 0 and stop_event.wait(fine_wait):
+            log_message("🛑 대기 중 중단 신호 수신.", message_queue)
+            return None
 
-            log_message(f"⏳ 예약시도 대기중 : {seconds_left}초", message_queue)
+        # 정밀 대기: 마지막 구간 busy-wait
+        while time.monotonic() < deadline:
+            pass
 
-            next_log_time = target_dt_kst - datetime.timedelta(seconds=(seconds_left - 1))
-            sleep_duration = (next_log_time - datetime.datetime.now(KST)).total_seconds()
+        error_ms = (time.monotonic() - deadline) * 1000
 
-            if sleep_duration > 0:
-                time.sleep(sleep_duration)
-            else:
-                time.sleep(0.01)
+    if timing_stats is not None:
+        timing_stats.record(log_prefix, error_ms)
 
-            if seconds_left == 1:
-                break
+    actual_diff = (datetime.datetime.now(KST) - target_dt_kst).total_seconds()
+    log_message(
+        f"✅ 목표 시간 도달! {log_prefix} 스레드 즉시 실행. (종료 시각 차이: {actual_diff * 1000:.3f}ms, "
+        f"monotonic 발사 오차: {error_ms:.3f}ms)", message_queue)
+    return error_ms
+
+
+# ============================================================
+# [추가] 서버 시계 정밀 추정 (HTTP Date 헤더, 서브초 위상 탐지)
+# ============================================================
+class ClockEstimate:
+    """서버 시계 오프셋(서버 - 로컬, 초)과 신뢰 구간 [low, high]."""
+    __slots__ = ('offset', 'low', 'high', 'samples', 'min_rtt', 'resets')
+
+    def __init__(self, offset, low, high, samples, min_rtt, resets):
+        self.offset = offset
+        self.low = low
+        self.high = high
+        self.samples = samples
+        self.min_rtt = min_rtt
+        self.resets = resets
+
+    @property
+    def uncertainty(self):
+        """신뢰 구간의 반폭(초)."""
+        return (self.high - self.low) / 2
+
+
+class ServerClockEstimator:
+    """
+    Date 헤더(1초 해상도) 샘플을 여러 번 모아 서버 시계의 서브초 위상을 찾습니다.
+
+    샘플 (send, recv, D)은 서버가 요청을 처리한 순간 p ∈ [send, recv] 에 서버 시각이 [D, D+1) 이었다는 뜻이므로
+    오프셋 θ(서버 - 로컬)는 [D - recv, D + 1 - send] 안에 있습니다. 모든 샘플의 구간을 교집합하고,
+    다음 샘플은 서버의 초가 넘어가는(tick-over) 순간이 현재 구간의 중앙에 오도록 예약해 보내서
+    구간을 반씩 줄여 나갑니다 (이분 탐색). 최종 값은 구간 중앙 = RTT 절반 보정값입니다.
+    """
+
+    def __init__(self, max_rounds=10, target_width=0.002, send_margin=0.05):
+        self.max_rounds = max_rounds
+        self.target_width = target_width
+        self.send_margin = send_margin
+        self.low = float('-inf')
+        self.high = float('inf')
+        self.samples = 0
+        self.rounds = 0
+        self.min_rtt = float('inf')
+        self.resets = 0
+
+    def add_sample(self, send_wall, recv_wall, server_second):
+        """샘플 1개를 반영합니다. (send/recv: 로컬 epoch 초, server_second: Date 헤더의 epoch 초)"""
+        self.samples += 1
+        self.min_rtt = min(self.min_rtt, recv_wall - send_wall)
+        sample_low = server_second - recv_wall
+        sample_high = server_second + 1 - send_wall
+
+        low = max(self.low, sample_low)
+        high = min(self.high, sample_high)
+        if low > high:
+            # 지터/시계 점프로 교집합이 비면 최신 샘플 기준으로 다시 시작
+            self.resets += 1
+            low, high = sample_low, sample_high
+        self.low, self.high = low, high
+
+    def done(self):
+        if self.samples == 0:
+            return False
+        return self.rounds >= self.max_rounds or self.high - self.low <= max(self.target_width, self.min_rtt)
+
+    def next_send_time(self, now_wall):
+        """다음 샘플을 보낼 로컬 epoch 시각. 서버의 다음 정각 초가 현재 구간 중앙 오프셋에서 처리되도록 맞춥니다."""
+        self.rounds += 1
+        if self.samples == 0:
+            return now_wall
+        theta = (self.low + self.high) / 2
+        half_rtt = self.min_rtt / 2
+        boundary = math.floor(now_wall + theta + half_rtt + self.send_margin) + 1
+        return boundary - theta - half_rtt
+
+    def result(self):
+        if self.samples == 0:
+            return None
+        return ClockEstimate((self.low + self.high) / 2, self.low, self.high, self.samples, self.min_rtt,
+                             self.resets)
+
+
+# ============================================================
+# [추가] DNS 사전 조회 + 주소 고정 (골든 타임에 새 커넥션이 DNS 조회를 기다리지 않도록)
+# ============================================================
+DNS_DEFAULT_TTL = 60.0  # resolver가 TTL을 알려주지 않을 때(getaddrinfo) 캐시 유효 시간 (초)
+DNS_PROBE_TIMEOUT = 1.0  # 주소별 연결 시간 측정 제한 (초)
+DNS_PIN_WINDOW = 60.0  # T-0 이후 주소를 고정해 두는 시간 (초)
+
+
+def system_resolver(host, port):
+    """기본 resolver (socket.getaddrinfo): (주소 목록, TTL 초 또는 None)을 반환합니다."""
+    infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    return list(dict.fromkeys(info[4][0] for info in infos)), None
+
+
+def probe_connect(address, port, timeout):
+    """address:port로 TCP 연결에 걸린 시간(초)을 반환합니다. 연결 실패는 OSError."""
+    started = time.perf_counter()
+    with socket.create_connection((address, port), timeout=timeout):
+        return time.perf_counter() - started
+
+
+def is_ip_address(host):
+    try:
+        ipaddress.ip_address(host)
+        return True
+    except ValueError:
+        return False
+
+
+class DNSEntry:
+    """조회 결과 하나: 연결이 빠른 순서의 주소 목록, 만료 시각(clock 기준), 주소별 연결 시간(초, 실패는 inf)."""
+    __slots__ = ('addresses', 'ttl', 'expires_at', 'latencies', 'resolve_ms')
+
+    def __init__(self, addresses, ttl, expires_at, latencies, resolve_ms):
+        self.addresses = addresses
+        self.ttl = ttl
+        self.expires_at = expires_at
+        self.latencies = latencies
+        self.resolve_ms = resolve_ms
+
+
+class DNSPinner:
+    """
+    호스트 주소를 미리 조회하여 TTL 동안 캐시하고, pin(until) 이후 until까지는 TTL과 관계없이 고정합니다.
+    주소가 여러 개면 connect_probe로 주소별 연결 시간을 재서 빠른 순서로 정렬합니다.
+    resolver(host, port) -> (주소 목록, TTL 초 또는 None), connect_probe(address, port, timeout) -> 초,
+    clock() -> 초 를 주입할 수 있습니다. (기본: getaddrinfo / TCP 연결 / time.monotonic)
+    """
+
+    def __init__(self, resolver=system_resolver, connect_probe=probe_connect, default_ttl=DNS_DEFAULT_TTL,
+                 clock=time.monotonic):
+        self.resolver = resolver
+        self.connect_probe = connect_probe
+        self.default_ttl = default_ttl
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.entries = {}  # host -> DNSEntry
+        self.pinned_until = {}  # host -> clock 기준 고정 종료 시각
+
+    def resolve(self, host, port):
+        """host를 조회하고 (주소가 여러 개면 연결 시간 순으로 정렬하여) 캐시합니다. 조회 실패는 OSError."""
+        started = self.clock()
+        addresses, ttl = self.resolver(host, port)
+        if not addresses:
+            raise OSError(f"{host}: 주소 없음")
+        resolve_ms = (self.clock() - started) * 1000
+        latencies = {}
+        if len(addresses) > 1:
+            for address in addresses:
+                try:
+                    latencies[address] = self.connect_probe(address, port, DNS_PROBE_TIMEOUT)
+                except OSError:
+                    latencies[address] = math.inf
+            addresses = sorted(addresses, key=latencies.get)
+        ttl = self.default_ttl if ttl is None else ttl
+        entry = DNSEntry(addresses, ttl, self.clock() + ttl, latencies, resolve_ms)
+        with self.lock:
+            self.entries[host] = entry
+        return entry
+
+    def _usable(self, host):
+        """TTL 안이거나 고정 구간이면 캐시된 DNSEntry, 아니면 None."""
+        entry = self.entries.get(host)
+        if entry is None:
+            return None
+        now = self.clock()
+        if now < entry.expires_at or now < self.pinned_until.get(host, 0.0):
+            return entry
+        return None
+
+    def lookup(self, host, port):
+        """
+        사용할 수 있는 캐시가 있으면 그대로, 없으면 다시 조회합니다.
+        다시 조회하다 실패하면 이전 결과(만료됨)라도 반환하고, 이전 결과도 없으면 OSError를 그대로 올립니다.
+        """
+        entry = self._usable(host)
+        if entry is not None:
+            return entry
+        try:
+            return self.resolve(host, port)
+        except OSError:
+            stale = self.entries.get(host)
+            if stale is None:
+                raise
+            return stale
+
+    def pin(self, host, until):
+        """until(clock 기준)까지 캐시된 주소를 TTL과 관계없이 사용합니다."""
+        with self.lock:
+            self.pinned_until[host] = max(self.pinned_until.get(host, 0.0), until)
+
+    def addresses_for(self, host):
+        """새 커넥션이 연결할 주소 목록 (빠른 순서). 캐시가 만료되었고 고정 구간도 아니면 빈 튜플 (시스템 조회)."""
+        entry = self._usable(host)
+        return entry.addresses if entry is not None else ()
+
+
+def make_dns_pinner(inputs):
+    """[추가] inputs['dns_pinning'] (기본 True)이면 DNSPinner를 만듭니다. inputs['dns_resolver']로 resolver 주입."""
+    if not inputs.get('dns_pinning', True):
+        return None
+    return DNSPinner(resolver=inputs.get('dns_resolver') or system_resolver)
+
+
+# ============================================================
+# [추가] 커넥션 추적 (웜업 상태 및 재사용 여부 보고용)
+# ============================================================
+class _ConnectionStatsMixin:
+    """urllib3 커넥션의 연결 시각(monotonic)과 요청 횟수를 기록합니다."""
+    connected_at = None
+    request_count = 0
+    resolver = None  # [추가] DNSPinner (풀에서 지정, 없으면 시스템 DNS 조회)
+
+    def _new_conn(self):
+        """[추가] 고정된 주소가 있으면 빠른 순서로 연결하고, 모두 실패하면 기존처럼 호스트 이름으로 연결합니다."""
+        addresses = self.resolver.addresses_for(self.host) if self.resolver is not None else ()
+        for address in addresses:
+            try:
+                return urllib3.util.connection.create_connection(
+                    (address, self.port), self.timeout,
+                    source_address=self.source_address, socket_options=self.socket_options)
+            except OSError:
+                continue
+        return super()._new_conn()
+
+    def connect(self):
+        super().connect()
+        self.connected_at = time.monotonic()
+
+    def request(self, *args, **kwargs):
+        self.request_count += 1
+        return super().request(*args, **kwargs)
+
+
+class TrackedHTTPConnection(_ConnectionStatsMixin, urllib3.connection.HTTPConnection):
+    pass
+
+
+class TrackedHTTPSConnection(_ConnectionStatsMixin, urllib3.connection.HTTPSConnection):
+    pass
+
+
+class _TrackedPoolMixin:
+    """풀에서 생성한 커넥션 목록을 보관합니다."""
+    resolver = None  # [추가] 새 커넥션에 넘겨줄 DNSPinner (WarmPoolAdapter에서 지정)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.tracked_connections = []
+
+    def _new_conn(self):
+        conn = super()._new_conn()
+        conn.resolver = self.resolver
+        self.tracked_connections.append(conn)
+        return conn
+
+
+class TrackedHTTPConnectionPool(_TrackedPoolMixin, urllib3.HTTPConnectionPool):
+    ConnectionCls = TrackedHTTPConnection
+
+
+class TrackedHTTPSConnectionPool(_TrackedPoolMixin, urllib3.HTTPSConnectionPool):
+    ConnectionCls = TrackedHTTPSConnection
+
+
+class WarmPoolAdapter(HTTPAdapter):
+    """커넥션별 나이/사용 횟수를 추적하는 커넥션 풀을 사용하는 HTTPAdapter."""
+    http_version = "HTTP/1.1"  # [추가] Http2Adapter와 같은 속성 (전송 프로토콜 로그용)
+
+    def __init__(self, *args, resolver=None, **kwargs):
+        self.resolver = resolver  # [추가] DNSPinner (없으면 시스템 DNS 조회)
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TrackedHTTPConnectionPool,
+            "https": TrackedHTTPSConnectionPool,
+        }
+
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        pool = super().get_connection_with_tls_context(request, verify, proxies=proxies, cert=cert)
+        pool.resolver = self.resolver
+        return pool
+
+    def all_connections(self):
+        """이 어댑터의 모든 풀에서 생성된 커넥션 목록 (닫힌 커넥션 제외)."""
+        pools = self.poolmanager.pools
+        connections = []
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            pool.tracked_connections = [conn for conn in pool.tracked_connections if conn.sock is not None]
+            connections.extend(pool.tracked_connections)
+        return connections
+
+    def live_connections(self):
+        """소켓이 열려 있고 연결 시각이 기록된 커넥션 목록."""
+        return [conn for conn in self.all_connections() if conn.connected_at is not None]
+
+
+# ============================================================
+# [추가] HTTP/2 전송 (getList 페이지, 확인 요청, 세션 유지를 하나의 웜 커넥션에서 멀티플렉싱)
+# ============================================================
+# HTTP/2에서 금지된 연결별(hop-by-hop) 헤더 - h2가 보내기 전에 거부하므로 제거
+HTTP2_HOP_BY_HOP_HEADERS = frozenset(('connection', 'keep-alive', 'proxy-connection', 'transfer-encoding', 'upgrade'))
+
+
+class _BufferedBody:
+    """
+    끝까지 읽은 응답 본문(전송된 그대로)을 urllib3 HTTPResponse처럼 제공합니다.
+    requests.Response.content(stream), _fetch_list_page(read(decode_content=False)),
+    PipelineTracer(tell), 쿠키 추출(_original_response.msg)이 사용하는 부분만 구현합니다.
+    """
+
+    def __init__(self, data, headers):
+        self.data = data
+        self.content_encoding = headers.get('content-encoding', '')
+        self.consumed = False
+        msg = http.client.HTTPMessage()
+        for name, value in headers.multi_items():
+            msg[name] = value
+        self._original_response = SimpleNamespace(msg=msg)
+
+    def read(self, amt=None, decode_content=True):
+        """amt와 관계없이 남은 본문 전체를 반환합니다. (이미 끝까지 읽은 본문이므로)"""
+        if self.consumed:
+            return b""
+        self.consumed = True
+        if not decode_content or not self.data:  # HEAD 응답 등 빈 본문은 Content-Encoding과 관계없이 그대로
+            return self.data
+        try:
+            return decode_body(self.data, self.content_encoding)
+        except (ValueError, zlib.error) as e:
+            raise requests.exceptions.ContentDecodingError(e)
+
+    def stream(self, chunk_size=None, decode_content=True):
+        data = self.read(decode_content=decode_content)
+        if data:
+            yield data
+
+    def tell(self):
+        return len(self.data)
+
+    def release_conn(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class Http2ConnectionRecord:
+    """httpx(httpcore) 커넥션 하나의 연결 시각과 요청 횟수. (TrackedHTTPConnection과 같은 속성 이름)"""
+    __slots__ = ('stream', 'connected_at', 'request_count')
+
+    def __init__(self, stream, connected_at):
+        self.stream = stream
+        self.connected_at = connected_at
+        self.request_count = 0
+
+    @property
+    def sock(self):
+        sock = self.stream.get_extra_info("socket")
+        return sock if sock is not None and sock.fileno() != -1 else None
+
+
+class Http2Adapter(BaseAdapter):
+    """
+    requests.Session에 mount 하는 HTTP/2 어댑터입니다. httpx.Client(http2=True)로 요청을 보내므로
+    동시에 보낸 요청(getList 페이지, 투기적 확인, 세션 유지, 웜업 핑)이 하나의 커넥션 위 스트림으로 겹쳐집니다.
+    서버가 ALPN으로 HTTP/2를 협상하지 않으면 첫 응답에서 on_fallback(http_version)을 한 번 호출합니다.
+    WarmPoolAdapter와 같은 all_connections/live_connections를 제공하여 웜업과 커넥션 보고를 그대로 사용합니다.
+    """
+
+    def __init__(self, pool_size, on_fallback=None):
+        super().__init__()
+        self.client = httpx.Client(
+            http2=True,
+            verify=False,
+            trust_env=False,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+        )
+        self.on_fallback = on_fallback
+        self.http_version = None  # 첫 응답에서 협상된 프로토콜 ("HTTP/2" 또는 "HTTP/1.1")
+        self.connections = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _timeout(timeout):
+        """requests의 timeout(초 또는 (연결, 읽기) 튜플)을 httpx 요청 extensions 형식으로 바꿉니다."""
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect).as_dict()
+        return httpx.Timeout(timeout).as_dict()
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        headers = [(name, value) for name, value in request.headers.items()
+                   if name.lower() not in HTTP2_HOP_BY_HOP_HEADERS]
+        body = request.body.encode('utf-8') if isinstance(request.body, str) else request.body
+        # 쿠키는 requests 세션이 관리하므로 client.build_request(클라이언트 쿠키 병합) 대신 요청을 직접 만듦
+        h2_request = httpx.Request(request.method, request.url, headers=headers, content=body,
+                                   extensions={"timeout": self._timeout(timeout)})
+        started = time.monotonic()
+        try:
+            res = self.client.send(h2_request, stream=True)
+            try:
+                data = b"".join(res.iter_raw())
+            finally:
+                res.close()
+        except httpx.ConnectTimeout as e:
+            raise requests.exceptions.ConnectTimeout(e, request=request)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.ReadTimeout(e, request=request)
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e, request=request)
+
+        self._track(res, started)
+        return self.build_response(request, res, data)
+
+    def _track(self, res, started):
+        network_stream = res.extensions.get("network_stream")
+        with self.lock:
+            if network_stream is not None:
+                record = self.connections.get(id(network_stream))
+                if record is None or record.stream is not network_stream:
+                    record = self.connections[id(network_stream)] = Http2ConnectionRecord(network_stream, started)
+                record.request_count += 1
+            fallback = self.http_version is None and res.http_version != "HTTP/2"
+            if self.http_version is None:
+                self.http_version = res.http_version
+        if fallback and self.on_fallback is not None:
+            self.on_fallback(res.http_version)
+
+    def build_response(self, request, res, data):
+        response = requests.Response()
+        response.status_code = res.status_code
+        response.headers = requests.structures.CaseInsensitiveDict(res.headers.items())
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.raw = _BufferedBody(data, res.headers)
+        response.reason = res.reason_phrase
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        requests.cookies.extract_cookies_to_jar(response.cookies, request, response.raw)
+        return response
+
+    def all_connections(self):
+        """열려 있는 커넥션 기록 목록 (닫힌 커넥션 제외). HTTP/2로 협상되면 보통 1개입니다."""
+        with self.lock:
+            for key in [key for key, record in self.connections.items() if record.sock is None]:
+                del self.connections[key]
+            return list(self.connections.values())
+
+    def live_connections(self):
+        return self.all_connections()
+
+    def close(self):
+        self.client.close()
+
+
+# ============================================================
+# [추가] 예약 실패 분류 + 결과 유형별 재시도 정책
+# ============================================================
+OUTCOME_SUCCESS = 'success'
+OUTCOME_TAKEN = 'taken'  # 이미 예약됨/마감 → 다음 시간대로
+OUTCOME_SESSION_EXPIRED = 'session_expired'  # 로그인 풀림 → 재로그인 후 재시도
+OUTCOME_TRANSIENT = 'transient'  # 네트워크 일시 오류/5xx → 수 ms 단위 지터 백오프 후 재시도
+OUTCOME_THROTTLED = 'throttled'  # 429/503/요청 과다 → 더 긴 지터 백오프 후 재시도
+OUTCOME_UNKNOWN = 'unknown'  # 분류 불가 → 짧게 1회 재시도 후 다음 시간대로
+
+# 서버 메시지 → 결과 유형 (위에서부터 먼저 일치하는 유형)
+# [수정] TAKEN을 먼저 확인하고 세션 만료는 구체적인 문구로 한정 (예: "다른 세션에서 예약 진행중"은 다음 시간대로)
+_OUTCOME_MESSAGE_PATTERNS = (
+    (OUTCOME_TAKEN, re.compile(r"이미 예약|마감|예약(?:할 수 없| ?불가| ?진행 ?중)|다른 (?:고객|회원)|선점|없는 티타임")),
+    (OUTCOME_SESSION_EXPIRED, re.compile(
+        r"로그인(?:이|을)? ?(?:필요|해 ?주|후)|로그인 정보|세션(?:이)? ?(?:만료|종료|끊|유효하지)|session (?:expired|timeout)"
+        r"|인증(?:이)? ?(?:필요|만료)", re.IGNORECASE)),
+    (OUTCOME_THROTTLED, re.compile(r"잠시 후|요청이 많|접속자가 많|과도한|too many", re.IGNORECASE)),
+)
+
+
+def classify_server_message(message):
+    """서버가 준 실패 메시지를 결과 유형으로 분류합니다."""
+    for outcome, pattern in _OUTCOME_MESSAGE_PATTERNS:
+        if message and pattern.search(message):
+            return outcome
+    return OUTCOME_UNKNOWN
+
+
+def classify_http_status(status_code):
+    """HTTP 오류 상태 코드를 결과 유형으로 분류합니다."""
+    if status_code in (401, 403):
+        return OUTCOME_SESSION_EXPIRED
+    if status_code in (429, 503):
+        return OUTCOME_THROTTLED
+    if status_code >= 500:
+        return OUTCOME_TRANSIENT
+    return OUTCOME_UNKNOWN
+
+
+class ReservationResult:
+    """1단계(check)/2단계(submit) 요청 결과. outcome은 OUTCOME_* 중 하나입니다."""
+    __slots__ = ('outcome', 'message')
 
-    if not stop_event.is_set():
-        final_wait = (target_dt_kst - datetime.datetime.now(KST)).total_seconds()
+    def __init__(self, outcome, message=None):
+        self.outcome = outcome
+        self.message = message
 
-        if final_wait > 0:
-            time.sleep(final_wait)
+    @property
+    def success(self):
+        return self.outcome == OUTCOME_SUCCESS
 
-        actual_diff = (datetime.datetime.now(KST) - target_dt_kst).total_seconds()
-        log_message(f"✅ 목표 시간 도달! {log_prefix} 스레드 즉시 실행. (종료 시각 차이: {actual_diff * 1000:.3f}ms)", message_queue)
+    def __repr__(self):
+        return f"ReservationResult({self.outcome!r}, {self.message!r})"
+
+
+RETRY_NEXT_SLOT = 'next_slot'
+RETRY_RELOGIN = 'relogin'
+RETRY_BACKOFF = 'backoff'
+
+
+class RetryPolicy:
+    """
+    결과 유형별 재시도 방식.
+    action: RETRY_NEXT_SLOT(즉시 다음 시간대), RETRY_RELOGIN(재로그인 후 즉시 재시도), RETRY_BACKOFF(지터 백오프 후 재시도)
+    max_attempts: 한 시간대에서 이 유형으로 시도할 수 있는 최대 횟수
+    delay(attempt): full jitter 지수 백오프 - uniform(0, min(max_delay, base_delay * 2^(attempt-1)))
+    """
+    __slots__ = ('action', 'max_attempts', 'base_delay', 'max_delay')
+
+    def __init__(self, action, max_attempts=1, base_delay=0.0, max_delay=0.0):
+        self.action = action
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt):
+        if self.base_delay <= 0:
+            return 0.0
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+
+RETRY_POLICIES = {
+    OUTCOME_TAKEN: RetryPolicy(RETRY_NEXT_SLOT),
+    OUTCOME_SESSION_EXPIRED: RetryPolicy(RETRY_RELOGIN, max_attempts=2),
+    OUTCOME_TRANSIENT: RetryPolicy(RETRY_BACKOFF, max_attempts=4, base_delay=0.02, max_delay=0.2),
+    OUTCOME_THROTTLED: RetryPolicy(RETRY_BACKOFF, max_attempts=3, base_delay=0.3, max_delay=1.5),
+    OUTCOME_UNKNOWN: RetryPolicy(RETRY_BACKOFF, max_attempts=2, base_delay=0.05, max_delay=0.1),
+}
+
+
+# ============================================================
+# [추가] 사전 준비된 요청 틀 (골든 타임 전 getList / Check / Submit 준비)
+# ============================================================
+class RequestTemplate:
+    """
+    골든 타임 전에 헤더, 쿠키, URL, 본문을 모두 인코딩해 둔 PreparedRequest 틀입니다.
+    발사 시점에는 바뀌는 필드(pageNo, timeTableId, event*Time 등)만 교체하여 URL 또는 본문을 다시 만듭니다.
+    cookie_version은 틀을 만들 때의 쿠키 저장소 버전으로, 쿠키가 바뀌면 틀을 다시 준비합니다.
+    """
+    __slots__ = ('prepared', 'url', 'params', 'data', 'cookie_version')
+
+    def __init__(self, prepared, url, params=None, data=None, cookie_version=0):
+        self.prepared = prepared
+        self.url = url
+        self.params = params
+        self.data = data
+        self.cookie_version = cookie_version
+
+    @staticmethod
+    def _encode(fields, overrides):
+        merged = dict(fields)
+        merged.update(overrides)
+        # requests와 동일하게 None 값은 제외
+        return urlencode([(key, value) for key, value in merged.items() if value is not None])
+
+    def build(self, params=None, data=None):
+        """교체할 필드만 반영한 PreparedRequest 사본을 반환합니다."""
+        request = self.prepared.copy()
+        if params:
+            request.url = f"{self.url}?{self._encode(self.params, params)}"
+        if data:
+            body = self._encode(self.data, data)
+            request.body = body
+            request.headers['Content-Length'] = str(len(body))
+        return request
+
+
+# ============================================================
+# [추가] 스레드 간 공유 쿠키 저장소 (예약 / 세션 유지 / 웜업 스레드)
+# ============================================================
+class LockedCookieJar(requests.cookies.RequestsCookieJar):
+    """
+    여러 스레드와 세션(예약용, 세션 유지용)이 함께 쓰는 쿠키 저장소.
+    순회는 CookieJar 내부 잠금(_cookies_lock) 안에서 만든 사본으로 하고, 변경될 때마다 version을 올립니다.
+    version은 쿠키가 저장소에 반영된 뒤에 올라가고 요청 틀은 쿠키를 복사하기 전에 version을 읽으므로,
+    준비 중에 쿠키가 바뀌어도 틀은 옛 version으로 남아 다음 사용 때 다시 준비됩니다. (옛 쿠키로 굳지 않음)
+    """
+    version = 0
+
+    def set_cookie(self, cookie, *args, **kwargs):
+        with self._cookies_lock:
+            super().set_cookie(cookie, *args, **kwargs)
+            self.version += 1
+
+    def clear(self, domain=None, path=None, name=None):
+        with self._cookies_lock:
+            super().clear(domain, path, name)
+            self.version += 1
+
+    def __iter__(self):
+        with self._cookies_lock:
+            return iter(list(super().__iter__()))
+
+    def copy(self):
+        new_jar = LockedCookieJar()
+        new_jar.set_policy(self.get_policy())
+        new_jar.update(self)
+        return new_jar
+
+
+# ============================================================
+# [추가] 로그인 세션 캐시 (계정별 암호화 파일, 재실행 시 로그인 생략)
+# ============================================================
+SESSION_CACHE_DIR = ".session_cache"
+SESSION_CACHE_MAX_AGE = 12 * 3600  # 이보다 오래된 세션은 확인 요청 없이 버림 (초)
+SESSION_CACHE_KDF_ITERATIONS = 200_000
+
+
+class SessionCache:
+    """
+    로그인 후의 쿠키와 member_id를 계정별 파일에 암호화하여 저장합니다.
+    파일 이름은 (API 도메인, 아이디)의 해시이고, 암호화 키는 비밀번호와 파일별 salt로 PBKDF2 유도합니다.
+    cryptography 패키지가 없으면 평문 저장 대신 캐시를 사용하지 않습니다 (enabled=False).
+    """
+
+    def __init__(self, directory=SESSION_CACHE_DIR, max_age=SESSION_CACHE_MAX_AGE):
+        self.directory = directory
+        self.max_age = max_age
+        self.enabled = Fernet is not None
+
+    def _path(self, api_domain, usrid):
+        account_key = hashlib.sha256(f"{api_domain}|{usrid}".encode('utf-8')).hexdigest()[:32]
+        return os.path.join(self.directory, f"{account_key}.session")
+
+    @staticmethod
+    def _fernet(usrpass, salt):
+        key = hashlib.pbkdf2_hmac('sha256', usrpass.encode('utf-8'), salt, SESSION_CACHE_KDF_ITERATIONS)
+        return Fernet(base64.urlsafe_b64encode(key))
+
+    def load(self, api_domain, usrid, usrpass):
+        """저장된 세션 상태(dict)를 반환합니다. 없거나, 오래되었거나, 복호화에 실패하면 None."""
+        if not self.enabled:
+            return None
+        try:
+            with open(self._path(api_domain, usrid), 'r', encoding='utf-8') as f:
+                envelope = json.load(f)
+            salt = base64.b64decode(envelope['salt'])
+            state = json.loads(self._fernet(usrpass, salt).decrypt(envelope['token'].encode('ascii')))
+        except (OSError, ValueError, KeyError, TypeError, InvalidToken):
+            return None
+        if time.time() - state.get('saved_at', 0) > self.max_age:
+            return None
+        return state
+
+    def save(self, api_domain, usrid, usrpass, state):
+        """세션 상태를 암호화하여 저장합니다. 저장 여부를 반환합니다."""
+        if not self.enabled:
+            return False
+        state = dict(state, saved_at=time.time())
+        salt = os.urandom(16)
+        envelope = {
+            'salt': base64.b64encode(salt).decode('ascii'),
+            'token': self._fernet(usrpass, salt).encrypt(json.dumps(state).encode('utf-8')).decode('ascii'),
+        }
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._path(api_domain, usrid)
+            with open(f"{path}.tmp", 'w', encoding='utf-8') as f:
+                json.dump(envelope, f)
+            os.replace(f"{path}.tmp", path)
+            return True
+        except OSError:
+            return False
+
+    def clear(self, api_domain, usrid):
+        try:
+            os.remove(self._path(api_domain, usrid))
+        except OSError:
+            pass
+
+
+def export_cookie_jar(jar):
+    """[추가] http.cookiejar 호환 쿠키 저장소(requests/httpx 공용)를 저장 가능한 목록으로 변환합니다."""
+    return [{'name': c.name, 'value': c.value, 'domain': c.domain, 'path': c.path,
+             'secure': c.secure, 'expires': c.expires} for c in jar]
+
+
+def restore_cookie_jar(jar, cookies):
+    """[추가] export_cookie_jar 결과를 쿠키 저장소에 다시 넣습니다."""
+    for cookie in cookies:
+        jar.set_cookie(requests.cookies.create_cookie(**cookie))
+
+
+# ============================================================
+# [추가] 골프장별 'getList' 페이지 수 기록 (동시/스트리밍 조회 시 있을 법한 페이지만 요청)
+# ============================================================
+PAGE_COUNT_FILE = ".page_counts.json"
+PAGE_COUNT_HISTORY = 10  # 골프장별로 보관하는 최근 조회 결과 수
+
+
+class PageCountStore:
+    """
+    골프장(golfclub_seq)별로 최근 조회에서 확인된 'getList' 페이지 수를 JSON 파일에 기록합니다.
+    예상 페이지 수는 최근 기록의 최댓값입니다. (오픈 직후처럼 목록이 가장 긴 경우를 기준으로)
+    """
+
+    def __init__(self, path=PAGE_COUNT_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        try:
+            with open(path, encoding='utf-8') as f:
+                self.clubs = json.load(f)
+        except (OSError, ValueError):
+            self.clubs = {}
+
+    def expected_pages(self, golfclub_seq, default):
+        """기록이 없으면 default, 있으면 최근 최댓값 (1 ~ default)."""
+        history = self.clubs.get(str(golfclub_seq))
+        if not history:
+            return default
+        return max(1, min(default, max(history)))
+
+    def record(self, golfclub_seq, pages):
+        with self.lock:
+            history = self.clubs.setdefault(str(golfclub_seq), [])
+            history.append(pages)
+            del history[:-PAGE_COUNT_HISTORY]
+            try:
+                with open(f"{self.path}.tmp", 'w', encoding='utf-8') as f:
+                    json.dump(self.clubs, f)
+                os.replace(f"{self.path}.tmp", self.path)
+            except OSError:
+                pass
+
+
+def make_page_count_store(inputs):
+    """[추가] inputs['page_count_file'] (기본 PAGE_COUNT_FILE, 빈 문자열이면 사용 안함)로 PageCountStore를 만듭니다."""
+    path = inputs.get('page_count_file', PAGE_COUNT_FILE)
+    return PageCountStore(path) if path else None
+
+
+# ============================================================
+# [추가] 발사 준비 상태 (고정 대기 대신 확인 요청으로 단계 전환)
+# ============================================================
+READY_LOGGED_IN = 'logged_in'
+READY_RESERVE_PAGE = 'reserve_page'
+READY_CLOCK_SYNCED = 'clock_synced'
+READY_CONNECTIONS_WARM = 'connections_warm'
+READINESS_LABELS = {
+    READY_LOGGED_IN: "로그인",
+    READY_RESERVE_PAGE: "예약 페이지 진입",
+    READY_CLOCK_SYNCED: "서버 시계 동기화",
+    READY_CONNECTIONS_WARM: "커넥션 웜업",
+}
+SESSION_READY_TIMEOUT = 2.0  # 로그인 직후 세션 확인 최대 대기 (기존 고정 대기 시간)
+SESSION_READY_POLICY = RetryPolicy(RETRY_BACKOFF, max_attempts=8, base_delay=0.05, max_delay=0.4)
+# [추가] 세션 확인용 예약 메인 페이지가 로그인 페이지로 바뀌었는지 판별하는 표시 (로그인 폼)
+LOGIN_PAGE_MARKERS = ('/login/userLogin', 'name="userPw"')
+CLOCK_RETRY_POLICY = RetryPolicy(RETRY_BACKOFF, max_attempts=5, base_delay=0.05, max_delay=0.5)
+
+
+class ReadinessTracker:
+    """
+    발사 준비 상태 머신: 로그인 / 예약 페이지 진입 / 서버 시계 동기화 / 커넥션 웜업.
+    각 상태는 확인 요청(probe)이 성공한 시점에 reach()로 기록되며, 네 상태가 모두 확인된 시각이
+    실제로 발사가 가능해진 가장 이른 시각(ready_wall)입니다.
+    """
+
+    def __init__(self, tracer=None):
+        self.tracer = tracer
+        self.origin = time.monotonic()
+        self.reached = {}  # state -> (경과 초, 벽시계 epoch, 확인 내용)
+
+    def reach(self, state, detail=""):
+        if state in self.reached:
+            return
+        self.reached[state] = (time.monotonic() - self.origin, time.time(), detail)
+        if self.tracer is not None:
+            self.tracer.mark(f"ready:{state}")
+
+    def is_ready(self):
+        return all(state in self.reached for state in READINESS_LABELS)
+
+    @property
+    def ready_elapsed(self):
+        return max(elapsed for elapsed, _, _ in self.reached.values()) if self.is_ready() else None
+
+    @property
+    def ready_wall(self):
+        return max(wall for _, wall, _ in self.reached.values()) if self.is_ready() else None
+
+    def summary_lines(self, target_epoch=None):
+        lines = []
+        for state, label in READINESS_LABELS.items():
+            if state not in self.reached:
+                lines.append(f"   ⬜ {label}: 미확인")
+                continue
+            elapsed, _, detail = self.reached[state]
+            lines.append(f"   ✅ {label}: 시작 후 {elapsed:.3f}초" + (f" ({detail})" if detail else ""))
+        if self.is_ready():
+            slack = f", T-0 {target_epoch - self.ready_wall:.1f}초 전" if target_epoch is not None else ""
+            lines.append(f"🟢 발사 준비 완료: 시작 후 {self.ready_elapsed:.3f}초{slack}")
+        return lines
 
 
 # ============================================================
@@ -181,7 +1757,7 @@ def wait_until(target_dt_kst, stop_event, message_queue, log_prefix="프로그
 # ============================================================
 class APIBookingCore:
     # [수정] __init__에 golfclub_seq 파라미터 추가
-    def __init__(self, log_func, message_queue, stop_event, golfclub_seq):
+    def __init__(self, log_func, message_queue, stop_event, golfclub_seq, api_domain=None):
         self.log_message_func = log_func
         self.message_queue = message_queue
         self.stop_event = stop_event
@@ -194,13 +1770,38 @@ class APIBookingCore:
         self.GOLFCLUB_SEQ = golfclub_seq
 
         # 핵심 URL 정의 (골프존 카운티 기준)
-        self.API_DOMAIN = "https://www.golfzoncounty.com"
+        # [추가] api_domain: 로컬 대체 서버(mock_server.py) 등으로 요청 대상을 바꿀 때 사용
+        self.API_DOMAIN = api_domain or "https://www.golfzoncounty.com"
+        self.API_HOST = urlparse(self.API_DOMAIN).netloc
         self.LOGIN_URL = f"{self.API_DOMAIN}/login/userLogin"  #
         self.TIME_LIST_URL = f"{self.API_DOMAIN}/reserve/golfclub/teetime/getList"  #
         self.BOOK_CHECK_URL = f"{self.API_DOMAIN}/reserve/checkReserveTeetimeAble"  #
         # 최종 예약 URL (예상되는 일반적인 골프존 카운티 예약 최종 URL 사용)
         self.BOOK_SUBMIT_URL = f"{self.API_DOMAIN}/reserve/postReserveConfirmSubmit"
 
+        # [추가] 'getList' 조회 페이지 수 및 동시 조회 설정
+        self.MAX_LIST_PAGES = 4
+        self.page_counts = None  # [추가] 골프장별 페이지 수 기록 (PageCountStore, 없으면 항상 MAX_LIST_PAGES)
+        self.list_filter = None  # [추가] 'getList' 검색 조건 (ListFilter, 없으면 전체 조회)
+        self.accept_encoding = ACCEPT_ENCODING  # [추가] 광고할 응답 압축 방식
+        self.page_executor = None
+        self.last_fetch_stats = None
+        self.last_clock_estimate = None  # [추가] 마지막 서버 시계 추정 결과 (ClockEstimate)
+        self.warm_connection_count = self.MAX_LIST_PAGES  # [추가] 골든 타임 직전 웜업 커넥션 수
+        self.transport = TRANSPORT_HTTP1  # [추가] 전송 프로토콜 (TRANSPORT_OPTIONS, 로그인 전 설정)
+        self.dns = None  # [추가] API 도메인 주소 사전 조회/고정 (DNSPinner, 없으면 시스템 DNS 조회)
+        self.tracer = PipelineTracer()  # [추가] 구간별 지연 추적 (start_pre_process에서 실행별로 교체)
+        self.hot_log = None  # [추가] 핫 패스 로거 (HotPathLogger, start_pre_process에서 연결)
+        self.session_cache = None  # [추가] 로그인 세션 캐시 (SessionCache, 사용 안함이면 None)
+        # [추가] 쿠키 헤더 캐시 및 사전 준비된 요청 틀 (쿠키 저장소가 바뀔 때만 다시 만듦)
+        self.session_generation = 0  # [수정] 세션을 새로 만들 때마다 증가 (cookie_version 참고)
+        self.keepalive_session = None  # [추가] 세션 유지 전용 세션 (쿠키 저장소 공유, 커넥션 풀 분리)
+        self.request_templates = {}
+        self.template_date = None
+        self._template_lock = threading.Lock()  # [추가] 요청 틀 교체는 이 잠금 안에서만 (페이지 스레드와 동시 접근)
+        self._mount_connection_pool()
+        self._watch_cookie_changes()
+
         # 코스 맵핑 (골프존 감포는 IN/OUT 18홀로 추정되지만, 코드에서는 IN/OUT 코스 코드가 A/B/C 등이 될 수 있어, 파싱 데이터 사용)
         self.course_detail_mapping = {
             "A": "OUT",
@@ -208,77 +1809,144 @@ class APIBookingCore:
             "C": "EAST",  # 다른 카운티 고려, 감포는 IN/OUT 위주
         }
 
-    def log_message(self, msg):
-        """Logs a message via the provided log function."""
-        self.log_message_func(msg, self.message_queue)
+    def log_message(self, msg, level=LOG_INFO):
+        """
+        Logs a message via the provided log function.
+        [수정] 핫 패스 로거(hot_log)가 연결되어 있으면 큐 대신 링 버퍼에 기록합니다. (UI_ERROR는 항상 큐로 전달)
+        """
+        if self.hot_log is not None and not msg.startswith("UI_ERROR:"):
+            self.hot_log.text(msg, level)
+        else:
+            self.log_message_func(msg, self.message_queue)
+
+    def log_event(self, code, *args):
+        """[추가] 이벤트 코드와 인자만 기록합니다. 포맷팅은 로그를 drain 하는 쪽에서 수행합니다."""
+        if self.hot_log is not None:
+            self.hot_log.log(code, *args)
+        else:
+            self.log_message_func(LOG_EVENTS[code][1].format(*args), self.message_queue)
 
     # ----------------------------------------------------
     # 기본 헤더 (골프존 카운티 기준)
     # ----------------------------------------------------
     def get_base_headers(self, referer_url=None):
         """
-        기본 헤더를 반환하고, 세션에 저장된 모든 쿠키를 'Cookie' 헤더로 포함합니다.
+        기본 헤더를 반환합니다.
+        [수정] 'Cookie' 헤더는 직접 만들지 않습니다. 요청을 준비할 때 세션 쿠키 저장소가 유일한 출처로 붙입니다.
+        (직접 만든 헤더가 있으면 저장소 쿠키가 무시되어, 재로그인 뒤 두 값이 어긋날 수 있었음)
         """
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
             "Accept": "*/*",
-            "Accept-Encoding": "gzip, deflate, br, zstd",
+            "Accept-Encoding": self.accept_encoding,  # [수정] 설치된 디코더 기준 (기본 ACCEPT_ENCODING)
             "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
             "Connection": "keep-alive",
-            "Host": "www.golfzoncounty.com",
+            "Host": self.API_HOST,
             "X-Requested-With": "XMLHttpRequest",
             # [최종 추가] POST 요청의 타입을 명시적으로 지정
             "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
         }
 
-        # 세션에 저장된 쿠키를 문자열로 직렬화하여 'Cookie' 헤더에 추가
-        if self.session and self.session.cookies:
-            cookie_str = "; ".join([f"{name}={value}" for name, value in self.session.cookies.items()])
-            if cookie_str:
-                headers['Cookie'] = cookie_str
-
         return headers
 
-    # 골프존 카운티 로그인 로직 (POST URL 직접 지정)
-    def requests_login(self, usrid, usrpass):
-        """
+    # ----------------------------------------------------
+    # [추가] 쿠키 단일 관리 (세션 쿠키 저장소가 'Cookie' 헤더의 유일한 출처)
+    # ----------------------------------------------------
+    def _watch_cookie_changes(self):
+        """
+        [수정] 세션에 스레드 간 공유 쿠키 저장소(LockedCookieJar)를 연결합니다.
+        세션이 새로 만들어진 경우(재로그인)에는 세대를 올려 요청 틀을 무효화합니다.
+        (기존 응답 훅은 쿠키가 저장소에 반영되기 전에 버전을 올려, 다른 스레드가 그 사이 옛 쿠키로 헤더를 캐시할 수 있었음)
+        """
+        self.session.cookies = LockedCookieJar()
+        self.session_generation += 1
+
+    @property
+    def cookie_version(self):
+        """(세션 세대, 쿠키 저장소 version) - 새 세션이거나 쿠키가 실제로 바뀐 뒤에만 달라집니다."""
+        return self.session_generation, self.session.cookies.version
+
+    # ----------------------------------------------------
+    # [추가] 사전 준비된 요청 틀 (getList / Check / Submit)
+    # ----------------------------------------------------
+    def prepare_request_templates(self, date):
+        """
+        골든 타임 전에 getList, Check, Submit 요청 틀을 미리 준비합니다.
+        발사 시점에는 pageNo, timeTableId, event*Time 값만 교체합니다.
+        """
+        with self._template_lock:
+            self._prepare_request_templates(date)
+
+    def _prepare_request_templates(self, date):
+        """[추가] _template_lock 안에서 호출. 새 dict를 만들어 한 번에 교체합니다. (읽는 스레드는 잠금 없이 이전/새 dict 중 하나를 봄)"""
+        check_url, check_headers, check_params = self._build_check_request("")
+        submit_url, submit_headers, submit_payload = self._build_submit_request(date, "")
+        self.request_templates = {
+            'getList': self._prepare_template('POST', self.TIME_LIST_URL, self._get_list_headers(),
+                                              data=self._build_list_payload(date, 1)),
+            'check': self._prepare_template('GET', check_url, check_headers, params=check_params),
+            'submit': self._prepare_template('POST', submit_url, submit_headers, data=submit_payload),
+        }
+        self.template_date = date
+
+    def invalidate_request_template(self, name):
+        """[추가] 'name' 틀만 버립니다. 다음 _get_template 호출 때 다시 준비됩니다."""
+        with self._template_lock:
+            templates = dict(self.request_templates)
+            templates.pop(name, None)
+            self.request_templates = templates
+
+    def _prepare_template(self, method, url, headers, params=None, data=None):
+        # 'Cookie' 헤더는 prepare_request가 쿠키 저장소에서 붙임 (틀의 cookie_version과 함께 고정)
+        # [수정] 버전은 쿠키를 복사하기 전에 읽음. 그 사이 쿠키가 바뀌면 틀이 옛 버전으로 남아 다음 사용 때 다시 준비됨
+        version = self.cookie_version
+        prepared = self.session.prepare_request(
+            requests.Request(method, url, headers=headers, params=params, data=data))
+        return RequestTemplate(prepared, url, params, data, version)
+
+    def _get_template(self, name, date=None):
+        """
+        준비된 요청 틀을 반환합니다. 틀이 없거나 다른 날짜용이면 None을 반환하고 (기존 방식으로 요청),
+        쿠키가 바뀐 뒤라면 같은 날짜로 틀을 다시 준비합니다.
+        """
+        if self.template_date is None or (date is not None and date != self.template_date):
+            return None
+        template = self.request_templates.get(name)
+        if template is None or template.cookie_version != self.cookie_version:
+            with self._template_lock:
+                # 다른 스레드가 먼저 다시 준비했으면 그 틀을 사용
+                template = self.request_templates.get(name)
+                if template is None or template.cookie_version != self.cookie_version:
+                    self._prepare_request_templates(self.template_date)
+                    template = self.request_templates[name]
+        return template
+
+    # 골프존 카운티 로그인 로직 (POST URL 직접 지정)
+    def requests_login(self, usrid, usrpass):
+        """
         골프존 카운티의 AJAX 기반 로그인(`userLogin`)을 수행합니다.
         POST 요청 URL을 "https://www.golfzoncounty.com/login/userLogin"로 명시합니다.
         """
-        self.session = requests.Session()
-        self.session.verify = False
+        self._new_session()
 
         # [수정] 로그인 관련 URL을 명시적으로 재정의
-        login_get_url = f"{self.API_DOMAIN}/login?gfsReturn=/setting/account"  # GET 요청 URL
-        login_post_url = f"{self.API_DOMAIN}/login/userLogin"  # POST 요청 URL (로그에 명시됨)
+        login_get_url, login_post_url = self._login_urls()
 
         # ------------------------------------------------------------------
         # 1단계: 로그인 페이지 GET 요청 (세션 안정화 및 Hidden Field 확보)
         # ------------------------------------------------------------------
-        hidden_fields = {}
         try:
             self.log_message("⏳ 로그인 POST 전, 로그인 페이지 GET 요청으로 숨겨진 필드 확보 시도...")
             get_headers = self.get_base_headers(login_get_url)
             get_headers["Content-Type"] = "text/html"
 
-            res_get = self.session.get(login_get_url, headers=get_headers, timeout=5, verify=False)
+            with self.tracer.span("login.page") as span:
+                res_get = self.session.get(login_get_url, headers=get_headers, timeout=5, verify=False)
+                self.tracer.annotate_response(span, res_get)
             res_get.raise_for_status()
 
-            # Hidden Field 파싱 (BeautifulSoup가 필요함)
-            soup = BeautifulSoup(res_get.text, 'html.parser')
-            for input_tag in soup.find_all('input', type='hidden'):
-                name = input_tag.get('name')
-                value = input_tag.get('value', '')
-                if name:
-                    hidden_fields[name] = value
-
-            if not self.session.cookies.get('JSESSIONID'):
-                self.log_message("⚠️ GET 요청 후 JSESSIONID 쿠키 확보 실패. 로그인 실패 가능성 있음.")
-            else:
-                self.log_message(f"✅ 로그인 페이지 GET 성공. 세션 쿠키 확보 완료.")
-
-            if hidden_fields:
-                self.log_message(f"✅ 숨겨진 필드 {list(hidden_fields.keys())} 확보 완료.")
+            hidden_fields = self._parse_hidden_fields(res_get.text)
+            self._log_login_page_state(self.session.cookies.get('JSESSIONID'), hidden_fields)
 
         except requests.RequestException as e:
             self.log_message(f"❌ 로그인 페이지 GET 오류: {e}")
@@ -287,56 +1955,20 @@ class APIBookingCore:
         # ------------------------------------------------------------------
         # 2단계: 로그인 POST 요청 (POST URL 및 Referer 헤더 사용)
         # ------------------------------------------------------------------
-        login_headers = self.get_base_headers(login_post_url)
-        login_headers["Accept"] = "application/json, text/javascript, */*; q=0.01"
-
-        # Referer를 GET 요청을 보낸 페이지 URL로 정확히 설정
-        login_headers["Referer"] = login_get_url
-
         try:
-            self.log_message("✅ 최종 Payload 생성 및 POST URL, Referer 헤더 수정 완료.")
-
-            # 로그인 폼 데이터 (Payload) - Hidden fields + ID/PW
-            login_data = {
-                "userId": usrid,
-                "userPw": usrpass,
-            }
-            login_data.update(hidden_fields)  # 파싱한 숨겨진 필드(토큰 등) 추가
+            login_headers, login_data = self._build_login_request(usrid, usrpass, hidden_fields,
+                                                                  login_get_url, login_post_url)
 
             # 로그인 POST 요청 (login_post_url 사용)
-            res = self.session.post(login_post_url, headers=login_headers, data=login_data, timeout=10,
-                                    verify=False,
-                                    allow_redirects=False)
+            with self.tracer.span("login.post") as span:
+                res = self.session.post(login_post_url, headers=login_headers, data=login_data, timeout=10,
+                                        verify=False,
+                                        allow_redirects=False)
+                self.tracer.annotate_response(span, res)
             res.raise_for_status()  # 200 OK 확인
 
             # 3단계: 로그인 성공 확인 (JSON 응답 확인)
-            try:
-                login_response_json = res.json()
-
-                # [핵심 수정] "resultCode" 대신 "result" 필드를 확인하고, 성공 코드를 숫자 0으로 간주
-                result_code = login_response_json.get('result', None)
-                fail_msg = login_response_json.get('message', '로그인 실패')
-
-                # result가 0(숫자)이거나 '0'(문자열)일 때 성공으로 처리합니다.
-                if result_code is not None and (result_code == 0 or str(result_code) == '0'):
-                    self.log_message("🎉 로그인 POST 성공! (서버 응답 'result': 0 확인).")
-
-                    # [추가] 로그인 성공 후 'personId'를 멤버 변수에 저장하여 추후 예약에 사용
-                    user_info = login_response_json.get('data', {}).get('userInfo', {})
-                    self.member_id = user_info.get('personId', usrid)
-
-                    return {'result': 'success', 'message': 'Login successful'}
-                else:
-                    self.log_message(f"❌ 로그인 실패 (서버 메시지): {fail_msg}")
-                    self.log_message(f"📜 서버 응답 텍스트 (추가 정보): {res.text[:200]}...")
-                    self.log_message("UI_ERROR:로그인 실패: ID/PW가 유효하지 않거나 서버 오류.")
-                    return {'result': 'fail', 'message': fail_msg}
-            except json.JSONDecodeError:
-                # [수정] JSON 디코딩 실패 시 전체 응답 텍스트 출력
-                self.log_message(f"❌ 로그인 체크 실패: JSON 응답 디코딩 실패. 응답 텍스트: {res.text[:100]}...")
-                self.log_message(f"📜 서버 응답 텍스트 (추가 정보): {res.text[:200]}...")
-                self.log_message("UI_ERROR:로그인 실패: 예상치 못한 서버 응답.")
-                return {'result': 'fail', 'message': 'JSON decode error'}
+            return self._evaluate_login_response(res, usrid)
 
         except requests.RequestException as e:
             self.log_message(f"❌ 네트워크 오류: 로그인 실패: {e}")
@@ -346,13 +1978,248 @@ class APIBookingCore:
             self.log_message(f"❌ 로그인 처리 중 예기치 않은 오류 발생: {e}")
             return {'result': 'fail', 'message': f'Unexpected Error: {e}'}
 
+    def _new_session(self):
+        """로그인 전 새 requests 세션을 만들고 커넥션 풀과 쿠키 변경 감시를 연결합니다."""
+        self.session = requests.Session()
+        self.session.verify = False
+        self._mount_connection_pool()
+        self._watch_cookie_changes()
+
+    # ----------------------------------------------------
+    # [추가] 로그인 세션 캐시 (저장된 세션 재사용 → 실패 시 전체 로그인)
+    # ----------------------------------------------------
+    def export_session_state(self):
+        """세션 캐시에 저장할 쿠키와 member_id를 반환합니다."""
+        return {'member_id': self.member_id, 'cookies': export_cookie_jar(self.session.cookies)}
+
+    def login_with_cache(self, usrid, usrpass):
+        """
+        저장된 세션이 있으면 쿠키를 복원하고 확인 요청 1회로 유효성을 확인하여 재사용합니다.
+        재사용하지 못하면 requests_login으로 전체 로그인 후 세션을 저장합니다.
+        반환값은 requests_login과 같고, 저장된 세션을 재사용한 경우 'cached': True가 추가됩니다.
+        """
+        state = self.session_cache.load(self.API_DOMAIN, usrid, usrpass) if self.session_cache else None
+        if state:
+            self._new_session()
+            restore_cookie_jar(self.session.cookies, state.get('cookies', []))
+            self.member_id = state.get('member_id')
+            if self.validate_session():
+                self._log_session_reused(state)
+                return {'result': 'success', 'message': 'Cached Session', 'cached': True}
+            self.log_message("ℹ️ 저장된 로그인 세션이 만료되었습니다. 전체 로그인을 진행합니다.")
+            self.session_cache.clear(self.API_DOMAIN, usrid)
+
+        login_result = self.requests_login(usrid, usrpass)
+        if login_result['result'] == 'success':
+            self._save_session_cache(usrid, usrpass)
+        return login_result
+
+    def validate_session(self):
+        """
+        확인 요청 1회로 세션이 로그인 상태인지 확인합니다.
+        [수정] 예약 확인 API(checkReserveTeetimeAble)에 빈 timeTableId를 보내면 서버가 잘못된 입력을 어떻게
+        처리하느냐에 의존하므로, 읽기 전용인 예약 메인 페이지(teetimeList)를 GET 합니다.
+        (로그인이 풀리면 로그인 페이지로 이동하거나 로그인 페이지 HTML을 반환)
+        """
+        url = f"{self.API_DOMAIN}/reserve/main/teetimeList?golfclubSeq={self.GOLFCLUB_SEQ}"
+        headers = self.get_base_headers(url)
+        try:
+            with self.tracer.span("session.validate") as span:
+                res = self.session.get(url, headers=headers, timeout=5, verify=False)
+                self.tracer.annotate_response(span, res)
+        except requests.RequestException as e:
+            self.log_message(f"⚠️ 저장된 세션 확인 요청 실패: {e}")
+            return False
+        return self._is_authenticated_response(res)
+
+    def wait_session_ready(self, timeout=SESSION_READY_TIMEOUT):
+        """
+        [추가] 로그인 직후 고정 대기 대신, 세션 확인 요청이 성공할 때까지 지터 백오프로 반복합니다.
+        timeout 안에 확인되면 True, 아니면 False (기존 동작과 같이 그대로 진행)를 반환합니다.
+        """
+        deadline = time.monotonic() + timeout
+        for attempt in range(1, SESSION_READY_POLICY.max_attempts + 1):
+            if self.validate_session():
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self.stop_event.wait(min(remaining, SESSION_READY_POLICY.delay(attempt))):
+                break
+        return False
+
+    def probe_connections(self, count):
+        """[추가] 'count'개의 커넥션을 열어 응답 수와 풀 내 살아있는 커넥션 수를 반환합니다."""
+        with ThreadPoolExecutor(max_workers=count, thread_name_prefix="warmup") as executor:
+            opened = self.open_connections(count, executor)
+        return opened, len(self.pool_adapter.live_connections())
+
+    @staticmethod
+    def _is_login_page(res):
+        """[추가] 로그인 페이지로 이동했거나 본문이 로그인 페이지 HTML인지. (requests/httpx 응답 공용)"""
+        if urlparse(str(res.url)).path.startswith('/login'):
+            return True
+        return any(marker in res.text for marker in LOGIN_PAGE_MARKERS)
+
+    @classmethod
+    def _is_authenticated_response(cls, res):
+        """예약 메인 페이지 응답이 로그인 페이지가 아니면 로그인 상태로 봅니다. (requests/httpx 응답 공용)"""
+        return res.status_code == 200 and not cls._is_login_page(res)
+
+    def _classify_non_json_response(self, res):
+        """
+        [추가] JSON이 아닌 예약 API 응답의 결과 유형. 로그인 페이지일 때만 세션 만료(재로그인)이고,
+        점검/차단/게이트웨이 HTML 등은 재로그인해도 나아지지 않으므로 일시 오류로 봅니다. (웜업 커넥션 유지)
+        """
+        return OUTCOME_SESSION_EXPIRED if self._is_login_page(res) else OUTCOME_TRANSIENT
+
+    def _log_session_reused(self, state):
+        age_minutes = (time.time() - state.get('saved_at', time.time())) / 60
+        self.log_message(f"♻️ 저장된 로그인 세션 재사용 (저장 후 {age_minutes:.0f}분 경과, 확인 요청 1회로 유효성 확인).")
+
+    def _save_session_cache(self, usrid, usrpass):
+        if self.session_cache is None:
+            return
+        if self.session_cache.save(self.API_DOMAIN, usrid, usrpass, self.export_session_state()):
+            self.log_message("🔐 로그인 세션을 암호화하여 저장했습니다. (다음 실행 시 재사용)")
+        else:
+            self.log_message("⚠️ 로그인 세션 저장 실패.")
+
+    def _login_urls(self):
+        """로그인 페이지 GET URL과 로그인 POST URL을 반환합니다."""
+        login_get_url = f"{self.API_DOMAIN}/login?gfsReturn=/setting/account"  # GET 요청 URL
+        login_post_url = f"{self.API_DOMAIN}/login/userLogin"  # POST 요청 URL (로그에 명시됨)
+        return login_get_url, login_post_url
+
+    @staticmethod
+    def _parse_hidden_fields(login_page_html):
+        """로그인 페이지의 Hidden Field를 파싱합니다. (BeautifulSoup가 필요함)"""
+        hidden_fields = {}
+        soup = BeautifulSoup(login_page_html, 'html.parser')
+        for input_tag in soup.find_all('input', type='hidden'):
+            name = input_tag.get('name')
+            value = input_tag.get('value', '')
+            if name:
+                hidden_fields[name] = value
+        return hidden_fields
+
+    def _log_login_page_state(self, jsessionid, hidden_fields):
+        """로그인 페이지 GET 결과(세션 쿠키, Hidden Field)를 로그로 남깁니다."""
+        if not jsessionid:
+            self.log_message("⚠️ GET 요청 후 JSESSIONID 쿠키 확보 실패. 로그인 실패 가능성 있음.")
+        else:
+            self.log_message(f"✅ 로그인 페이지 GET 성공. 세션 쿠키 확보 완료.")
+
+        if hidden_fields:
+            self.log_message(f"✅ 숨겨진 필드 {list(hidden_fields.keys())} 확보 완료.")
+
+    def _build_login_request(self, usrid, usrpass, hidden_fields, login_get_url, login_post_url):
+        """로그인 POST 요청의 헤더와 폼 데이터(Payload)를 생성합니다."""
+        login_headers = self.get_base_headers(login_post_url)
+        login_headers["Accept"] = "application/json, text/javascript, */*; q=0.01"
+
+        # Referer를 GET 요청을 보낸 페이지 URL로 정확히 설정
+        login_headers["Referer"] = login_get_url
+
+        self.log_message("✅ 최종 Payload 생성 및 POST URL, Referer 헤더 수정 완료.")
+
+        # 로그인 폼 데이터 (Payload) - Hidden fields + ID/PW
+        login_data = {
+            "userId": usrid,
+            "userPw": usrpass,
+        }
+        login_data.update(hidden_fields)  # 파싱한 숨겨진 필드(토큰 등) 추가
+        return login_headers, login_data
+
+    def _evaluate_login_response(self, res, usrid):
+        """로그인 POST 응답(JSON)을 확인하고 결과 dict를 반환합니다. 성공 시 member_id를 저장합니다."""
+        try:
+            login_response_json = res.json()
+        except ValueError:
+            # [수정] JSON 디코딩 실패 시 전체 응답 텍스트 출력
+            self.log_message(f"❌ 로그인 체크 실패: JSON 응답 디코딩 실패. 응답 텍스트: {res.text[:100]}...")
+            self.log_message(f"📜 서버 응답 텍스트 (추가 정보): {res.text[:200]}...")
+            self.log_message("UI_ERROR:로그인 실패: 예상치 못한 서버 응답.")
+            return {'result': 'fail', 'message': 'JSON decode error'}
+
+        # [핵심 수정] "resultCode" 대신 "result" 필드를 확인하고, 성공 코드를 숫자 0으로 간주
+        result_code = login_response_json.get('result', None)
+        fail_msg = login_response_json.get('message', '로그인 실패')
+
+        # result가 0(숫자)이거나 '0'(문자열)일 때 성공으로 처리합니다.
+        if result_code is not None and (result_code == 0 or str(result_code) == '0'):
+            self.log_message("🎉 로그인 POST 성공! (서버 응답 'result': 0 확인).")
+
+            # [추가] 로그인 성공 후 'personId'를 멤버 변수에 저장하여 추후 예약에 사용
+            user_info = login_response_json.get('data', {}).get('userInfo', {})
+            self.member_id = user_info.get('personId', usrid)
+
+            return {'result': 'success', 'message': 'Login successful'}
+
+        self.log_message(f"❌ 로그인 실패 (서버 메시지): {fail_msg}")
+        self.log_message(f"📜 서버 응답 텍스트 (추가 정보): {res.text[:200]}...")
+        self.log_message("UI_ERROR:로그인 실패: ID/PW가 유효하지 않거나 서버 오류.")
+        return {'result': 'fail', 'message': fail_msg}
+
     # 서버 시간 확인 URL
     def get_server_time_offset(self):
-        """Fetches server time from HTTP Date header and calculates offset from local KST."""
+        """
+        [수정] ServerClockEstimator로 서브초 단위 오프셋(서버 - 로컬)을 측정합니다.
+        정밀 측정이 실패하면 기존 방식(Date 헤더 1회)으로 진행합니다.
+        """
         # [수정] 404 오류가 발생하던 /reserve 대신 /login 페이지를 사용하여 서버 시간 확인
         url = f"{self.API_DOMAIN}/login"
+        self.log_message("🔄 골프존 카운티 서버 시간 정밀 측정 시도 (Date 헤더 초 경계 탐지)...")
+
+        estimator = ServerClockEstimator()
+        failures = 0
+        while not estimator.done() and not self.stop_event.is_set():
+            send_at = estimator.next_send_time(time.time())
+            delay = send_at - time.time()
+            if delay > 0 and self.stop_event.wait(delay):
+                break
+
+            sample = self._probe_server_date(url)
+            if sample is None:
+                failures += 1
+                if failures >= 3:
+                    break
+                continue
+            estimator.add_sample(*sample)
+
+        estimate = estimator.result()
+        if estimate is not None and estimate.uncertainty < 0.5:
+            self.last_clock_estimate = estimate
+            self._log_clock_estimate(estimate)
+            return estimate.offset
+
+        self.log_message("⚠️ 서버 시간 정밀 측정 실패. 기존 방식(Date 헤더 1회)으로 확인합니다.")
+        return self._get_server_time_offset_legacy(url)
+
+    def _probe_server_date(self, url):
+        """HEAD 요청 1회로 (송신 시각, 수신 시각, 서버 Date 초)를 반환합니다. 실패 시 None."""
+        try:
+            with self.tracer.span("clock.sample") as span:
+                send_wall = time.time()
+                response = self.session.head(url, timeout=3, verify=False, allow_redirects=False)
+                recv_wall = time.time()
+                self.tracer.annotate_response(span, response)
+            server_date_str = response.headers.get("Date")
+            if not server_date_str:
+                return None
+            return send_wall, recv_wall, parsedate_to_datetime(server_date_str).timestamp()
+        except (requests.RequestException, TypeError, ValueError) as e:
+            self.log_message(f"⚠️ 서버 시간 샘플 요청 실패: {e}")
+            return None
+
+    def _log_clock_estimate(self, estimate):
+        """ClockEstimate 결과를 로그로 남깁니다."""
+        self.log_message(
+            f"✅ 서버 시간 정밀 측정 성공: Offset={estimate.offset:+.4f}초 "
+            f"(신뢰구간 {estimate.low:+.4f} ~ {estimate.high:+.4f}, ±{estimate.uncertainty * 1000:.1f}ms, "
+            f"샘플 {estimate.samples}개, 최소 RTT {estimate.min_rtt * 1000:.1f}ms)")
+
+    def _get_server_time_offset_legacy(self, url):
+        """Fetches server time from HTTP Date header and calculates offset from local KST."""
         max_retries = 5
-        self.log_message("🔄 골프존 카운티 서버 시간 확인 시도...")
         for attempt in range(max_retries):
             try:
                 # GET 요청으로 Date 헤더를 얻음
@@ -361,13 +2228,7 @@ class APIBookingCore:
                 server_date_str = response.headers.get("Date")
 
                 if server_date_str:
-                    server_time_gmt = parsedate_to_datetime(server_date_str)
-                    server_time_kst = server_time_gmt.astimezone(KST)
-                    local_time_kst = datetime.datetime.now(KST)
-                    time_difference = (server_time_kst - local_time_kst).total_seconds()
-                    self.log_message(
-                        f"✅ 서버 시간 확인 성공: 서버 KST={server_time_kst.strftime('%H:%M:%S.%f')[:-3]}, 로컬 KST={local_time_kst.strftime('%H:%M:%S.%f')[:-3]}, Offset={time_difference:.3f}초")
-                    return time_difference
+                    return self._offset_from_date_header(server_date_str)
                 else:
                     self.log_message(f"⚠️ 서버 Date 헤더 없음, 재시도 ({attempt + 1}/{max_retries})...")
             except requests.RequestException as e:
@@ -375,14 +2236,44 @@ class APIBookingCore:
             except Exception as e:
                 self.log_message(f"❌ 서버 시간 처리 중 오류: {e}")
                 return 0
-            time.sleep(0.5)
+            if self.stop_event.wait(CLOCK_RETRY_POLICY.delay(attempt + 1)):
+                return 0
 
         self.log_message("❌ 서버 시간 확인 최종 실패. 시간 오차 보정 없이 진행합니다 (Offset=0).")
         return 0
 
+    def _offset_from_date_header(self, server_date_str):
+        """HTTP Date 헤더 값과 현재 로컬 KST의 차이(초)를 계산합니다."""
+        server_time_gmt = parsedate_to_datetime(server_date_str)
+        server_time_kst = server_time_gmt.astimezone(KST)
+        local_time_kst = datetime.datetime.now(KST)
+        time_difference = (server_time_kst - local_time_kst).total_seconds()
+        self.log_message(
+            f"✅ 서버 시간 확인 성공: 서버 KST={server_time_kst.strftime('%H:%M:%S.%f')[:-3]}, 로컬 KST={local_time_kst.strftime('%H:%M:%S.%f')[:-3]}, Offset={time_difference:.3f}초")
+        return time_difference
+
+    def _get_keepalive_session(self):
+        """
+        [추가] 세션 유지 전용 requests 세션. 예약 세션과 쿠키 저장소(LockedCookieJar)는 공유하고
+        커넥션 풀(1개)은 따로 써서, 세션 유지 요청이 예약 요청과 소켓을 두고 경쟁하지 않습니다.
+        재로그인으로 예약 세션의 쿠키 저장소가 바뀌면 다시 만듭니다. (세션 유지 스레드에서만 호출)
+        """
+        if self.keepalive_session is None or self.keepalive_session.cookies is not self.session.cookies:
+            session = requests.Session()
+            session.verify = False
+            session.cookies = self.session.cookies
+            adapter = WarmPoolAdapter(pool_connections=1, pool_maxsize=1, resolver=self.dns)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self.keepalive_session = session
+        return self.keepalive_session
+
     # 세션 유지 (선택된 CC 예약 메인 페이지)
     def keep_session_alive(self, target_dt):
-        """Periodically hits a page to keep the session active until target_dt (1분에 1회)."""
+        """
+        Periodically hits a page to keep the session active until target_dt (1분에 1회).
+        [수정] 예약 세션 대신 세션 유지 전용 세션(_get_keepalive_session)으로 요청합니다.
+        """
         self.log_message("✅ 세션 유지 스레드 시작.")
         # [수정] GOLFCLUB_SEQ 사용
         keep_alive_url = f"{self.API_DOMAIN}/reserve/main/teetimeList?golfclubSeq={self.GOLFCLUB_SEQ}"
@@ -392,7 +2283,8 @@ class APIBookingCore:
             try:
                 headers = self.get_base_headers(keep_alive_url)
                 headers["Content-Type"] = "application/json"
-                self.session.get(keep_alive_url, headers=headers, timeout=10, verify=False, proxies=self.proxies)
+                self._get_keepalive_session().get(keep_alive_url, headers=headers, timeout=10, verify=False,
+                                                  proxies=self.proxies)
                 self.log_message("💚 [세션 유지] 세션 유지 요청 완료.")
             except Exception as e:
                 self.log_message(f"❌ [세션 유지] 통신 오류 발생: {e}")
@@ -409,73 +2301,46 @@ class APIBookingCore:
             self.log_message("✅ 세션 유지 스레드: 예약 정시 도달. 종료합니다.")
 
     # 'getList' 호출 (티타임 목록 HTML 획득)
-    def get_all_available_times(self, date):
+    def get_all_available_times(self, date, concurrent=False):
         """
         [수정] 사용자 관찰에 따라 pageNo 파라미터를 추가하고 1~4페이지를 모두 조회하여 HTML을 병합합니다.
+        [추가] concurrent=True 이면 모든 페이지를 동시에 요청합니다 (_get_all_available_times_concurrent).
+        [수정] 목록 없는 페이지가 나오면 남은 페이지는 요청하지 않고 종료합니다.
         """
-        self.log_message(f"⏳ {date} 선택된 골프장 예약 가능 시간대 조회 중 (HTML 요청 - getList, 최대 4페이지)...")
+        if concurrent:
+            return self._get_all_available_times_concurrent(date)
+
+        max_pages = self.MAX_LIST_PAGES  # 사용자 관찰에 따라 1부터 4페이지까지 시도
+        self.log_message(f"⏳ {date} 선택된 골프장 예약 가능 시간대 조회 중 (HTML 요청 - getList, 최대 {max_pages}페이지)...")
 
         url = self.TIME_LIST_URL
-        # [수정] GOLFCLUB_SEQ 사용
-        referer_url = f"{self.API_DOMAIN}/reserve/main/teetimeList?golfclubSeq={self.GOLFCLUB_SEQ}"
-        headers = self.get_base_headers(referer_url)
-        headers["Accept"] = "text/html, */*; q=0.01"
+        headers = self._get_list_headers()
 
         all_times_html_parts = []
-        max_pages = 4  # 사용자 관찰에 따라 1부터 4페이지까지 시도
+        page_results = {}
+        page_elapsed = {}
+        fetch_start = time.monotonic()
 
         for page_no in range(1, max_pages + 1):
             if self.stop_event.is_set(): return None
 
-            payload = {
-                # [수정] GOLFCLUB_SEQ 사용
-                "golfclubSeq": self.GOLFCLUB_SEQ,
-                "selectDate": date,
-                "selectTimeSection": "",
-                "selectHoleCnt": "",
-                "selectPersonCnt": "",
-                #                "selectHoleCnt": "18",
-                #                "selectPersonCnt": "4",
-                "selectCaddieType": "",
-                "selectReserveOrderType": "",
-                "searchFlag": "Y",
-                "searchTime": "",
-                "pageNo": str(page_no)  # <--- [핵심 수정] pageNo 추가
-            }
-
-            max_attempts = 3
-            timeout_seconds = 3.0
-
-            for attempt in range(1, max_attempts + 1):
-                if self.stop_event.is_set(): return None
-                try:
-                    self.log_message(f"🔄 티 타임 조회 시도 ({page_no}페이지, 시도 {attempt}/{max_attempts})...")
-                    res = self.session.post(url, headers=headers, data=payload, timeout=timeout_seconds,
-                                            verify=False)
-                    res.raise_for_status()
-
-                    if 'text/html' in res.headers.get('content-type', ''):
-                        if len(res.text.strip()) < 100:
-                            self.log_message(f"✅ 'getList' {page_no}페이지 응답 내용이 짧아 (목록 없음) 조회 종료.")
-                        else:
-                            self.log_message(f"✅ 'getList' {page_no}페이지 HTML 응답 수신 성공.")
-                            all_times_html_parts.append(res.text)
-                        break  # 성공했으니 다음 페이지로 이동
-                    else:
-                        self.log_message(f"❌ 'getList' {page_no}페이지 응답 유형 오류: {res.headers.get('content-type')}")
-                        continue
+            page_start = time.monotonic()
+            page_html = self._fetch_list_page(url, headers, self._build_list_payload(date, page_no), page_no)
+            page_elapsed[page_no] = (time.monotonic() - page_start) * 1000
+            page_results[page_no] = page_html
 
-                except (requests.Timeout, requests.RequestException) as e:
-                    error_msg = f"❌ 티 타임 조회 통신 오류 ({type(e).__name__}): {e}"
-                    if attempt < max_attempts:
-                        self.log_message(f"{error_msg}, ... 즉시 재시도...")
-                        continue
-                    else:
-                        self.log_message(f"❌ 최종 ({max_attempts}회) 시도 실패: {error_msg}")
-                        return None
-                except Exception as e:
-                    self.log_message(f"❌ 'getList' {page_no}페이지 예외 오류: {e}")
-                    return None
+            if page_html is None:
+                # [수정] 실패한 페이지는 건너뛰고 다음 페이지 계속 (동시/스트리밍 조회와 같은 처리, 페이지 수 기록 안함)
+                self.log_message(f"⚠️ 'getList' {page_no}페이지 최종 실패. 해당 페이지 제외하고 진행.")
+                continue
+            if not page_html:
+                break  # [수정] 마지막 페이지 다음: 남은 페이지 요청 생략
+            all_times_html_parts.append(page_html)
+
+        elapsed_ms = (time.monotonic() - fetch_start) * 1000
+        self.last_fetch_stats = {'mode': 'sequential', 'elapsed_ms': elapsed_ms, 'page_ms': page_elapsed}
+        self._record_list_pages(page_results)
+        self.log_message(f"⏱️ 순차 조회 소요: {elapsed_ms:.1f}ms ({len(page_elapsed)}페이지)")
 
         if not all_times_html_parts:
             self.log_message("❌ 모든 페이지에서 티 타임 목록 조회 실패.")
@@ -486,22 +2351,496 @@ class APIBookingCore:
         self.log_message(f"✅ 총 {len(all_times_html_parts)}개 페이지 HTML 조합 완료. {len(combined_html)} 길이.")
         return combined_html
 
+    def _get_all_available_times_concurrent(self, date):
+        """
+        [추가] 1~4페이지 'getList' 요청을 미리 열어둔 커넥션 풀 위에서 동시에 전송합니다.
+        페이지별 재시도는 각 작업 안에서 독립적으로 처리되며, 결과는 페이지 순서대로 다시 조합합니다.
+        [수정] 골프장별 기록이 있으면 예상 페이지 수 + 1페이지만 먼저 요청하고, 마지막 요청 페이지에도
+        목록이 있으면 나머지 페이지를 추가로 요청합니다.
+        """
+        max_pages = self.MAX_LIST_PAGES
+        requested_pages = self._list_pages_to_request()
+        self.log_message(
+            f"⏳ {date} 선택된 골프장 예약 가능 시간대 동시 조회 중 (getList, {requested_pages}/{max_pages}페이지 동시 요청)...")
+
+        url = self.TIME_LIST_URL
+        headers = self._get_list_headers()
+        executor = self._get_page_executor()
+
+        def fetch(page_no):
+            page_start = time.monotonic()
+            page_html = self._fetch_list_page(url, headers, self._build_list_payload(date, page_no), page_no)
+            return page_html, (time.monotonic() - page_start) * 1000
+
+        page_results = {}
+        page_elapsed = {}
+
+        def fetch_pages(page_nos):
+            futures = {executor.submit(fetch, page_no): page_no for page_no in page_nos}
+            for future in as_completed(futures):
+                page_no = futures[future]
+                try:
+                    page_results[page_no], page_elapsed[page_no] = future.result()
+                except Exception as e:
+                    self.log_message(f"❌ 'getList' {page_no}페이지 동시 조회 예외 오류: {e}")
+                    page_results[page_no] = None
+
+        fetch_start = time.monotonic()
+        fetch_pages(range(1, requested_pages + 1))
+        if requested_pages < max_pages and page_results.get(requested_pages) != "" and not self.stop_event.is_set():
+            self.log_message(f"ℹ️ {requested_pages}페이지에도 목록이 있어 {requested_pages + 1}~{max_pages}페이지 추가 요청.")
+            fetch_pages(range(requested_pages + 1, max_pages + 1))
+
+        elapsed_ms = (time.monotonic() - fetch_start) * 1000
+        sequential_ms = sum(page_elapsed.values())
+        self.last_fetch_stats = {'mode': 'concurrent', 'elapsed_ms': elapsed_ms, 'page_ms': page_elapsed}
+        self.log_message(
+            f"⏱️ 동시 조회 소요: {elapsed_ms:.1f}ms (순차 환산 {sequential_ms:.1f}ms, "
+            f"{sequential_ms - elapsed_ms:.1f}ms 단축)")
+
+        if self.stop_event.is_set(): return None
+        self._record_list_pages(page_results)
+
+        # 페이지 순서대로 재조합 (실패한 페이지는 건너뜀, 목록 없는 페이지에서 종료)
+        all_times_html_parts = self._join_list_pages(page_results)
+
+        if not all_times_html_parts:
+            self.log_message("❌ 모든 페이지에서 티 타임 목록 조회 실패.")
+            return None
+
+        combined_html = "".join(all_times_html_parts)
+        self.log_message(f"✅ 총 {len(all_times_html_parts)}개 페이지 HTML 조합 완료. {len(combined_html)} 길이.")
+        return combined_html
+
+    def _list_pages_to_request(self):
+        """[추가] 동시/스트리밍 조회에서 먼저 요청할 페이지 수: 예상 페이지 수 + 끝 확인용 1페이지 (최대 MAX_LIST_PAGES)."""
+        if self.page_counts is None:
+            return self.MAX_LIST_PAGES
+        return min(self.MAX_LIST_PAGES, self.page_counts.expected_pages(self._page_count_key(), self.MAX_LIST_PAGES) + 1)
+
+    def _record_list_pages(self, page_results):
+        """
+        [추가] 이번 조회에서 확인된 페이지 수를 골프장별 기록에 남깁니다. (page_results: page_no -> HTML/""/None)
+        끝("" 페이지)을 확인하기 전에 실패/미요청 페이지가 있거나, 목록이 전혀 없으면(오픈 전) 기록하지 않습니다.
+        """
+        if self.page_counts is None:
+            return
+        for page_no in range(1, self.MAX_LIST_PAGES + 1):
+            page_html = page_results.get(page_no)
+            if page_html is None:
+                return
+            if not page_html:
+                if page_no > 1:
+                    self.page_counts.record(self._page_count_key(), page_no - 1)
+                return
+        self.page_counts.record(self._page_count_key(), self.MAX_LIST_PAGES)
+
+    def _page_count_key(self):
+        """[추가] 페이지 수 기록 키: 골프장 (서버 측 검색 조건을 쓰면 조건별로 따로 기록)."""
+        filter_key = self.list_filter.key if self.list_filter is not None else ""
+        return f"{self.GOLFCLUB_SEQ}:{filter_key}" if filter_key else self.GOLFCLUB_SEQ
+
+    def _join_list_pages(self, page_results):
+        """[추가] 페이지 순서대로 HTML 조각을 모읍니다. 실패한 페이지는 건너뛰고, 목록 없는 페이지에서 멈춥니다."""
+        all_times_html_parts = []
+        for page_no in sorted(page_results):
+            page_html = page_results[page_no]
+            if page_html is None:
+                self.log_message(f"⚠️ 'getList' {page_no}페이지 최종 실패. 해당 페이지 제외하고 진행.")
+            elif not page_html:
+                break
+            else:
+                all_times_html_parts.append(page_html)
+        return all_times_html_parts
+
+    def _get_list_headers(self):
+        """'getList' 요청용 헤더를 반환합니다."""
+        # [수정] GOLFCLUB_SEQ 사용
+        referer_url = f"{self.API_DOMAIN}/reserve/main/teetimeList?golfclubSeq={self.GOLFCLUB_SEQ}"
+        headers = self.get_base_headers(referer_url)
+        headers["Accept"] = "text/html, */*; q=0.01"
+        return headers
+
+    def _build_list_payload(self, date, page_no):
+        """'getList' 요청 Payload를 생성합니다."""
+        return {
+            # [수정] GOLFCLUB_SEQ 사용
+            "golfclubSeq": self.GOLFCLUB_SEQ,
+            "selectDate": date,
+            "selectTimeSection": "",
+            "selectHoleCnt": "",
+            "selectPersonCnt": "",
+            #                "selectHoleCnt": "18",
+            #                "selectPersonCnt": "4",
+            "selectCaddieType": "",
+            "selectReserveOrderType": "",
+            "searchFlag": "Y",
+            "searchTime": "",
+            "pageNo": str(page_no),  # <--- [핵심 수정] pageNo 추가
+            **(self.list_filter.payload_fields() if self.list_filter is not None else {}),  # [추가] 서버 측 검색 조건
+        }
+
+    def _fetch_list_page(self, url, headers, payload, page_no, check_filter=True):
+        """
+        'getList' 한 페이지를 최대 3회 시도하여 가져옵니다.
+        반환값: HTML 문자열 (목록 없음은 ""), 최종 실패 시 None
+        목록 끝("")은 _evaluate_list_response가 짧은 text/html 본문을 받은 경우뿐입니다.
+        check_filter=False이면 서버 측 검색 조건 확인을 하지 않습니다. (verify_list_filter의 조건 없는 조회)
+        """
+        max_attempts = 3
+        timeout_seconds = 3.0
+
+        for attempt in range(1, max_attempts + 1):
+            if self.stop_event.is_set(): return None
+            try:
+                self.log_event(EVT_GETLIST_TRY, page_no, attempt, max_attempts)
+                with self.tracer.span("getList", page=page_no, attempt=attempt) as span:
+                    template = self._get_template('getList', payload.get('selectDate'))
+                    # [수정] stream=True: 본문을 전송된 그대로 읽어 직접 풀고 풀기 시간을 기록
+                    if template is not None:
+                        # [추가] 사전 준비된 요청 틀에 pageNo만 교체하여 전송
+                        res = self.session.send(template.build(data={"pageNo": payload['pageNo']}),
+                                                timeout=timeout_seconds, verify=False, stream=True)
+                    else:
+                        res = self.session.post(url, headers=headers, data=payload, timeout=timeout_seconds,
+                                                verify=False, stream=True)
+                    try:
+                        raw = res.raw.read(decode_content=False)
+                    finally:
+                        res.raw.release_conn()  # 끝까지 읽은 커넥션은 풀로 반환 (keep-alive 유지)
+                    page_text, body_stats = decode_response_text(raw, res.headers, res.encoding)
+                    self.tracer.annotate_response(span, res, body_stats)
+                res.raise_for_status()
+
+                page_html = self._evaluate_list_response(res, page_no, page_text, check_filter)
+                if page_html is None:
+                    continue
+                return page_html
+
+            except (requests.Timeout, requests.RequestException, urllib3.exceptions.HTTPError) as e:
+                # [추가] stream=True 본문 읽기 중 오류는 urllib3 예외로 올라옴
+                error_msg = f"❌ 티 타임 조회 통신 오류 ({type(e).__name__}): {e}"
+                if attempt < max_attempts:
+                    self.log_message(f"{error_msg}, ... 즉시 재시도...")
+                    continue
+                else:
+                    self.log_message(f"❌ 최종 ({max_attempts}회) 시도 실패: {error_msg}")
+                    return None
+            except Exception as e:
+                self.log_message(f"❌ 'getList' {page_no}페이지 예외 오류: {e}")
+                return None
+
+        # [수정] 응답 유형 오류만 반복된 경우: 목록 끝("")이 아니라 실패(None)로 처리
+        # (목록 끝으로 보면 남은 페이지를 건너뛰고 잘못된 페이지 수가 기록됨)
+        self.log_message(f"❌ 'getList' {page_no}페이지 응답 유형 오류 {max_attempts}회 반복. 실패로 처리.")
+        return None
+
+    def _evaluate_list_response(self, res, page_no, page_text, check_filter=True):
+        """
+        'getList' 응답을 확인합니다. HTML(목록 없음은 "")을 반환하고, 응답 유형 오류면 None(재시도)을 반환합니다.
+        [수정] 본문은 직접 풀어 읽은 텍스트(page_text)를 받습니다.
+        """
+        if 'text/html' in res.headers.get('content-type', ''):
+            if len(page_text.strip()) < 100:
+                self.log_message(f"✅ 'getList' {page_no}페이지 응답 내용이 짧아 (목록 없음) 조회 종료.")
+                return ""
+            self.log_event(EVT_GETLIST_OK, page_no)
+            if check_filter and self.list_filter is not None and self.list_filter.server_side:
+                self._check_list_filter(page_text, page_no)
+            return page_text
+
+        self.log_message(f"❌ 'getList' {page_no}페이지 응답 유형 오류: {res.headers.get('content-type')}")
+        return None
+
+    def _check_list_filter(self, page_html, page_no):
+        """
+        [추가] 서버가 검색 조건을 무시했으면 서버 측 필터를 끄고 전체 조회로 돌아갑니다.
+        무시된 응답은 전체 조회 결과와 같으므로 (클라이언트 필터는 그대로) 이번 페이지도 그대로 사용합니다.
+        """
+        violation = self.list_filter.violation(page_html)
+        if violation is None:
+            return
+        self.list_filter.server_side = False
+        self.invalidate_request_template('getList')  # 다음 요청 때 검색 조건 없는 틀로 다시 준비
+        self.log_message(f"⚠️ 'getList' {page_no}페이지: 서버가 검색 조건을 무시함 ({violation}). 전체 조회로 전환.")
+
+    def verify_list_filter(self, date=None):
+        """
+        [추가] 서버 측 검색 조건이 티 타임을 빠뜨리지 않는지(너무 좁은 응답) 골든 타임 전에 확인합니다.
+        이미 열린 날짜(기본: 오늘)의 목록을 조건 없이/조건을 넣어 각각 조회하고 _apply_filter_verification으로 비교합니다.
+        (조건 밖 티 타임이 오는 너무 넓은 응답은 _check_list_filter가 조회마다 확인) 요청 틀 준비 전에 호출합니다.
+        """
+        if self.list_filter is None or not self.list_filter.server_side:
+            return
+        date = date or datetime.datetime.now(self.KST).strftime('%Y%m%d')
+        with self.tracer.span("getList.verify_filter", date=date):
+            expected = self._fetch_list_items(date, server_side=False)
+            found = self._fetch_list_items(date, server_side=True) if expected else None
+        self._apply_filter_verification(date, expected, found)
+
+    def _fetch_list_items(self, date, server_side):
+        """[추가] 'date'의 모든 페이지를 순서대로 조회하여 파싱한 티 타임 목록을 반환합니다. 실패한 페이지가 있으면 None."""
+        headers = self._get_list_headers()
+        items = []
+        for page_no in range(1, self.MAX_LIST_PAGES + 1):
+            page_html = self._fetch_list_page(self.TIME_LIST_URL, headers, self._verify_payload(date, page_no, server_side),
+                                              page_no, check_filter=server_side)
+            if page_html is None:
+                return None
+            if not page_html:
+                break
+            items.extend(self.parse_teetime_items(page_html) or [])
+        return items
+
+    def _verify_payload(self, date, page_no, server_side):
+        """[추가] 확인 조회용 Payload. server_side=False이면 검색 조건 필드를 비웁니다."""
+        payload = self._build_list_payload(date, page_no)
+        if not server_side:
+            payload.update(dict.fromkeys(self.list_filter.payload_fields(), ""))
+        return payload
+
+    def _apply_filter_verification(self, date, expected, found):
+        """
+        [추가] 조건 없는 조회(expected) 중 조건에 맞아야 할 티 타임이 조건 조회(found)에 모두 있는지 비교합니다.
+        빠진 티 타임이 있거나, 조회 실패/비교할 티 타임이 없어 확인할 수 없으면 server_side를 끕니다.
+        (홀 수 조건은 parse_teetime_items가 양쪽에 똑같이 적용)
+        """
+        list_filter = self.list_filter
+        if not list_filter.server_side:
+            return  # 확인 조회 중 조건 무시(너무 넓은 응답)로 이미 전체 조회로 전환됨
+        should_match = [item for item in expected or [] if list_filter.in_section(item.minutes)]
+        if expected is None or found is None or not should_match:
+            reason = "확인 조회 실패" if expected is None or (should_match and found is None) \
+                else "조건에 맞는 티 타임이 없어 비교 불가"
+            list_filter.server_side = False
+            self.invalidate_request_template('getList')
+            self.log_message(f"⚠️ 'getList' 검색 조건 확인 불가 ({date}, {reason}). 전체 조회로 진행합니다.")
+            return
+        found_ids = {item.time_table_id for item in found}
+        missing = [item for item in should_match if item.time_table_id not in found_ids]
+        if missing:
+            list_filter.server_side = False
+            self.invalidate_request_template('getList')
+            self.log_message(
+                f"⚠️ 'getList' 검색 조건이 티 타임을 빠뜨림 ({date}, {len(should_match)}개 중 {len(missing)}개 누락, "
+                f"예: {missing[0].label}). 전체 조회로 진행합니다.")
+            return
+        self.log_message(f"✅ 'getList' 검색 조건 확인 완료 ({date}, 조건에 맞는 티 타임 {len(should_match)}개 모두 포함).")
+
+    # ----------------------------------------------------
+    # [추가] 동시 조회용 커넥션 풀 + 골든 타임 직전 웜업
+    # ----------------------------------------------------
+    def _mount_connection_pool(self):
+        """
+        페이지 수(또는 웜업 커넥션 수)만큼 동시에 재사용할 수 있도록 세션의 커넥션 풀 크기를 지정합니다.
+        [수정] transport가 HTTP/2이면 Http2Adapter를 mount 합니다. (h2/httpx가 없으면 HTTP/1.1 유지)
+        """
+        pool_size = max(self.MAX_LIST_PAGES * 2, self.warm_connection_count)
+        if self.transport == TRANSPORT_HTTP2 and HTTP2_AVAILABLE:
+            self.pool_adapter = Http2Adapter(pool_size, on_fallback=self._fallback_to_http1)
+        else:
+            if self.transport == TRANSPORT_HTTP2:
+                self.log_message("⚠️ HTTP/2 전송에 필요한 httpx/h2 패키지가 없어 HTTP/1.1 커넥션 풀을 사용합니다.")
+                self.transport = TRANSPORT_HTTP1
+            self.pool_adapter = WarmPoolAdapter(pool_connections=2, pool_maxsize=pool_size, resolver=self.dns)
+        self.session.mount("https://", self.pool_adapter)
+        self.session.mount("http://", self.pool_adapter)
+
+    def _fallback_to_http1(self, http_version):
+        """[추가] 서버가 HTTP/2를 협상하지 않으면 기존 HTTP/1.1 커넥션 풀로 다시 mount 합니다. (진행 중인 요청은 그대로 완료)"""
+        self.log_message(f"⚠️ 서버가 HTTP/2를 협상하지 않음 ({http_version}). HTTP/1.1 커넥션 풀로 전환합니다.")
+        self.transport = TRANSPORT_HTTP1
+        self._mount_connection_pool()
+
+    def log_transport(self):
+        """[추가] 실제로 사용 중인 전송 프로토콜과 커넥션 수를 로그로 남깁니다. (로그인 직후 호출)"""
+        self.log_message(f"🔗 전송 프로토콜: {self.pool_adapter.http_version or '미확인'} "
+                         f"(열린 커넥션 {len(self.pool_adapter.live_connections())}개)")
+
+    def resolve_api_host(self, pin_until_dt=None):
+        """
+        [추가] API 도메인 주소를 미리 조회하여 (캐시가 유효하면 생략) 새 커넥션이 DNS 조회 없이 연결하도록 합니다.
+        pin_until_dt(KST)를 주면 그때까지 TTL과 관계없이 주소를 고정합니다. (HTTP/1.1 커넥션 풀에 적용)
+        """
+        parsed = urlparse(self.API_DOMAIN)
+        host = parsed.hostname
+        if self.dns is None or is_ip_address(host):
+            return None
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        try:
+            entry = self.dns.lookup(host, port)
+        except OSError as e:
+            self.log_message(f"⚠️ DNS 사전 조회 실패: {e} (새 커넥션은 시스템 DNS 조회 사용)")
+            return None
+
+        details = [f"주소 {len(entry.addresses)}개", f"조회 {entry.resolve_ms:.1f}ms", f"TTL {entry.ttl:.0f}초"]
+        if entry.expires_at <= self.dns.clock():
+            details.append("재조회 실패, 이전 결과 사용")
+        if entry.latencies:
+            details.append("연결 " + ", ".join(
+                f"{address} {'실패' if math.isinf(latency) else f'{latency * 1000:.1f}ms'}"
+                for address, latency in entry.latencies.items()))
+        if pin_until_dt is not None:
+            remaining = (pin_until_dt - datetime.datetime.now(self.KST)).total_seconds()
+            self.dns.pin(host, self.dns.clock() + remaining)
+            details.append(f"{pin_until_dt.strftime('%H:%M:%S')}까지 고정")
+        self.log_message(f"🌐 DNS 사전 조회: {host} → {entry.addresses[0]} ({', '.join(details)})")
+        return entry
+
+    def _get_page_executor(self):
+        """'getList' 동시 조회용 스레드 풀을 (미리) 생성합니다."""
+        if self.page_executor is None:
+            self.page_executor = ThreadPoolExecutor(max_workers=self.MAX_LIST_PAGES,
+                                                    thread_name_prefix="getList")
+        return self.page_executor
+
+    def close(self):
+        """[추가] 실행이 끝나면 'getList' 스레드 풀을 정리합니다. (Worker 스레드 finally에서 호출)"""
+        if self.page_executor is not None:
+            self.page_executor.shutdown(wait=False)
+            self.page_executor = None
+
+    def open_connections(self, count=None, executor=None):
+        """
+        'count'개의 가벼운 요청(HEAD)을 동시에 보내 'count'개의 인증된 커넥션이 풀에 살아있도록 합니다.
+        (첫 요청이 TCP/TLS 핸드셰이크를 기다리지 않도록)
+        """
+        count = count or self.MAX_LIST_PAGES
+        url = f"{self.API_DOMAIN}/reserve/main/teetimeList?golfclubSeq={self.GOLFCLUB_SEQ}"
+        headers = self.get_base_headers(url)
+        executor = executor or self._get_page_executor()
+
+        def ping(_):
+            try:
+                self.session.head(url, headers=headers, timeout=3.0, verify=False)
+                return True
+            except requests.RequestException:
+                return False
+
+        return sum(1 for ok in executor.map(ping, range(count)) if ok)
+
+    def warm_up_connections(self, start_dt, end_dt, count, ping_interval=2.0):
+        """
+        [별도 스레드] start_dt부터 end_dt(KST)까지 ping_interval마다 open_connections를 반복하여
+        골든 타임(T-0)에 'count'개의 살아있는 커넥션이 풀에 대기하도록 유지합니다.
+        end_dt 이후에는 요청을 보내지 않아, T-0 시점의 커넥션은 모두 유휴 상태로 풀에 반납되어 있습니다.
+        """
+        remaining = (start_dt - datetime.datetime.now(self.KST)).total_seconds()
+        if remaining > 0 and self.stop_event.wait(remaining):
+            return
+
+        self.log_message(f"🔥 [웜업] 커넥션 웜업 시작 (목표 {count}개, {ping_interval:.1f}초 간격).")
+        with ThreadPoolExecutor(max_workers=count, thread_name_prefix="warmup") as executor:
+            while not self.stop_event.is_set():
+                round_start = time.monotonic()
+                opened = self.open_connections(count, executor)
+                live = len(self.pool_adapter.live_connections())
+                self.log_message(
+                    f"🔥 [웜업] {opened}/{count}개 응답, 풀 내 살아있는 커넥션 {live}개 "
+                    f"({(time.monotonic() - round_start) * 1000:.1f}ms).")
+
+                next_round = (end_dt - datetime.datetime.now(self.KST)).total_seconds() - ping_interval
+                if next_round <= 0:
+                    break
+                if self.stop_event.wait(ping_interval):
+                    break
+
+        self.log_message("🔥 [웜업] 웜업 종료. 골든 타임까지 커넥션 유휴 대기.")
+
+    def snapshot_connections(self):
+        """현재 풀의 커넥션별 사용 횟수를 기록합니다. (골든 타임 발사 직전 호출)"""
+        return {id(conn): conn.request_count for conn in self.pool_adapter.live_connections()}
+
+    def log_connection_report(self, snapshot, fire_monotonic):
+        """
+        발사 직전 스냅샷과 비교하여 커넥션별 나이(연결 후 경과 시간), 발사 전 사용 횟수,
+        그리고 골든 타임 요청에 재사용되었는지 / 새로 연결되었는지를 로그로 남깁니다.
+        """
+        connections = self.pool_adapter.all_connections()
+        if not connections:
+            self.log_message("🔌 [커넥션 보고] 추적된 커넥션이 없습니다.")
+            return
+
+        self.log_message(f"🔌 [커넥션 보고] 총 {len(connections)}개 (T-0 기준)")
+        for i, conn in enumerate(connections, start=1):
+            connected_at = getattr(conn, 'connected_at', None)
+            if connected_at is None:
+                continue
+            age = fire_monotonic - connected_at
+            uses_before = snapshot.get(id(conn))
+            if uses_before is None:
+                status = "🆕 신규 연결 (T-0 이후 핸드셰이크)"
+            elif conn.request_count > uses_before:
+                status = f"♻️ 재사용 ({conn.request_count - uses_before}회)"
+            else:
+                status = "💤 미사용"
+            self.log_message(
+                f"   #{i}: 나이 {age:.2f}초, 발사 전 사용 {uses_before or 0}회, {status}")
+
+
     # HTML 파싱 및 코스 필터링/정렬 로직
-    def filter_and_sort_times(self, all_times_html, start_time_str, end_time_str, target_course_names, is_reverse):
+    def filter_and_sort_times(self, all_times_html, start_time_str, end_time_str, target_course_names, is_reverse,
+                              ranking=None):
         """
         HTML을 파싱하여 시간대와 코스를 필터링하고 정렬합니다.
         [수정] 코스 필터링 로직을 좀 더 범용적으로 수정 (IN/OUT 외에도 대응)
+        [수정] 미리 컴파일된 순위표(SlotRanking)로 정렬 없이 한 번 훑어 상위 후보만 골라 반환합니다.
+        ranking이 없으면 시간대/코스/순서 조건만으로 순위표를 만듭니다.
         """
-        start_time_api = format_time_for_api(start_time_str)  # HHMM
-        end_time_api = format_time_for_api(end_time_str)  # HHMM
+        if ranking is None:
+            ranking = SlotRanking(parse_minutes(start_time_str), parse_minutes(end_time_str),
+                                  course_filter=None if target_course_names == "ALL" else target_course_names,
+                                  is_reverse=is_reverse)
 
         if not all_times_html:
             self.log_message("❌ 'getList'로부터 HTML 응답을 받지 못했습니다. 파싱 중단.")
             return []
 
-        parsed_times = []
+        available_items = self.parse_teetime_items(all_times_html)
+        if available_items is None:
+            return []
+
+        # 4~6. 필터링 + 순위 (점수표 조회, 정렬 없음)
+        with self.tracer.span("filter", items=len(available_items)) as span:
+            ranked, matched = ranking.rank(available_items)
+            span['candidates'] = matched
+
+        # 7. 상위 5개 로그 출력
+        self.log_message(f"🔍 필터링/순위 완료 ({ranking.description}) - {matched}개 발견")
+        if ranked:
+            self.log_message(f"📜 **[최종 예약 우선순위 {len(ranked)}개]**")
+            for i, (score, teetime) in enumerate(ranked):
+                self.log_message(f"   {i + 1}순위: {teetime.label} (점수 {score})")
+        else:
+            self.log_message("ℹ️ **[알림]** 필터링 조건 (시간대/코스)에 맞는 예약 가능 시간이 없습니다.")
+
+        return [teetime for _, teetime in ranked]
+
+    def parse_teetime_items(self, times_html):
+        """
+        'getList' HTML에서 예약 가능한 모든 티 타임을 (필터링 없이) 추출합니다.
+        [수정] 고속 추출기(extract_teetime_items)를 먼저 사용하고, 마크업이 달라 인식하지 못하면
+        기존 BeautifulSoup 파서로 전환합니다.
+        반환값: [TeeTime, ...], 파싱 라이브러리 오류 시 None
+        """
+        hole_cnt = self.list_filter.hole_cnt if self.list_filter is not None else None
+        with self.tracer.span("parse", bytes_in=len(times_html)) as span:
+            parsed_items = extract_teetime_items(times_html, hole_cnt)
+            if parsed_items is not None:
+                span.update(parser='fast', items=len(parsed_items))
+                self.log_message(f"🔍 HTML 파싱(고속): {len(parsed_items)}개의 예약 가능 시간 발견.")
+                return parsed_items
+
+            self.log_message("⚠️ 고속 파서가 HTML 구조를 인식하지 못했습니다. BeautifulSoup 파서로 전환합니다.")
+            parsed_items = self._parse_teetime_items_bs(times_html, hole_cnt)
+            span.update(parser='bs4', items=len(parsed_items) if parsed_items is not None else None)
+            return parsed_items
+
+    def _parse_teetime_items_bs(self, times_html, hole_cnt=None):
+        """BeautifulSoup(html.parser) 기반의 기존 파싱 로직 (고속 추출기 실패 시 Fallback)."""
+        parsed_items = []
         try:
-            soup = BeautifulSoup(all_times_html, 'html.parser')
+            soup = BeautifulSoup(times_html, 'html.parser')
 
             # 1. 예약 가능한 '<li>' 태그를 모두 찾습니다. (onclick="teetimeReserveConfirm(this)")
             available_list_items = soup.find_all('li', onclick=lambda h: h and 'teetimeReserveConfirm' in h)  #
@@ -509,6 +2848,8 @@ class APIBookingCore:
             self.log_message(f"🔍 HTML 파싱: {len(available_list_items)}개의 예약 가능 시간 발견.")
 
             for li in available_list_items:
+                if hole_cnt and li.get('data-hole-cnt', hole_cnt) != hole_cnt:
+                    continue  # [추가] 홀 수 조건 밖
                 try:
                     # 2. 핵심 정보 추출 (data-*)
                     bk_time_api = li.get('data-bookg-time')  # '1735'
@@ -519,62 +2860,240 @@ class APIBookingCore:
                     course_span = li.find('div', class_='info').find('span')
                     course_nm = course_span.text.strip() if course_span else "알수없음"  # [수정] .strip() 추가
 
-                    # 4. 시간 필터링 (UI 기준)
-                    if start_time_api <= bk_time_api <= end_time_api:
-                        # (bk_time, time_table_id, course_cd_code, course_nm)
-                        parsed_times.append(
-                            (bk_time_api, time_table_id, course_cd_code, course_nm)
-                        )
+                    parsed_items.append(TeeTime.from_api(bk_time_api, time_table_id, course_cd_code, course_nm))
                 except Exception as e:
                     self.log_message(f"⚠️ HTML 리스트 아이템 1개 파싱 중 오류: {e}")
 
         except Exception as e:
             self.log_message(f"❌ HTML 파싱 중 치명적 오류: {e}")
             self.log_message("UI_ERROR:HTML 파싱 라이브러리(BeautifulSoup) 오류 발생.")
-            return []
-
-        # 5. 코스 필터링: target_course_names (ALL, IN, OUT)에 따라 필터링
-        final_filtered_times = []
-
-        # [수정] UI에서 'ALL'을 선택하면, 코스 이름(time_info[3])과 관계없이 모두 추가합니다.
-        if target_course_names == "ALL":
-            final_filtered_times = parsed_times
-        else:
-            # UI에서 IN 또는 OUT을 선택한 경우, 파싱된 코스 이름(time_info[3])과 일치하는 것만 필터링
-            for time_info in parsed_times:
-                # time_info[3] is course_nm (e.g., 'IN' or 'OUT')
-                if time_info[3] == target_course_names:
-                    final_filtered_times.append(time_info)
-
-        # 6. 정렬
-        # (bk_time, time_table_id, course_cd_code, course_nm)
-        final_filtered_times.sort(key=lambda x: (x[0], x[2]), reverse=is_reverse)
-
-        # 7. 상위 5개 로그 출력
-        formatted_times = [f"{format_time_for_display(t[0])} ({t[3]})" for t in
-                           final_filtered_times]  # t[3] = course_nm
-
-        self.log_message(f"🔍 필터링/정렬 완료 (순서: {'역순' if is_reverse else '순차'}) - {len(final_filtered_times)}개 발견")
-        if formatted_times:
-            self.log_message("📜 **[최종 예약 우선순위 5개]**")
-            for i, time_str in enumerate(formatted_times[:5]):
-                self.log_message(f"   {i + 1}순위: {time_str}")
-        else:
-            self.log_message("ℹ️ **[알림]** 필터링 조건 (시간대/코스)에 맞는 예약 가능 시간이 없습니다.")
+            return None
 
-        return final_filtered_times
+        return parsed_items
 
-    # 예약 시도 로직 (2단계 - Check & Submit)
-    def try_reservation(self, date, time_table_id, course_cd_code, time_api, course_name):
+    # ----------------------------------------------------
+    # [추가] 스트리밍 조회: 페이지 도착 즉시 파싱 → 예약 후보 방출
+    # ----------------------------------------------------
+    def iter_list_pages(self, date):
         """
-        'checkReserveTeetimeAble' (1단계) 및 'postReserveConfirmSubmit' (2단계)를 순차적으로 시도합니다.
+        모든 'getList' 페이지를 동시에 요청하고, 도착하는 순서대로 (page_no, html)을 반환합니다.
+        html은 목록 없음이면 "", 최종 실패면 None 입니다.
+        [수정] 예상 페이지 수 + 1페이지만 먼저 요청하고, 마지막 요청 페이지에도 목록이 있으면 나머지를 추가 요청합니다.
         """
-        # format_time_for_display 함수는 정의되어 있다고 가정합니다.
-        time_display = format_time_for_display(time_api)
-
-        # ------------------------------------------------------------------
-        # ⛔ 1단계: checkReserveTeetimeAble 호출 (예약 가능 여부 확인)
-        # ------------------------------------------------------------------
+        url = self.TIME_LIST_URL
+        headers = self._get_list_headers()
+        executor = self._get_page_executor()
+        requested_pages = self._list_pages_to_request()
+
+        def submit(page_nos):
+            for page_no in page_nos:
+                future = executor.submit(self._fetch_list_page, url, headers,
+                                         self._build_list_payload(date, page_no), page_no)
+                futures[future] = page_no
+
+        futures = {}
+        page_results = {}
+        submit(range(1, requested_pages + 1))
+        try:
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    page_no = futures.pop(future)
+                    try:
+                        page_html = future.result()
+                    except Exception as e:
+                        self.log_message(f"❌ 'getList' {page_no}페이지 스트리밍 조회 예외 오류: {e}")
+                        page_html = None
+                    page_results[page_no] = page_html
+                    if page_no == requested_pages < self.MAX_LIST_PAGES and page_html != "" \
+                            and not self.stop_event.is_set():
+                        self.log_message(
+                            f"ℹ️ {page_no}페이지에도 목록이 있어 {page_no + 1}~{self.MAX_LIST_PAGES}페이지 추가 요청.")
+                        requested_pages = self.MAX_LIST_PAGES
+                        submit(range(page_no + 1, requested_pages + 1))
+                    yield page_no, page_html
+        finally:
+            # 호출 측이 목록 끝을 확인하고 일찍 멈춘 경우도 그때까지 받은 페이지로 기록
+            self._record_list_pages(page_results)
+
+    def stream_sorted_candidates(self, date, start_time_str, end_time_str, target_course_names, is_reverse,
+                                 ranking=None):
+        """
+        페이지가 도착할 때마다 파싱하여, 최종 우선순위가 확정된 후보부터 즉시 반환(yield)합니다.
+
+        'getList' 페이지는 시간 오름차순이므로, 앞 페이지들이 모두 도착하면 아직 받지 못한 후보는
+        그 페이지의 마지막 시각 이후입니다. (같은 시각은 다음 페이지와 겹칠 수 있어 포함)
+        [수정] 순위표의 상한(upper_bound)보다 점수가 높은 후보는 남은 페이지와 관계없이 순위가 확정됩니다.
+        순차 정렬에서는 기존처럼 마지막 시각보다 이른 후보가, 역순 정렬에서는 모든 페이지 도착 후 확정됩니다.
+        """
+        if ranking is None:
+            ranking = SlotRanking(parse_minutes(start_time_str), parse_minutes(end_time_str),
+                                  course_filter=None if target_course_names == "ALL" else target_course_names,
+                                  is_reverse=is_reverse)
+
+        self.log_message(f"⏳ {date} 스트리밍 조회 시작 (페이지 동시 요청, 도착 즉시 파싱)...")
+        stream_start = time.monotonic()
+
+        arrived_pages = {}  # page_no -> (파싱된 티 타임, 해당 페이지의 마지막 시각, 목록 없는 페이지 여부)
+        next_page_no = 1
+        list_ended = False  # 목록 없는 페이지가 앞 페이지들과 이어지면 이후 페이지는 볼 필요 없음
+        boundary_time = None  # 아직 받지 못한 후보는 이 시각 이후
+        edge_minutes = ()  # 첫 티 시각 (첫 페이지 기준, '첫/마지막 티 피하기' 용)
+        pending = []  # 힙: (-점수, 도착 순번, TeeTime)
+        arrival_seq = itertools.count()
+        matched = 0
+        emitted = 0
+
+        for page_no, page_html in self.iter_list_pages(date):
+            if self.stop_event.is_set(): return
+
+            if page_html is None:
+                self.log_message(f"⚠️ 'getList' {page_no}페이지 최종 실패. 해당 페이지 제외하고 진행.")
+                arrived_pages[page_no] = ([], None, False)
+            else:
+                items = self.parse_teetime_items(page_html) if page_html else []
+                items = items or []
+                last_time = max(item.minutes for item in items) if items else None
+                arrived_pages[page_no] = (items, last_time, page_html == "")
+                self.log_message(
+                    f"📥 {page_no}페이지 수신/파싱 완료: 티 타임 {len(items)}개 "
+                    f"({(time.monotonic() - stream_start) * 1000:.1f}ms)")
+
+            # 앞 페이지부터 연속으로 도착한 페이지만 점수를 매겨 확정 후보 힙에 반영
+            while not list_ended and next_page_no in arrived_pages:
+                items, last_time, list_ended = arrived_pages.pop(next_page_no)
+                next_page_no += 1
+                if last_time is None:
+                    continue
+                if boundary_time is None and ranking.avoid_edges:
+                    edge_minutes = (min(item.minutes for item in items),)
+                boundary_time = last_time
+                for item in items:
+                    score = ranking.score(item, edge_minutes)
+                    if score is not None:
+                        matched += 1
+                        heapq.heappush(pending, (-score, next(arrival_seq), item))
+
+            if list_ended:
+                break  # 목록 끝 확인: 남은 페이지는 기다리지 않음
+            if boundary_time is None or next_page_no > self.MAX_LIST_PAGES:
+                continue
+
+            # 남은 페이지의 어떤 후보보다 점수가 높으면 확정
+            bound = ranking.upper_bound(boundary_time)
+            while pending and (bound is None or -pending[0][0] > bound):
+                candidate = heapq.heappop(pending)[2]
+                emitted += 1
+                self.log_message(
+                    f"⚡ {emitted}순위 확정: {candidate.label} - "
+                    f"{(time.monotonic() - stream_start) * 1000:.1f}ms, {next_page_no - 1}페이지 기준")
+                yield candidate
+
+        # 모든 페이지 도착: 마지막 티 감점을 반영하고 남은 후보를 점수 순서대로 반환
+        if ranking.avoid_edges and boundary_time is not None:
+            pending = [(-ranking.score(item, (*edge_minutes, boundary_time)), seq, item)
+                       for _, seq, item in pending]
+            heapq.heapify(pending)
+
+        self.log_message(
+            f"🔍 스트리밍 조회 완료 ({ranking.description}) - 후보 {matched}개, 조기 확정 {emitted}개, "
+            f"나머지 {len(pending)}개 ({(time.monotonic() - stream_start) * 1000:.1f}ms)")
+        while pending:
+            yield heapq.heappop(pending)[2]
+
+    # 예약 시도 로직 (2단계 - Check & Submit)
+    def try_reservation(self, date, time_table_id, course_cd_code, time_api, course_name):
+        """
+        'checkReserveTeetimeAble' (1단계) 및 'postReserveConfirmSubmit' (2단계)를 순차적으로 시도합니다.
+        [수정] (bool, message) 대신 결과 유형이 분류된 ReservationResult를 반환합니다.
+        """
+        check_result = self.check_reservation(time_table_id)
+        if not check_result.success:
+            return check_result
+        return self.submit_reservation(date, time_table_id, time_api, course_name)
+
+    @staticmethod
+    def _classify_request_exception(e):
+        """requests/httpx 예외를 결과 유형으로 분류합니다. (HTTP 오류 상태 코드 또는 네트워크 일시 오류)"""
+        response = getattr(e, 'response', None)
+        if response is not None and response.status_code >= 400:
+            return classify_http_status(response.status_code)
+        return OUTCOME_TRANSIENT
+
+    def check_reservation(self, time_table_id):
+        """
+        [분리] ⛔ 1단계: checkReserveTeetimeAble 호출 (예약 가능 여부 확인)
+        반환값: ReservationResult (통과 시 OUTCOME_SUCCESS)
+        """
+        try:
+            with self.tracer.span("check", time_table_id=time_table_id) as span:
+                template = self._get_template('check')
+                if template is not None:
+                    # [추가] 사전 준비된 요청 틀에 timeTableId만 교체하여 전송
+                    res_step1 = self.session.send(template.build(params={"timeTableId": time_table_id}),
+                                                  timeout=10, verify=False)
+                else:
+                    url_step1, headers_step1, params_step1 = self._build_check_request(time_table_id)
+                    res_step1 = self.session.get(url_step1, headers=headers_step1, params=params_step1,
+                                                 timeout=10, verify=False)
+                self.tracer.annotate_response(span, res_step1)
+            res_step1.raise_for_status()
+
+            return self._evaluate_check_response(res_step1)
+
+        except (json.JSONDecodeError, requests.JSONDecodeError):
+            self.log_message(f"❌ 1단계('checkReserveTeetimeAble') JSON 파싱 오류: {res_step1.text[:200]}")
+            self.log_event(EVT_RESPONSE_DUMP, "JSON 파싱 실패 응답", res_step1.text)
+            return ReservationResult(OUTCOME_UNKNOWN, "1단계 JSON 파싱 오류")
+        except requests.RequestException as e:
+            self.log_message(f"❌ 1단계('checkReserveTeetimeAble') 네트워크 오류: {e}")
+            return ReservationResult(self._classify_request_exception(e), f"1단계 네트워크 오류: {e}")
+        except Exception as e:
+            self.log_message(f"❌ 1단계('checkReserveTeetimeAble') 중 예외 오류: {e}")
+            return ReservationResult(OUTCOME_UNKNOWN, f"1단계 예외 오류: {e}")
+
+    def submit_reservation(self, date, time_table_id, time_api, course_name):
+        """
+        [분리] ⛔ 2단계: postReserveConfirmSubmit 호출 (최종 예약)
+        반환값: ReservationResult (예약 완료 시 OUTCOME_SUCCESS)
+        """
+        time_display = format_time_for_display(time_api)
+
+        try:
+            self.log_event(EVT_SUBMIT_SEND, time_display, course_name)
+
+            with self.tracer.span("submit", time_table_id=time_table_id) as span:
+                template = self._get_template('submit', date)
+                if template is not None:
+                    # [추가] 사전 준비된 요청 틀에 timeTableId와 event*Time만 교체하여 전송
+                    patch = self._submit_event_times()
+                    patch["timeTableId"] = time_table_id
+                    request_step2 = template.build(data=patch)
+                    res_step2 = self.session.send(request_step2, timeout=10, verify=False)
+                else:
+                    url_step2, headers_step2, payload_step2 = self._build_submit_request(date, time_table_id)
+                    patch = payload_step2
+                    res_step2 = self.session.post(url_step2, headers=headers_step2, data=payload_step2,
+                                                  timeout=10, verify=False)
+                self.tracer.annotate_response(span, res_step2)
+            self.log_event(EVT_SUBMIT_PAYLOAD, patch)
+            res_step2.raise_for_status()
+
+            return self._evaluate_submit_response(res_step2, time_display, course_name)
+
+        except (json.JSONDecodeError, requests.JSONDecodeError):
+            self.log_message(f"❌ 2단계('postReserveConfirmSubmit') JSON 파싱 오류: {res_step2.text[:200]}")
+            self.log_event(EVT_RESPONSE_DUMP, "2단계 JSON 파싱 실패 응답", res_step2.text)
+            return ReservationResult(OUTCOME_UNKNOWN, "2단계 JSON 파싱 오류")
+        except requests.RequestException as e:
+            self.log_message(f"❌ 2단계('postReserveConfirmSubmit') 네트워크 오류: {e}")
+            return ReservationResult(self._classify_request_exception(e), f"2단계 네트워크 오류: {e}")
+        except Exception as e:
+            self.log_message(f"❌ 2단계('postReserveConfirmSubmit') 중 예외 오류: {e}")
+            return ReservationResult(OUTCOME_UNKNOWN, f"2단계 예외 오류: {e}")
+
+    def _build_check_request(self, time_table_id):
+        """1단계('checkReserveTeetimeAble') 요청의 URL, 헤더, GET 파라미터를 생성합니다."""
         url_step1 = self.BOOK_CHECK_URL
         # [수정] GOLFCLUB_SEQ 사용
         referer_url_step1 = f"{self.API_DOMAIN}/reserve/main/teetimeList?golfclubSeq={self.GOLFCLUB_SEQ}"
@@ -590,46 +3109,36 @@ class APIBookingCore:
             "reserveOrderType": "",
             "timeTableHasBookgInfoId": ""
         }
-
-        try:
-            res_step1 = self.session.get(url_step1, headers=headers_step1, params=params_step1,
-                                         timeout=10, verify=False)
-            res_step1.raise_for_status()
-
-            if 'application/json' not in res_step1.headers.get('content-type', ''):
-                self.log_message(f"❌ 1단계 오류: 서버 응답이 JSON이 아닙니다. HTML 응답 길이: {len(res_step1.text)}.")
-                self.log_message(f"📜 응답 스니펫 (HTML/Text): {res_step1.text[:100]}...")
-                return False, "1단계 오류: 예상치 못한 서버 응답 유형 (JSON 아님/세션 만료)"
-
-            data_step1 = res_step1.json()
-
-            # [수정된 성공 기준] 'result': 0 이고 'data.success': true 인지 확인
-            api_result_code = data_step1.get('result')
-            data_success = data_step1.get('data', {}).get('success')
-
-            if api_result_code == 0 and data_success is True:
-                self.log_message(f"✅ 1단계('checkReserveTeetimeAble') 성공: 예약 가능 확인됨 (Result: 0)")
-            else:
-                result_msg = data_step1.get('message', '1단계 응답 서버 메시지 없음')
-                self.log_message(
-                    f"❌ 1단계 실패 (Result Code: {api_result_code}, Data Success: {data_success}): {result_msg}")
-                self.log_message(f"📜 1단계 응답 전체: {res_step1.text}")
-                return False, f"1단계 확인 실패: 예상치 못한 서버 응답"
-
-        except requests.RequestException as e:
-            self.log_message(f"❌ 1단계('checkReserveTeetimeAble') 네트워크 오류: {e}")
-            return False, f"1단계 네트워크 오류: {e}"
-        except json.JSONDecodeError:
-            self.log_message(f"❌ 1단계('checkReserveTeetimeAble') JSON 파싱 오류: {res_step1.text[:200]}")
-            self.log_message(f"📜 JSON 파싱 실패 응답 전체: {res_step1.text}")
-            return False, "1단계 JSON 파싱 오류"
-        except Exception as e:
-            self.log_message(f"❌ 1단계('checkReserveTeetimeAble') 중 예외 오류: {e}")
-            return False, f"1단계 예외 오류: {e}"
-
-        # ------------------------------------------------------------------
-        # ⛔ 2단계: postReserveConfirmSubmit 호출 (최종 예약)
-        # ------------------------------------------------------------------
+        return url_step1, headers_step1, params_step1
+
+    def _evaluate_check_response(self, res_step1):
+        """1단계 응답을 확인하여 ReservationResult를 반환합니다. (JSON 오류는 호출 측에서 처리)"""
+        if 'application/json' not in res_step1.headers.get('content-type', ''):
+            self.log_message(f"❌ 1단계 오류: 서버 응답이 JSON이 아닙니다. HTML 응답 길이: {len(res_step1.text)}.")
+            self.log_event(EVT_RESPONSE_SNIPPET, res_step1.text)
+            # 로그인이 풀리면 JSON 대신 로그인 페이지 HTML이 돌아옴 ([수정] 그 밖의 HTML은 일시 오류)
+            outcome = self._classify_non_json_response(res_step1)
+            reason = "세션 만료" if outcome == OUTCOME_SESSION_EXPIRED else "로그인 페이지 아님"
+            return ReservationResult(outcome, f"1단계 오류: 예상치 못한 서버 응답 유형 (JSON 아님/{reason})")
+
+        data_step1 = res_step1.json()
+
+        # [수정된 성공 기준] 'result': 0 이고 'data.success': true 인지 확인
+        api_result_code = data_step1.get('result')
+        data_success = data_step1.get('data', {}).get('success')
+
+        if api_result_code == 0 and data_success is True:
+            self.log_event(EVT_CHECK_OK)
+            return ReservationResult(OUTCOME_SUCCESS)
+
+        result_msg = data_step1.get('message', '1단계 응답 서버 메시지 없음')
+        outcome = classify_server_message(data_step1.get('message'))
+        self.log_event(EVT_CHECK_FAIL, api_result_code, data_success, outcome, result_msg)
+        self.log_event(EVT_RESPONSE_DUMP, "1단계 응답", res_step1.text)
+        return ReservationResult(outcome, f"1단계 확인 실패: {result_msg}")
+
+    def _build_submit_request(self, date, time_table_id):
+        """2단계('postReserveConfirmSubmit') 요청의 URL, 헤더, Payload를 생성합니다."""
         url_step2 = self.BOOK_SUBMIT_URL
         referer_url = f"{self.API_DOMAIN}/reserve/confirm"
         headers_step2 = self.get_base_headers(referer_url)
@@ -637,9 +3146,6 @@ class APIBookingCore:
         headers_step2["Content-Type"] = "application/x-www-form-urlencoded; charset=UTF-8"
         headers_step2["Accept"] = "application/json, text/javascript, */*; q=0.01"
 
-        # [AttributeError 해결] datetime.datetime.now() 사용
-        now_kst = datetime.datetime.now(self.KST)
-
         # [✅ 최종 PayLoad] 오류 해결을 위해 'accountId'를 '1'로 고정
         payload_step2 = {
             # ----------------------------------------------
@@ -647,131 +3153,1050 @@ class APIBookingCore:
             "bookgDate": date,  # 예약 날짜
             "accountId": "1",  # <--- FIX: 하드코딩된 '1'로 오류 해결
             "timeTableId": time_table_id,
-            "playPlayerCnt": "4",
+            "playPlayerCnt": PLAY_PLAYER_CNT,
             "caddieYn": "Y",
             "genderScd": "on",
+        }
+        # 🔑 시간 스탬프 필드 (최종 예약 요청 시각)
+        payload_step2.update(self._submit_event_times())
+        return url_step2, headers_step2, payload_step2
+
+    def _submit_event_times(self):
+        """2단계 Payload의 event*Time 필드 (최종 예약 요청 시각, 밀리초까지 포함)를 반환합니다."""
+        # [AttributeError 해결] datetime.datetime.now() 사용
+        stamp = datetime.datetime.now(self.KST).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        return {
+            "eventLockTime": stamp,
+            "eventConfirmTime": stamp,
+            "eventUserCheckTime": stamp,
+        }
+
+    def _evaluate_submit_response(self, res_step2, time_display, course_name):
+        """2단계 응답으로 최종 예약 성공 여부를 판단하여 ReservationResult를 반환합니다."""
+        if 'application/json' not in res_step2.headers.get('content-type', ''):
+            self.log_message(f"❌ 2단계 오류: 서버 응답이 JSON이 아닙니다. 응답 스니펫: {res_step2.text[:100]}...")
+            outcome = self._classify_non_json_response(res_step2)
+            reason = "세션 만료" if outcome == OUTCOME_SESSION_EXPIRED else "로그인 페이지 아님"
+            return ReservationResult(outcome, f"2단계 오류: 예상치 못한 서버 응답 유형 (JSON 아님/{reason})")
+
+        data_step2 = res_step2.json()
+
+        # -------------------------------------------------------------
+        # ✅ [수정된 성공 판단 로직] - reserveCompleteInfo 객체 존재 여부로 판단
+        # -------------------------------------------------------------
+        api_result = data_step2.get('result')
+        data_success = data_step2.get('data', {}).get('success')
+        reserve_info = data_step2.get('data', {}).get('reserveCompleteInfo')
+
+        # 'result': 0, 'data.success': true, 'reserveCompleteInfo' 객체 존재 시 최종 성공
+        if api_result == 0 and data_success is True and reserve_info:
+            bookg_id = reserve_info.get('bookgInfoId', 'N/A')
+            bookg_no = reserve_info.get('bookgNo', 'N/A')
+
+            self.log_message(f"🎉 **[대성공]** 최종 예약 완료! (시간: {time_display}, 코스: {course_name})")
+            self.log_message(f"✅ 예약 ID: {bookg_id}, 예약 번호: {bookg_no}")
+
+            return ReservationResult(OUTCOME_SUCCESS, f"예약 성공 (예약번호: {bookg_no})")
+        # -------------------------------------------------------------
+
+        # 예약 실패 또는 예상치 못한 응답
+        result_code = data_step2.get('resultCode')
+        return_msg = data_step2.get('message', '서버 메시지 없음')
+
+        limited_msg = return_msg.replace('\r', ' ').replace('\n', ' ')
+        outcome = classify_server_message(data_step2.get('message'))
+        self.log_event(EVT_SUBMIT_FAIL, result_code, api_result, outcome, limited_msg)
+        self.log_event(EVT_RESPONSE_DUMP, "2단계 응답", res_step2.text)
+        return ReservationResult(outcome, return_msg)
+
+    def run_api_booking(self, inputs, sorted_available_times):
+        """
+        Attempts reservation on sorted times, up to top 5.
+        [추가] sorted_available_times는 리스트 또는 스트리밍 제너레이터(stream_sorted_candidates) 모두 가능합니다.
+        [수정] 고정 3회/3초 재시도 대신, 실패 결과 유형(ReservationResult.outcome)별 RETRY_POLICIES를 따릅니다.
+        """
+        top_candidates = itertools.islice(sorted_available_times, 5)
+        first_time_info = next(top_candidates, None)
+        if first_time_info is None:
+            self.log_message("ℹ️ 설정된 조건에 맞는 예약 가능 시간대가 없습니다. API 예약 중단.")
+            return False
+
+        target_date = inputs['target_date']
+        test_mode = inputs.get('test_mode', True)
+
+        if test_mode:
+            # 튜플 구조: (bk_time, time_table_id, course_cd_code, course_nm)
+            formatted_time = first_time_info.label
+            self.log_message(f"✅ 테스트 모드: 1순위 예약 가능 시간 확인: {formatted_time} (실제 예약 시도 안함)")
+            return True
+
+        # [추가] 투기적 동시 확인 모드: 상위 N개 후보의 1단계를 동시에 확인
+        speculative_count = int(inputs.get('speculative_checks', 1))
+        if speculative_count > 1:
+            return self.run_speculative_booking(
+                inputs, itertools.chain([first_time_info], top_candidates), speculative_count,
+                int(inputs.get('check_concurrency', speculative_count)))
+
+        if isinstance(sorted_available_times, list):
+            top_label = f"상위 {min(5, len(sorted_available_times))}개"
+        else:
+            top_label = "스트리밍 확정 순서, 최대 5개"
+        self.log_message(f"🔎 정렬된 시간 순서대로 ({top_label}) 예약 시도...")
+
+        # Try booking the top 5
+        tried_count = 0
+        for i, time_info in enumerate(itertools.chain([first_time_info], top_candidates)):
+            if self.stop_event.is_set():
+                self.log_message("🛑 예약 시도 중 중단됨.")
+                break
+            tried_count += 1
+            bk_time_api = time_info.time_api
+            time_table_id = time_info.time_table_id
+            course_cd_code = time_info.course_cd
+            course_name = time_info.course_nm
+            time_display = time_info.time_display
+
+            # 결과 유형별 재시도 루프
+            attempt = 0
+            while True:
+                if self.stop_event.is_set():
+                    self.log_message("🛑 예약 시도 중 중단됨.")
+                    return False
+                attempt += 1
+
+                self.log_event(EVT_ATTEMPT, i + 1, time_display, course_name, attempt)
+
+                result = self.try_reservation(
+                    date=target_date,
+                    time_table_id=time_table_id,
+                    course_cd_code=course_cd_code,
+                    time_api=bk_time_api,
+                    course_name=course_name
+                )
+
+                if result.success:
+                    # 최종 성공 시 전체 루프 중단
+                    return True
+
+                self.log_event(EVT_ATTEMPT_FAIL, result.outcome, result.message)
+                action, delay = self._next_retry_step(result, attempt)
+                if action == RETRY_NEXT_SLOT:
+                    break
+                if action == RETRY_RELOGIN and not self.relogin(inputs):
+                    return False
+                if delay > 0 and self.stop_event.wait(delay):
+                    self.log_message("🛑 예약 시도 중 중단됨.")
+                    return False
+
+            if not self.stop_event.is_set():
+                self.log_message(f"❗ {i + 1}순위({time_display}) {attempt}회 시도 후 최종 실패. 다음 시간대로 이동.")
+
+        if not self.stop_event.is_set():
+            self.log_message(f"❌ 상위 {tried_count}개 시간대 예약 시도 최종 실패.")
+            return False
+
+    def _next_retry_step(self, result, attempt):
+        """
+        [추가] 실패한 ReservationResult와 해당 시간대의 누적 시도 횟수로 다음 동작을 결정합니다.
+        반환값: (RETRY_NEXT_SLOT | RETRY_RELOGIN | RETRY_BACKOFF, 재시도 전 대기 시간(초))
+        """
+        policy = RETRY_POLICIES.get(result.outcome, RETRY_POLICIES[OUTCOME_UNKNOWN])
+        if policy.action == RETRY_NEXT_SLOT:
+            self.log_message("❌ [경고] 이미 예약된 타임 또는 마감. 다른 시간대로 이동합니다.")
+            return RETRY_NEXT_SLOT, 0.0
+        if attempt >= policy.max_attempts:
+            self.log_message(f"❌ [{result.outcome}] 재시도 한도({policy.max_attempts}회) 도달. 다른 시간대로 이동합니다.")
+            return RETRY_NEXT_SLOT, 0.0
+
+        delay = policy.delay(attempt)
+        if policy.action == RETRY_RELOGIN:
+            self.log_message("🔑 세션 만료로 판단됨. 재로그인 후 즉시 재시도합니다.")
+        else:
+            self.log_event(EVT_RETRY_BACKOFF, result.outcome, delay * 1000)
+        return policy.action, delay
+
+    def relogin(self, inputs):
+        """[추가] 세션 만료 시 같은 계정으로 다시 로그인합니다. 성공 여부를 반환합니다."""
+        with self.tracer.span("relogin"):
+            login_result = self.requests_login(inputs['id'], inputs['password'])
+        if login_result['result'] != 'success':
+            self.log_message(f"❌ 재로그인 실패: {login_result['message']}")
+            return False
+        self.log_message("✅ 재로그인 성공.")
+        self._save_session_cache(inputs['id'], inputs['password'])
+        return True
+
+    # ----------------------------------------------------
+    # [추가] 투기적 동시 확인: 상위 N개 후보의 1단계를 동시에, 2단계는 최우선 통과 후보에만
+    # ----------------------------------------------------
+    def run_speculative_booking(self, inputs, candidates, max_candidates, concurrency):
+        """
+        상위 max_candidates개 후보의 1단계(check)를 동시에 보내고 (동시 실행 수는 concurrency로 제한),
+        우선순위 순서대로 결과를 확인하여 가장 높은 순위의 통과 후보에 2단계(submit)를 보냅니다.
+        예약이 성공하면 아직 진행 중인 하위 후보의 결과는 무시합니다.
+        한 라운드가 모두 실패하면 RETRY_POLICIES에 따라 재시도 가능한 후보만 다시 확인합니다.
+        [수정] candidates가 스트리밍 제너레이터여도 N개가 모두 확정되기를 기다리지 않습니다. 첫 라운드는
+        별도 스레드(_feed_checks)가 후보가 확정되는 즉시 1단계를 보내고, 이 스레드는 순위 순서대로 결과를 처리합니다.
+        """
+        target_date = inputs['target_date']
+        concurrency = max(1, min(concurrency, max_candidates))
+        self.log_message(
+            f"⚡ 투기적 동시 확인: 상위 {max_candidates}개 후보 1단계를 확정 즉시 요청 (동시 {concurrency}개)...")
+
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="check")
+        feed = queue.Queue()
+        feed_done = threading.Event()
+        threading.Thread(target=self._feed_checks, name="check-feed", daemon=True,
+                         args=(itertools.islice(candidates, max_candidates), executor, feed, feed_done)).start()
+
+        def first_round():
+            while True:
+                item = feed.get()
+                if item is None:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+
+        checks = first_round()
+        tried_count = 0
+        try:
+            round_no = 0
+            while checks is not None:
+                round_no += 1
+                remaining = []
+                needs_relogin = False
+                round_delay = 0.0
+                for rank, time_info, future in checks:
+                    if self.stop_event.is_set():
+                        self.log_message("🛑 예약 시도 중 중단됨.")
+                        return False
+                    tried_count = max(tried_count, rank)
+                    label = f"{rank}순위({time_info.time_display}, {time_info.course_nm})"
+
+                    result = future.result()
+                    if result.success:
+                        result = self.submit_reservation(target_date, time_info.time_table_id, time_info.time_api,
+                                                          time_info.course_nm)
+                        if result.success:
+                            self.log_message(f"⚡ {label} 예약 성공. 나머지 후보의 확인 결과는 무시합니다.")
+                            return True
+
+                    self.log_message(f"❌ {label} 예약 시도 실패 (라운드 {round_no}) [{result.outcome}]: {result.message}")
+                    action, delay = self._next_retry_step(result, round_no)
+                    if action == RETRY_NEXT_SLOT:
+                        continue
+                    needs_relogin = needs_relogin or action == RETRY_RELOGIN
+                    round_delay = max(round_delay, delay)
+                    remaining.append((rank, time_info))
+
+                checks = None
+                if not remaining:
+                    break
+                if needs_relogin and not self.relogin(inputs):
+                    return False
+                if round_delay > 0 and self.stop_event.wait(round_delay):
+                    self.log_message("🛑 예약 시도 중 중단됨.")
+                    return False
+                checks = [(rank, time_info, executor.submit(self.check_reservation, time_info.time_table_id))
+                          for rank, time_info in remaining]
+        finally:
+            feed_done.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        self.log_message(f"❌ 투기적 동시 확인: 상위 {tried_count}개 후보 예약 최종 실패.")
+        return False
+
+    def _feed_checks(self, candidates, executor, feed, feed_done):
+        """
+        [추가] [별도 스레드] 후보 iterator에서 후보가 나오는 즉시 1단계(check)를 executor에 넣고
+        (순위, 후보, future)를 feed 큐에 넣습니다. 끝나면 None, 예외가 나면 예외 객체를 넣습니다.
+        """
+        try:
+            for rank, time_info in enumerate(candidates, start=1):
+                if feed_done.is_set() or self.stop_event.is_set():
+                    break
+                feed.put((rank, time_info, executor.submit(self.check_reservation, time_info.time_table_id)))
+        except Exception as e:
+            if not feed_done.is_set():
+                feed.put(e)
+        finally:
+            feed.put(None)
+
+
+# ============================================================
+# [추가] asyncio 기반 예약 엔진 (httpx.AsyncClient)
+# ============================================================
+class AsyncAPIBookingCore(APIBookingCore):
+    """
+    APIBookingCore의 asyncio 버전입니다. 로그인, 서버 시간 확인, getList, Check/Submit, 세션 유지를
+    하나의 이벤트 루프 위 코루틴으로 실행하여 스레드 전환 없이 요청을 겹쳐 보냅니다.
+    헤더/Payload 생성, 응답 판정, HTML 파싱 및 필터링/정렬은 APIBookingCore의 로직을 그대로 사용합니다.
+    """
+
+    def __init__(self, log_func, message_queue, stop_event, golfclub_seq, api_domain=None):
+        super().__init__(log_func, message_queue, stop_event, golfclub_seq, api_domain)
+        # 쿠키는 httpx 클라이언트가 관리 (self.session은 비어있는 requests.Session으로 남음)
+        self.client = None
+        self.http_version = None  # [추가] 첫 응답에서 협상된 프로토콜
+        self.keepalive_client = None  # [추가] 세션 유지 전용 클라이언트 (쿠키 저장소 공유, 커넥션 풀 분리)
+
+    def _new_client(self):
+        """[수정] transport가 HTTP/2이면 http2=True (서버가 협상하지 않으면 httpx가 ALPN으로 HTTP/1.1 사용)."""
+        pool_size = self.MAX_LIST_PAGES * 2
+        http2 = self.transport == TRANSPORT_HTTP2 and HTTP2_AVAILABLE
+        if self.transport == TRANSPORT_HTTP2 and not http2:
+            self.log_message("⚠️ HTTP/2 전송에 필요한 h2 패키지가 없어 HTTP/1.1로 통신합니다.")
+        self.http_version = None
+        return httpx.AsyncClient(
+            verify=False,
+            timeout=10.0,
+            http2=http2,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            event_hooks={"response": [self._record_http_version]},
+        )
+
+    async def _record_http_version(self, response):
+        """[추가] 첫 응답에서 협상된 프로토콜을 기록합니다."""
+        if self.http_version is None:
+            self.http_version = response.http_version
+            if self.transport == TRANSPORT_HTTP2 and self.http_version != "HTTP/2":
+                self.log_message(f"⚠️ 서버가 HTTP/2를 협상하지 않음 ({self.http_version}). HTTP/1.1로 통신합니다.")
+
+    def log_transport(self):
+        self.log_message(f"🔗 [async] 전송 프로토콜: {self.http_version or '미확인'}")
+
+    async def aclose(self):
+        if self.keepalive_client is not None:
+            await self.keepalive_client.aclose()
+            self.keepalive_client = None
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+        self.close()
+
+    async def _get_keepalive_client(self):
+        """
+        [추가] 세션 유지 전용 클라이언트 (커넥션 1개). 예약 클라이언트와 같은 쿠키 저장소(CookieJar 객체)를 공유하고
+        커넥션 풀은 따로 씁니다. 재로그인으로 예약 클라이언트가 바뀌면 다시 만듭니다.
+        """
+        jar = self.client.cookies.jar
+        if self.keepalive_client is None or self.keepalive_client.cookies.jar is not jar:
+            if self.keepalive_client is not None:
+                await self.keepalive_client.aclose()
+            self.keepalive_client = httpx.AsyncClient(
+                verify=False,
+                timeout=10.0,
+                cookies=jar,  # httpx.Cookies(CookieJar)는 복사하지 않고 같은 저장소를 사용
+                limits=httpx.Limits(max_connections=1, max_keepalive_connections=1),
+            )
+        return self.keepalive_client
+
+    async def _sleep(self, seconds):
+        """stop_event를 0.5초 간격으로 확인하며 대기합니다. 중단 신호가 오면 True를 반환합니다."""
+        deadline = time.monotonic() + seconds
+        while not self.stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(remaining, 0.5))
+        return True
+
+    # ----------------------------------------------------
+    # 로그인 / 서버 시간 / 세션 유지
+    # ----------------------------------------------------
+    async def async_login(self, usrid, usrpass):
+        """requests_login의 asyncio 버전."""
+        await self.aclose()
+        self.client = self._new_client()
+
+        login_get_url, login_post_url = self._login_urls()
+
+        # 1단계: 로그인 페이지 GET 요청 (세션 안정화 및 Hidden Field 확보)
+        try:
+            self.log_message("⏳ [async] 로그인 POST 전, 로그인 페이지 GET 요청으로 숨겨진 필드 확보 시도...")
+            get_headers = self.get_base_headers(login_get_url)
+            get_headers["Content-Type"] = "text/html"
+
+            with self.tracer.span("login.page") as span:
+                res_get = await self.client.get(login_get_url, headers=get_headers, timeout=5)
+                self.tracer.annotate_response(span, res_get)
+            res_get.raise_for_status()
+
+            hidden_fields = self._parse_hidden_fields(res_get.text)
+            self._log_login_page_state(res_get.cookies.get('JSESSIONID') or self.client.cookies.get('JSESSIONID'),
+                                       hidden_fields)
+
+        except httpx.HTTPError as e:
+            self.log_message(f"❌ 로그인 페이지 GET 오류: {e}")
+            return {'result': 'fail', 'message': 'Pre-login GET Network Error'}
+
+        # 2단계: 로그인 POST 요청
+        try:
+            login_headers, login_data = self._build_login_request(usrid, usrpass, hidden_fields,
+                                                                  login_get_url, login_post_url)
+            with self.tracer.span("login.post") as span:
+                res = await self.client.post(login_post_url, headers=login_headers, data=login_data, timeout=10,
+                                             follow_redirects=False)
+                self.tracer.annotate_response(span, res)
+            res.raise_for_status()
+
+            # 3단계: 로그인 성공 확인 (JSON 응답 확인)
+            return self._evaluate_login_response(res, usrid)
+
+        except httpx.HTTPError as e:
+            self.log_message(f"❌ 네트워크 오류: 로그인 실패: {e}")
+            self.log_message("UI_ERROR:로그인 중 네트워크 오류 발생!")
+            return {'result': 'fail', 'message': 'Network Error during login'}
+        except Exception as e:
+            self.log_message(f"❌ 로그인 처리 중 예기치 않은 오류 발생: {e}")
+            return {'result': 'fail', 'message': f'Unexpected Error: {e}'}
+
+    async def async_get_server_time_offset(self):
+        """get_server_time_offset의 asyncio 버전 (ServerClockEstimator 사용)."""
+        url = f"{self.API_DOMAIN}/login"
+        self.log_message("🔄 [async] 골프존 카운티 서버 시간 정밀 측정 시도 (Date 헤더 초 경계 탐지)...")
+
+        estimator = ServerClockEstimator()
+        failures = 0
+        while not estimator.done() and not self.stop_event.is_set():
+            delay = estimator.next_send_time(time.time()) - time.time()
+            if delay > 0 and await self._sleep(delay):
+                break
+
+            sample = await self._async_probe_server_date(url)
+            if sample is None:
+                failures += 1
+                if failures >= 3:
+                    break
+                continue
+            estimator.add_sample(*sample)
+
+        estimate = estimator.result()
+        if estimate is not None and estimate.uncertainty < 0.5:
+            self.last_clock_estimate = estimate
+            self._log_clock_estimate(estimate)
+            return estimate.offset
+
+        self.log_message("⚠️ 서버 시간 정밀 측정 실패. 기존 방식(Date 헤더 1회)으로 확인합니다.")
+        return await self._async_get_server_time_offset_legacy(url)
+
+    async def _async_probe_server_date(self, url):
+        """_probe_server_date의 asyncio 버전."""
+        try:
+            with self.tracer.span("clock.sample") as span:
+                send_wall = time.time()
+                response = await self.client.head(url, timeout=3)
+                recv_wall = time.time()
+                self.tracer.annotate_response(span, response)
+            server_date_str = response.headers.get("Date")
+            if not server_date_str:
+                return None
+            return send_wall, recv_wall, parsedate_to_datetime(server_date_str).timestamp()
+        except (httpx.HTTPError, TypeError, ValueError) as e:
+            self.log_message(f"⚠️ 서버 시간 샘플 요청 실패: {e}")
+            return None
+
+    async def _async_get_server_time_offset_legacy(self, url):
+        """_get_server_time_offset_legacy의 asyncio 버전 (Date 헤더 1회)."""
+        max_retries = 5
+        for attempt in range(max_retries):
+            try:
+                response = await self.client.get(url, timeout=5)
+                response.raise_for_status()
+                server_date_str = response.headers.get("Date")
+
+                if server_date_str:
+                    return self._offset_from_date_header(server_date_str)
+                self.log_message(f"⚠️ 서버 Date 헤더 없음, 재시도 ({attempt + 1}/{max_retries})...")
+            except httpx.HTTPError as e:
+                self.log_message(f"⚠️ 서버 시간 요청 실패: {e}, 재시도 ({attempt + 1}/{max_retries})...")
+            except Exception as e:
+                self.log_message(f"❌ 서버 시간 처리 중 오류: {e}")
+                return 0
+            if await self._sleep(CLOCK_RETRY_POLICY.delay(attempt + 1)):
+                return 0
+
+        self.log_message("❌ 서버 시간 확인 최종 실패. 시간 오차 보정 없이 진행합니다 (Offset=0).")
+        return 0
+
+    async def async_activate_reserve_page(self):
+        """예약 페이지 초기 진입 (세션 활성화). 성공 여부를 반환합니다."""
+        try:
+            res = await self.client.get(
+                f"{self.API_DOMAIN}/reserve/main/teetimeList?golfclubSeq={self.GOLFCLUB_SEQ}", timeout=5.0)
+            res.raise_for_status()
+            return True
+        except httpx.HTTPError as e:
+            self.log_message(f"❌ 예약 페이지 초기 진입 실패: {e}")
+            return False
+
+    async def async_keep_session_alive(self, target_dt):
+        """keep_session_alive의 asyncio 버전 (이벤트 루프의 Task로 실행)."""
+        self.log_message("✅ [async] 세션 유지 Task 시작.")
+        keep_alive_url = f"{self.API_DOMAIN}/reserve/main/teetimeList?golfclubSeq={self.GOLFCLUB_SEQ}"
+        interval_seconds = 60.0
+
+        while not self.stop_event.is_set() and datetime.datetime.now(self.KST) < target_dt:
+            try:
+                headers = self.get_base_headers(keep_alive_url)
+                headers["Content-Type"] = "application/json"
+                client = await self._get_keepalive_client()  # [수정] 예약 클라이언트와 커넥션 풀 분리
+                await client.get(keep_alive_url, headers=headers, timeout=10)
+                self.log_message("💚 [세션 유지] 세션 유지 요청 완료.")
+            except httpx.HTTPError as e:
+                self.log_message(f"❌ [세션 유지] 통신 오류 발생: {e}")
+
+            remaining = (target_dt - datetime.datetime.now(self.KST)).total_seconds()
+            if await self._sleep(max(0.0, min(interval_seconds, remaining))):
+                break
+
+        if self.stop_event.is_set():
+            self.log_message("🛑 세션 유지 Task: 중단 신호 감지. 종료합니다.")
+        else:
+            self.log_message("✅ 세션 유지 Task: 예약 정시 도달. 종료합니다.")
+
+    # ----------------------------------------------------
+    # getList (모든 페이지를 하나의 루프에서 동시에)
+    # ----------------------------------------------------
+    async def async_get_all_available_times(self, date):
+        """
+        모든 'getList' 페이지를 asyncio.gather로 동시에 요청하고 페이지 순서대로 조합합니다.
+        [수정] 예상 페이지 수 + 1페이지만 먼저 요청하고, 마지막 요청 페이지에도 목록이 있으면 나머지를 추가 요청합니다.
+        """
+        max_pages = self.MAX_LIST_PAGES
+        requested_pages = self._list_pages_to_request()
+        self.log_message(f"⏳ [async] {date} 예약 가능 시간대 동시 조회 중 (getList, {requested_pages}/{max_pages}페이지)...")
+
+        url = self.TIME_LIST_URL
+        headers = self._get_list_headers()
+        page_results = {}
+
+        async def fetch_pages(page_nos):
+            results = await asyncio.gather(*[
+                self._async_fetch_list_page(url, headers, self._build_list_payload(date, page_no), page_no)
+                for page_no in page_nos
+            ])
+            page_results.update(zip(page_nos, results))
+
+        fetch_start = time.monotonic()
+        await fetch_pages(range(1, requested_pages + 1))
+        if requested_pages < max_pages and page_results.get(requested_pages) != "" and not self.stop_event.is_set():
+            self.log_message(f"ℹ️ {requested_pages}페이지에도 목록이 있어 {requested_pages + 1}~{max_pages}페이지 추가 요청.")
+            await fetch_pages(range(requested_pages + 1, max_pages + 1))
+        elapsed_ms = (time.monotonic() - fetch_start) * 1000
+        self.last_fetch_stats = {'mode': 'async', 'elapsed_ms': elapsed_ms}
+        self.log_message(f"⏱️ [async] 동시 조회 소요: {elapsed_ms:.1f}ms ({len(page_results)}페이지 요청)")
+
+        if self.stop_event.is_set(): return None
+        self._record_list_pages(page_results)
+
+        all_times_html_parts = self._join_list_pages(page_results)
+
+        if not all_times_html_parts:
+            self.log_message("❌ 모든 페이지에서 티 타임 목록 조회 실패.")
+            return None
+
+        combined_html = "".join(all_times_html_parts)
+        self.log_message(f"✅ 총 {len(all_times_html_parts)}개 페이지 HTML 조합 완료. {len(combined_html)} 길이.")
+        return combined_html
+
+    async def _async_fetch_list_page(self, url, headers, payload, page_no, check_filter=True):
+        """_fetch_list_page의 asyncio 버전. HTML (목록 없음은 ""), 최종 실패 시 None."""
+        max_attempts = 3
+        timeout_seconds = 3.0
+
+        for attempt in range(1, max_attempts + 1):
+            if self.stop_event.is_set(): return None
+            try:
+                self.log_event(EVT_GETLIST_TRY, page_no, attempt, max_attempts)
+                with self.tracer.span("getList", page=page_no, attempt=attempt) as span:
+                    # [수정] 본문을 전송된 그대로 읽어 직접 풀고 풀기 시간을 기록
+                    async with self.client.stream("POST", url, headers=headers, data=payload,
+                                                  timeout=timeout_seconds) as res:
+                        raw = b"".join([chunk async for chunk in res.aiter_raw()])
+                    page_text, body_stats = decode_response_text(raw, res.headers, res.encoding)
+                    self.tracer.annotate_response(span, res, body_stats)
+                res.raise_for_status()
+
+                page_html = self._evaluate_list_response(res, page_no, page_text, check_filter)
+                if page_html is None:
+                    continue
+                return page_html
+
+            except httpx.HTTPError as e:
+                error_msg = f"❌ 티 타임 조회 통신 오류 ({type(e).__name__}): {e}"
+                if attempt < max_attempts:
+                    self.log_message(f"{error_msg}, ... 즉시 재시도...")
+                    continue
+                self.log_message(f"❌ 최종 ({max_attempts}회) 시도 실패: {error_msg}")
+                return None
+            except Exception as e:
+                self.log_message(f"❌ 'getList' {page_no}페이지 예외 오류: {e}")
+                return None
+
+        self.log_message(f"❌ 'getList' {page_no}페이지 응답 유형 오류 {max_attempts}회 반복. 실패로 처리.")
+        return None
+
+    async def async_verify_list_filter(self, date=None):
+        """verify_list_filter의 asyncio 버전."""
+        if self.list_filter is None or not self.list_filter.server_side:
+            return
+        date = date or datetime.datetime.now(self.KST).strftime('%Y%m%d')
+        with self.tracer.span("getList.verify_filter", date=date):
+            expected = await self._async_fetch_list_items(date, server_side=False)
+            found = await self._async_fetch_list_items(date, server_side=True) if expected else None
+        self._apply_filter_verification(date, expected, found)
+
+    async def _async_fetch_list_items(self, date, server_side):
+        """_fetch_list_items의 asyncio 버전."""
+        headers = self._get_list_headers()
+        items = []
+        for page_no in range(1, self.MAX_LIST_PAGES + 1):
+            page_html = await self._async_fetch_list_page(self.TIME_LIST_URL, headers,
+                                                          self._verify_payload(date, page_no, server_side),
+                                                          page_no, check_filter=server_side)
+            if page_html is None:
+                return None
+            if not page_html:
+                break
+            items.extend(self.parse_teetime_items(page_html) or [])
+        return items
+
+    # ----------------------------------------------------
+    # [추가] 로그인 세션 캐시 (쿠키는 httpx 클라이언트 저장소 사용)
+    # ----------------------------------------------------
+    def export_session_state(self):
+        return {'member_id': self.member_id, 'cookies': export_cookie_jar(self.client.cookies.jar)}
+
+    async def async_login_with_cache(self, usrid, usrpass):
+        """login_with_cache의 asyncio 버전."""
+        state = self.session_cache.load(self.API_DOMAIN, usrid, usrpass) if self.session_cache else None
+        if state:
+            await self.aclose()
+            self.client = self._new_client()
+            restore_cookie_jar(self.client.cookies.jar, state.get('cookies', []))
+            self.member_id = state.get('member_id')
+            if await self.async_validate_session():
+                self._log_session_reused(state)
+                return {'result': 'success', 'message': 'Cached Session', 'cached': True}
+            self.log_message("ℹ️ 저장된 로그인 세션이 만료되었습니다. 전체 로그인을 진행합니다.")
+            self.session_cache.clear(self.API_DOMAIN, usrid)
+
+        login_result = await self.async_login(usrid, usrpass)
+        if login_result['result'] == 'success':
+            self._save_session_cache(usrid, usrpass)
+        return login_result
+
+    async def async_validate_session(self):
+        """validate_session의 asyncio 버전."""
+        url = f"{self.API_DOMAIN}/reserve/main/teetimeList?golfclubSeq={self.GOLFCLUB_SEQ}"
+        headers = self.get_base_headers(url)
+        try:
+            with self.tracer.span("session.validate") as span:
+                res = await self.client.get(url, headers=headers, timeout=5)
+                self.tracer.annotate_response(span, res)
+        except httpx.HTTPError as e:
+            self.log_message(f"⚠️ 저장된 세션 확인 요청 실패: {e}")
+            return False
+        return self._is_authenticated_response(res)
+
+    async def async_wait_session_ready(self, timeout=SESSION_READY_TIMEOUT):
+        """wait_session_ready의 asyncio 버전."""
+        deadline = time.monotonic() + timeout
+        for attempt in range(1, SESSION_READY_POLICY.max_attempts + 1):
+            if await self.async_validate_session():
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or await self._sleep(min(remaining, SESSION_READY_POLICY.delay(attempt))):
+                break
+        return False
+
+    async def async_probe_connections(self, count):
+        """probe_connections의 asyncio 버전. httpx 풀은 커넥션 추적이 없어 응답 수만 반환합니다."""
+        url = f"{self.API_DOMAIN}/reserve/main/teetimeList?golfclubSeq={self.GOLFCLUB_SEQ}"
+        headers = self.get_base_headers(url)
+
+        async def ping():
+            try:
+                await self.client.head(url, headers=headers, timeout=3.0)
+                return True
+            except httpx.HTTPError:
+                return False
+
+        return sum(await asyncio.gather(*(ping() for _ in range(count))))
+
+    # ----------------------------------------------------
+    # 예약 (Check & Submit)
+    # ----------------------------------------------------
+    async def async_try_reservation(self, date, time_table_id, course_cd_code, time_api, course_name):
+        """try_reservation의 asyncio 버전. ReservationResult를 반환합니다."""
+        check_result = await self.async_check_reservation(time_table_id)
+        if not check_result.success:
+            return check_result
+        return await self.async_submit_reservation(date, time_table_id, time_api, course_name)
+
+    async def async_check_reservation(self, time_table_id):
+        """check_reservation의 asyncio 버전. ⛔ 1단계: checkReserveTeetimeAble"""
+        url_step1, headers_step1, params_step1 = self._build_check_request(time_table_id)
+        try:
+            with self.tracer.span("check", time_table_id=time_table_id) as span:
+                res_step1 = await self.client.get(url_step1, headers=headers_step1, params=params_step1, timeout=10)
+                self.tracer.annotate_response(span, res_step1)
+            res_step1.raise_for_status()
+
+            return self._evaluate_check_response(res_step1)
+
+        except httpx.HTTPError as e:
+            self.log_message(f"❌ 1단계('checkReserveTeetimeAble') 네트워크 오류: {e}")
+            return ReservationResult(self._classify_request_exception(e), f"1단계 네트워크 오류: {e}")
+        except ValueError:
+            self.log_message(f"❌ 1단계('checkReserveTeetimeAble') JSON 파싱 오류: {res_step1.text[:200]}")
+            return ReservationResult(OUTCOME_UNKNOWN, "1단계 JSON 파싱 오류")
+        except Exception as e:
+            self.log_message(f"❌ 1단계('checkReserveTeetimeAble') 중 예외 오류: {e}")
+            return ReservationResult(OUTCOME_UNKNOWN, f"1단계 예외 오류: {e}")
+
+    async def async_submit_reservation(self, date, time_table_id, time_api, course_name):
+        """submit_reservation의 asyncio 버전. ⛔ 2단계: postReserveConfirmSubmit"""
+        time_display = format_time_for_display(time_api)
+        url_step2, headers_step2, payload_step2 = self._build_submit_request(date, time_table_id)
+        try:
+            self.log_event(EVT_SUBMIT_SEND, time_display, course_name)
+            with self.tracer.span("submit", time_table_id=time_table_id) as span:
+                res_step2 = await self.client.post(url_step2, headers=headers_step2, data=payload_step2, timeout=10)
+                self.tracer.annotate_response(span, res_step2)
+            self.log_event(EVT_SUBMIT_PAYLOAD, payload_step2)
+            res_step2.raise_for_status()
+
+            return self._evaluate_submit_response(res_step2, time_display, course_name)
+
+        except httpx.HTTPError as e:
+            self.log_message(f"❌ 2단계('postReserveConfirmSubmit') 네트워크 오류: {e}")
+            return ReservationResult(self._classify_request_exception(e), f"2단계 네트워크 오류: {e}")
+        except ValueError:
+            self.log_message(f"❌ 2단계('postReserveConfirmSubmit') JSON 파싱 오류: {res_step2.text[:200]}")
+            return ReservationResult(OUTCOME_UNKNOWN, "2단계 JSON 파싱 오류")
+        except Exception as e:
+            self.log_message(f"❌ 2단계('postReserveConfirmSubmit') 중 예외 오류: {e}")
+            return ReservationResult(OUTCOME_UNKNOWN, f"2단계 예외 오류: {e}")
+
+    async def async_relogin(self, inputs):
+        """relogin의 asyncio 버전."""
+        with self.tracer.span("relogin"):
+            login_result = await self.async_login(inputs['id'], inputs['password'])
+        if login_result['result'] != 'success':
+            self.log_message(f"❌ 재로그인 실패: {login_result['message']}")
+            return False
+        self.log_message("✅ 재로그인 성공.")
+        self._save_session_cache(inputs['id'], inputs['password'])
+        return True
+
+    async def async_run_api_booking(self, inputs, sorted_available_times):
+        """run_api_booking의 asyncio 버전 (상위 5개, 결과 유형별 재시도 정책)."""
+        if not sorted_available_times:
+            self.log_message("ℹ️ 설정된 조건에 맞는 예약 가능 시간대가 없습니다. API 예약 중단.")
+            return False
+
+        target_date = inputs['target_date']
+        if inputs.get('test_mode', True):
+            first_time_info = sorted_available_times[0]
+            formatted_time = first_time_info.label
+            self.log_message(f"✅ 테스트 모드: 1순위 예약 가능 시간 확인: {formatted_time} (실제 예약 시도 안함)")
+            return True
+
+        top_candidates = sorted_available_times[:5]
+
+        # [추가] 투기적 동시 확인 모드
+        speculative_count = int(inputs.get('speculative_checks', 1))
+        if speculative_count > 1:
+            return await self.async_run_speculative_booking(
+                inputs, top_candidates, speculative_count,
+                int(inputs.get('check_concurrency', speculative_count)))
+
+        self.log_message(f"🔎 정렬된 시간 순서대로 (상위 {len(top_candidates)}개) 예약 시도...")
+
+        for i, time_info in enumerate(top_candidates):
+            bk_time_api, time_table_id = time_info.time_api, time_info.time_table_id
+            course_cd_code, course_name = time_info.course_cd, time_info.course_nm
+            time_display = time_info.time_display
+            attempt = 0
+            while True:
+                if self.stop_event.is_set():
+                    self.log_message("🛑 예약 시도 중 중단됨.")
+                    return False
+                attempt += 1
+
+                self.log_event(EVT_ATTEMPT, i + 1, time_display, course_name, attempt)
+                result = await self.async_try_reservation(
+                    target_date, time_table_id, course_cd_code, bk_time_api, course_name)
+                if result.success:
+                    return True
+
+                self.log_event(EVT_ATTEMPT_FAIL, result.outcome, result.message)
+                action, delay = self._next_retry_step(result, attempt)
+                if action == RETRY_NEXT_SLOT:
+                    break
+                if action == RETRY_RELOGIN and not await self.async_relogin(inputs):
+                    return False
+                if delay > 0 and await self._sleep(delay):
+                    return False
+
+            if not self.stop_event.is_set():
+                self.log_message(f"❗ {i + 1}순위({time_display}) {attempt}회 시도 후 최종 실패. 다음 시간대로 이동.")
+
+        self.log_message(f"❌ 상위 {len(top_candidates)}개 시간대 예약 시도 최종 실패.")
+        return False
+
+    async def async_run_speculative_booking(self, inputs, candidates, max_candidates, concurrency):
+        """run_speculative_booking의 asyncio 버전 (동시 실행 수는 asyncio.Semaphore로 제한)."""
+        target_date = inputs['target_date']
+        candidates = list(candidates[:max_candidates])
+        concurrency = max(1, min(concurrency, len(candidates)))
+        self.log_message(
+            f"⚡ [async] 투기적 동시 확인: 상위 {len(candidates)}개 후보 1단계 동시 요청 (동시 {concurrency}개)...")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def limited_check(time_table_id):
+            async with semaphore:
+                return await self.async_check_reservation(time_table_id)
+
+        remaining = list(enumerate(candidates, start=1))
+        tasks = []
+        try:
+            round_no = 0
+            while remaining:
+                round_no += 1
+                tasks = [(rank, time_info, asyncio.create_task(limited_check(time_info.time_table_id)))
+                         for rank, time_info in remaining]
+                remaining = []
+                needs_relogin = False
+                round_delay = 0.0
+                for rank, time_info, task in tasks:
+                    if self.stop_event.is_set():
+                        self.log_message("🛑 예약 시도 중 중단됨.")
+                        return False
+                    label = f"{rank}순위({time_info.time_display}, {time_info.course_nm})"
+
+                    result = await task
+                    if result.success:
+                        result = await self.async_submit_reservation(target_date, time_info.time_table_id,
+                                                                     time_info.time_api, time_info.course_nm)
+                        if result.success:
+                            self.log_message(f"⚡ {label} 예약 성공. 나머지 후보의 확인 결과는 무시합니다.")
+                            return True
+
+                    self.log_message(f"❌ {label} 예약 시도 실패 (라운드 {round_no}) [{result.outcome}]: {result.message}")
+                    action, delay = self._next_retry_step(result, round_no)
+                    if action == RETRY_NEXT_SLOT:
+                        continue
+                    needs_relogin = needs_relogin or action == RETRY_RELOGIN
+                    round_delay = max(round_delay, delay)
+                    remaining.append((rank, time_info))
+
+                if remaining and needs_relogin and not await self.async_relogin(inputs):
+                    return False
+                if remaining and round_delay > 0 and await self._sleep(round_delay):
+                    return False
+        finally:
+            for _, _, task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        self.log_message(f"❌ 투기적 동시 확인: 상위 {len(candidates)}개 후보 예약 최종 실패.")
+        return False
+
+
+async def async_wait_until(target_dt_kst, stop_event, message_queue, log_prefix="프로그램 실행", timing_stats=None):
+    """wait_until의 asyncio 버전: 이벤트 루프를 막지 않고 대기하며, 마지막 FIRE_SPIN_SECONDS만 루프에서 busy-wait 합니다."""
+    log_message(f"⏳ {log_prefix} 대기중: {target_dt_kst.strftime('%H:%M:%S.%f')[:-3]} (KST 기준)", message_queue)
+
+    remaining = (target_dt_kst - datetime.datetime.now(KST)).total_seconds()
+    if remaining <= 0.001:
+        log_message(f"⚠️ 목표 시간이 이미 지났거나 도달했습니다. 즉시 실행.", message_queue)
+        return None
 
-            # 🔑 시간 스탬프 필드 (최종 예약 요청 시각)
-            "eventLockTime": now_kst.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],  # 밀리초까지 포함
-            "eventConfirmTime": now_kst.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
-            "eventUserCheckTime": now_kst.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
-        }
-        self.log_message(f"🔎 2단계 PayLoad 전송 직전 값: {payload_step2}")
+    deadline = time.monotonic() + remaining
+    while not stop_event.is_set():
+        remaining = deadline - time.monotonic()
+        if remaining <= FIRE_SPIN_SECONDS:
+            break
+        await asyncio.sleep(min(remaining - FIRE_SPIN_SECONDS, 0.5))
 
-        try:
-            self.log_message(f"🚀 **[최종 시도]** {time_display} ({course_name}) 예약 요청 전송...")
+    if stop_event.is_set():
+        log_message("🛑 대기 중 중단 신호 수신.", message_queue)
+        return None
 
-            res_step2 = self.session.post(url_step2, headers=headers_step2, data=payload_step2,
-                                          timeout=10, verify=False)
-            res_step2.raise_for_status()
+    while time.monotonic() < deadline:
+        pass
 
-            data_step2 = res_step2.json()
+    error_ms = (time.monotonic() - deadline) * 1000
+    if timing_stats is not None:
+        timing_stats.record(log_prefix, error_ms)
+
+    actual_diff = (datetime.datetime.now(KST) - target_dt_kst).total_seconds()
+    log_message(
+        f"✅ 목표 시간 도달! {log_prefix} 즉시 실행. (종료 시각 차이: {actual_diff * 1000:.3f}ms, "
+        f"monotonic 발사 오차: {error_ms:.3f}ms)", message_queue)
+    return error_ms
+
+
+async def async_start_pre_process(message_queue, stop_event, inputs):
+    """start_pre_process의 asyncio 버전. 같은 inputs dict를 사용합니다."""
+    core = AsyncAPIBookingCore(log_message, message_queue, stop_event, inputs['golfclub_seq'],
+                               inputs.get('api_domain'))
+    keep_alive_task = None
+    timing_stats = FireTimingStats()
+    tracer = PipelineTracer()
+    core.tracer = tracer
+    hot_log = core.hot_log = inputs.get('hot_logger') or HotPathLogger()  # [추가] 핫 패스 로거
+    readiness = ReadinessTracker(tracer)  # [추가] 발사 준비 상태 (확인 요청 기준)
+    core.warm_connection_count = int(inputs.get('warm_connections', core.warm_connection_count))
+    try:
+        ranking = compile_slot_ranking(inputs, message_queue)  # [추가] 선호도 순위표 (골든 타임 전 컴파일)
+
+        # 1. Login ([수정] 저장된 세션이 유효하면 재사용)
+        core.session_cache = make_session_cache(inputs, message_queue)
+        core.page_counts = make_page_count_store(inputs)
+        core.list_filter = make_list_filter(inputs, message_queue)
+        core.accept_encoding = inputs.get('accept_encoding') or ACCEPT_ENCODING
+        core.transport = inputs.get('transport', TRANSPORT_HTTP1)
+        log_message("🔒 [async] 로그인 시도...", message_queue)
+        login_result = await core.async_login_with_cache(inputs['id'], inputs['password'])
+        if login_result['result'] != 'success':
+            log_message(f"❌ 로그인 실패: {login_result['message']}", message_queue)
+            return
+        if login_result.get('cached'):
+            log_message("✅ 저장된 세션으로 로그인 완료. (세션 활성화 대기 생략)", message_queue)
+            readiness.reach(READY_LOGGED_IN, "저장된 세션, 확인 요청 1회")
+        else:
+            log_message("✅ 로그인 성공.", message_queue)
+            # [수정] 고정 2초 대기 대신 세션 확인 요청이 성공할 때까지만 대기 (최대 2초)
+            log_message(f"⏳ 로그인 성공. 세션 활성화 확인 중 (최대 {SESSION_READY_TIMEOUT:.0f}초)...", message_queue)
+            session_ready = await core.async_wait_session_ready()
+            readiness.reach(READY_LOGGED_IN, "세션 확인 완료" if session_ready else "세션 확인 실패, 제한 시간 경과")
+        core.log_transport()  # [추가] 협상된 전송 프로토콜 (HTTP/2 → HTTP/1.1 전환 여부)
+        if stop_event.is_set(): return
 
-            # -------------------------------------------------------------
-            # ✅ [수정된 성공 판단 로직] - reserveCompleteInfo 객체 존재 여부로 판단
-            # -------------------------------------------------------------
-            api_result = data_step2.get('result')
-            data_success = data_step2.get('data', {}).get('success')
-            reserve_info = data_step2.get('data', {}).get('reserveCompleteInfo')
+        # 2. Server Time Check & Target Time Calculation (Initial Offset)
+        time_offset = await core.async_get_server_time_offset()
+        readiness.reach(READY_CLOCK_SYNCED, describe_clock_sync(core.last_clock_estimate))
+        target_dt_naive = datetime.datetime.strptime(f"{inputs['run_date']}{inputs['run_time']}", '%Y%m%d%H:%M:%S')
+        target_dt_kst = KST.localize(target_dt_naive)
+        target_local_time_kst = target_dt_kst - datetime.timedelta(seconds=time_offset)
+        log_message(
+            f"✅ [초기 목표 시간] Local KST 기준: {target_local_time_kst.strftime('%H:%M:%S.%f')[:-3]} (Offset: {time_offset:.3f}초 반영)",
+            message_queue)
+        if stop_event.is_set(): return
 
-            # 'result': 0, 'data.success': true, 'reserveCompleteInfo' 객체 존재 시 최종 성공
-            if api_result == 0 and data_success is True and reserve_info:
-                bookg_id = reserve_info.get('bookgInfoId', 'N/A')
-                bookg_no = reserve_info.get('bookgNo', 'N/A')
+        # 3. Initial Reservation Page Access for Session
+        log_message(f"🔎 **[선행 작업]** 예약 페이지 초기 진입 (세션 활성화)...", message_queue)
+        if not await core.async_activate_reserve_page():
+            log_message("UI_ERROR:예약 페이지(세션) 초기화 실패로 예약 프로세스 중단.", message_queue)
+            return
+        log_message("✅ 예약 페이지 초기 진입 완료. 세션 활성화.", message_queue)
+        readiness.reach(READY_RESERVE_PAGE)
 
-                self.log_message(f"🎉 **[대성공]** 최종 예약 완료! (시간: {time_display}, 코스: {course_name})")
-                self.log_message(f"✅ 예약 ID: {bookg_id}, 예약 번호: {bookg_no}")
+        # [추가] 서버 측 검색 조건이 티 타임을 빠뜨리지 않는지 요청 틀 준비 전에 확인 (사용 시)
+        await core.async_verify_list_filter()
+        if stop_event.is_set(): return
 
-                return True, f"예약 성공 (예약번호: {bookg_no})"
-            # -------------------------------------------------------------
+        # 4. Session Keep-Alive Task Start (같은 이벤트 루프에서 실행)
+        keep_alive_dt = target_local_time_kst - datetime.timedelta(seconds=5)
+        keep_alive_task = asyncio.create_task(core.async_keep_session_alive(keep_alive_dt))
 
-            # 예약 실패 또는 예상치 못한 응답
-            else:
-                result_code = data_step2.get('resultCode')
-                return_msg = data_step2.get('message', '서버 메시지 없음')
+        # [추가] 커넥션 준비 확인 및 발사 준비 상태 보고
+        if core.warm_connection_count > 0:
+            opened = await core.async_probe_connections(core.warm_connection_count)
+            readiness.reach(READY_CONNECTIONS_WARM, f"{opened}/{core.warm_connection_count}개 응답")
+        else:
+            readiness.reach(READY_CONNECTIONS_WARM, "웜업 사용 안함")
+        log_readiness(readiness, target_local_time_kst, message_queue)
+        if stop_event.is_set(): return
 
-                limited_msg = return_msg.replace('\r', ' ').replace('\n', ' ')
-                self.log_message(
-                    f"❌ 2단계('postReserveConfirmSubmit') 실패 (Result Code: {result_code}/Result: {api_result}): {limited_msg}")
-                self.log_message(f"📜 2단계 응답 전체: {res_step2.text}")
-                return False, return_msg
+        # 5. Final Offset Check Point (30 seconds before target time)
+        countdown_start_time = target_dt_kst - datetime.timedelta(seconds=30)
+        if datetime.datetime.now(KST) < countdown_start_time:
+            await async_wait_until(countdown_start_time, stop_event, message_queue, "최종 시간 보정 대기",
+                                   timing_stats)
+            if stop_event.is_set(): return
 
-        except requests.RequestException as e:
-            self.log_message(f"❌ 2단계('postReserveConfirmSubmit') 네트워크 오류: {e}")
-            return False, f"2단계 네트워크 오류: {e}"
-        except json.JSONDecodeError:
-            self.log_message(f"❌ 2단계('postReserveConfirmSubmit') JSON 파싱 오류: {res_step2.text[:200]}")
-            self.log_message(f"📜 2단계 JSON 파싱 실패 응답 전체: {res_step2.text}")
-            return False, "2단계 JSON 파싱 오류"
-        except Exception as e:
-            self.log_message(f"❌ 2단계('postReserveConfirmSubmit') 중 예외 오류: {e}")
-            return False, f"2단계 예외 오류: {e}"
+            log_message("🔄 최종 예약 30초 전: 서버 시간 오차 재측정 및 보정 (부하 최소화 시점)", message_queue)
+            final_time_offset = await core.async_get_server_time_offset()
+            target_local_time_kst = target_dt_kst - datetime.timedelta(seconds=final_time_offset)
+            log_message(
+                f"✅ 최종 목표 시간 재확정 (Local KST): {target_local_time_kst.strftime('%H:%M:%S.%f')[:-3]} (최종 Offset: {final_time_offset:.3f}초 반영)",
+                message_queue)
+        else:
+            log_message("⚠️ [시간 경과] 이미 최종 예약 30초 전 시점을 지났습니다. 초기 오프셋으로 즉시 실행합니다.", message_queue)
 
-    def run_api_booking(self, inputs, sorted_available_times):
-        """Attempts reservation on sorted times, up to top 5, with 3-retry logic."""
-        if not sorted_available_times:
-            self.log_message("ℹ️ 설정된 조건에 맞는 예약 가능 시간대가 없습니다. API 예약 중단.")
-            return False
+        # 6. Wait until the Final Target Time ([추가] 발사 오프셋 반영)
+        if inputs.get('rehearsal_before_open'):
+            log_message("ℹ️ 실행 전 리허설은 스레드 엔진에서만 지원합니다. 입력된 예약 지연/발사 오프셋을 사용합니다.",
+                        message_queue)
+        fire_time_kst = apply_fire_offset(target_local_time_kst, inputs.get('fire_offset', 0.0), message_queue)
+        await async_wait_until(fire_time_kst, stop_event, message_queue, "최종 예약 시도", timing_stats)
+        tracer.mark('T-0')
+        hot_log.min_level = inputs.get('critical_log_level', LOG_INFO)  # [추가] 골든 타임 구간: 응답 덤프 생략
+        if stop_event.is_set(): return
 
-        target_date = inputs['target_date']
-        test_mode = inputs.get('test_mode', True)
+        # 7. Apply Booking Delay (예약 지연)
+        booking_delay = inputs.get('booking_delay', 0.0)
+        if booking_delay > 0.001:
+            log_message(f"⏳ 예약 지연 {booking_delay:.3f}초 적용...", message_queue)
+            if await core._sleep(booking_delay): return
 
-        if test_mode:
-            # 튜플 구조: (bk_time, time_table_id, course_cd_code, course_nm)
-            first_time_info = sorted_available_times[0]
-            formatted_time = f"{format_time_for_display(first_time_info[0])} ({first_time_info[3]})"
-            self.log_message(f"✅ 테스트 모드: 1순위 예약 가능 시간 확인: {formatted_time} (실제 예약 시도 안함)")
-            return True
+        # 8. Get Available Times (모든 페이지 동시 요청)
+        log_message(f"🔎 🚀 **[골든 타임]** 티 타임 조회 시작 (async)...", message_queue)
+        all_times_html = await core.async_get_all_available_times(inputs['target_date'])
+        if not all_times_html:
+            log_message("❌ 티 타임 목록 조회 실패. 예약 프로세스 중단.", message_queue)
+            return
+        if stop_event.is_set(): return
 
-        self.log_message(f"🔎 정렬된 시간 순서대로 (상위 {min(5, len(sorted_available_times))}개) 예약 시도...")
+        # 9. Filter and Sort Times
+        sorted_available_times = core.filter_and_sort_times(
+            all_times_html=all_times_html,
+            start_time_str=inputs['start_time'],
+            end_time_str=inputs['end_time'],
+            target_course_names=inputs['course_type'],
+            is_reverse=inputs['order'] == ORDER_REVERSE,
+            ranking=ranking
+        )
+        if stop_event.is_set(): return
 
-        # Try booking the top 5
-        for i, time_info in enumerate(sorted_available_times[:5]):
-            if self.stop_event.is_set():
-                self.log_message("🛑 예약 시도 중 중단됨.")
-                break
+        # 10. Run API Booking attempts
+        await core.async_run_api_booking(inputs, sorted_available_times)
 
-            # 튜플 구조: (bk_time, time_table_id, course_cd_code, course_nm)
-            bk_time_api = time_info[0]
-            time_table_id = time_info[1]
-            course_cd_code = time_info[2]
-            course_name = time_info[3]
-            time_display = format_time_for_display(bk_time_api)
-
-            # 3회 재시도 루프
-            for attempt in range(1, 4):
-                if self.stop_event.is_set():
-                    self.log_message("🛑 예약 시도 중 중단됨.")
-                    return False
+    finally:
+        if keep_alive_task is not None and not keep_alive_task.done():
+            keep_alive_task.cancel()
+        await core.aclose()
+        finish_hot_logger(hot_log, inputs, message_queue)
+        log_timing_histogram(timing_stats, message_queue)
+        export_pipeline_trace(tracer, message_queue, inputs.get('trace_dir', TRACE_DIR))
 
-                self.log_message(f"⭐ {i + 1}순위({time_display}, {course_name}) 예약 시도 ({attempt}/3회)...")
 
-                success, message = self.try_reservation(
-                    date=target_date,
-                    time_table_id=time_table_id,
-                    course_cd_code=course_cd_code,
-                    time_api=bk_time_api,
-                    course_name=course_name
-                )
+def start_pre_process_async(message_queue, stop_event, inputs):
+    """Worker 스레드 진입점: asyncio 엔진(async_start_pre_process)을 새 이벤트 루프에서 실행합니다."""
+    log_message("[INFO] ⚙️ 예약 시작 조건 확인 완료. (asyncio 엔진)", message_queue)
+    try:
+        if httpx is None:
+            log_message("UI_ERROR:asyncio 엔진에 필요한 httpx 패키지가 설치되어 있지 않습니다. (pip install httpx)",
+                        message_queue)
+            return
+        asyncio.run(async_start_pre_process(message_queue, stop_event, inputs))
 
-                if success:
-                    # 최종 성공 시 전체 루프 중단
-                    return True
-                else:
-                    self.log_message(f"❌ 예약 시도 실패: {message}")
-                    if "이미 예약되어 있습니다" in message or "마감되었습니다" in message:
-                        self.log_message("❌ [경고] 이미 예약된 타임 또는 마감. 다른 시간대로 이동합니다.")
-                        break
-                    elif attempt < 3:
-                        self.log_message("🔄 3초 후 재시도...")
-                        time.sleep(3)
+    except KeyError as e:
+        log_message(f"[UI ALERT] 🛑 예상치 못한 오류 발생: KeyError - {e}", message_queue)
+        log_message(f"디버깅 정보: Traceback: {traceback.format_exc()}", message_queue)
 
-            if not success and not self.stop_event.is_set():
-                self.log_message(f"❗ {i + 1}순위({time_display}) 3회 모두 최종 실패. 다음 시간대로 이동.")
+    except Exception as e:
+        log_message(f"[UI ALERT] 🛑 예상치 못한 치명적인 오류 발생: {e}", message_queue)
+        log_message(f"디버깅 정보: Traceback: {traceback.format_exc()}", message_queue)
 
-        if not self.stop_event.is_set():
-            self.log_message(f"❌ 상위 {min(5, len(sorted_available_times))}개 시간대 예약 시도 최종 실패.")
-            return False
+    finally:
+        log_message("[INFO] Worker 스레드 종료.", message_queue)
 
 
 # ============================================================
@@ -783,28 +4208,52 @@ def start_pre_process(message_queue, stop_event, inputs):
     # 📌 1. 안전 마진 설정 (0.200초)
     SAFETY_MARGIN_SECONDS = 0.200
     log_message("[INFO] ⚙️ 예약 시작 조건 확인 완료.", message_queue)
+    timing_stats = FireTimingStats()  # [추가] 이번 실행의 발사 오차 히스토그램
+    tracer = PipelineTracer()  # [추가] 이번 실행의 구간별 지연 추적
+    hot_log = inputs.get('hot_logger') or HotPathLogger()  # [추가] 핫 패스 로거 (UI가 drain, 없으면 종료 시 큐로 전달)
+    readiness = ReadinessTracker(tracer)  # [추가] 발사 준비 상태 (확인 요청 기준)
+    core = None
     try:
         # [수정] APIBookingCore 생성 시 inputs['golfclub_seq'] 전달
         core = APIBookingCore(
             log_message,
             message_queue,
             stop_event,
-            inputs['golfclub_seq']
+            inputs['golfclub_seq'],
+            inputs.get('api_domain')
         )
-
-        # 1. Login
+        core.warm_connection_count = int(inputs.get('warm_connections', core.warm_connection_count))
+        core.tracer = tracer
+        core.hot_log = hot_log
+        ranking = compile_slot_ranking(inputs, message_queue)  # [추가] 선호도 순위표 (골든 타임 전 컴파일)
+
+        # 1. Login ([수정] 저장된 세션이 유효하면 재사용)
+        core.session_cache = make_session_cache(inputs, message_queue)
+        core.page_counts = make_page_count_store(inputs)
+        core.list_filter = make_list_filter(inputs, message_queue)
+        core.accept_encoding = inputs.get('accept_encoding') or ACCEPT_ENCODING
+        core.transport = inputs.get('transport', TRANSPORT_HTTP1)
+        core.dns = make_dns_pinner(inputs)
         log_message("🔒 로그인 시도...", message_queue)
-        login_result = core.requests_login(inputs['id'], inputs['password'])
+        login_result = core.login_with_cache(inputs['id'], inputs['password'])
         if login_result['result'] != 'success':
             log_message(f"❌ 로그인 실패: {login_result['message']}", message_queue)
             return
-        log_message("✅ 로그인 성공.", message_queue)
-        log_message("⏳ 로그인 성공. 세션 활성화 전 2초간 대기 (에러 방지)...", message_queue)
-        time.sleep(2.0)
+        if login_result.get('cached'):
+            log_message("✅ 저장된 세션으로 로그인 완료. (세션 활성화 대기 생략)", message_queue)
+            readiness.reach(READY_LOGGED_IN, "저장된 세션, 확인 요청 1회")
+        else:
+            log_message("✅ 로그인 성공.", message_queue)
+            # [수정] 고정 2초 대기 대신 세션 확인 요청이 성공할 때까지만 대기 (최대 2초)
+            log_message(f"⏳ 로그인 성공. 세션 활성화 확인 중 (최대 {SESSION_READY_TIMEOUT:.0f}초)...", message_queue)
+            session_ready = core.wait_session_ready()
+            readiness.reach(READY_LOGGED_IN, "세션 확인 완료" if session_ready else "세션 확인 실패, 제한 시간 경과")
+        core.log_transport()  # [추가] 협상된 전송 프로토콜 (HTTP/2 → HTTP/1.1 전환 여부)
         if stop_event.is_set(): return
 
         # 2. Server Time Check & Target Time Calculation (Initial Offset)
         time_offset = core.get_server_time_offset()
+        readiness.reach(READY_CLOCK_SYNCED, describe_clock_sync(core.last_clock_estimate))
 
         # [수정] run_date는 UI에서 입력받은 run_date_input을 사용합니다.
         # run_date와 run_time을 결합하여 KST datetime 객체를 생성합니다.
@@ -814,7 +4263,6 @@ def start_pre_process(message_queue, stop_event, inputs):
         target_dt_kst = KST.localize(target_dt_naive)
 
         target_local_time_kst = target_dt_kst - datetime.timedelta(seconds=time_offset)
-        time.sleep(0.2)
         log_message(
             f"✅ [초기 목표 시간] Local KST 기준: {target_local_time_kst.strftime('%H:%M:%S.%f')[:-3]} (Offset: {time_offset:.3f}초 반영)",
             message_queue)
@@ -824,15 +4272,20 @@ def start_pre_process(message_queue, stop_event, inputs):
         log_message(f"🔎 **[선행 작업]** 예약 페이지 초기 진입 (세션 활성화)...", message_queue)
         # [수정] GOLFCLUB_SEQ를 core에서 참조하도록 변경
         try:
-            core.session.get(f"{core.API_DOMAIN}/reserve/main/teetimeList?golfclubSeq={core.GOLFCLUB_SEQ}", timeout=5.0,
-                             verify=False)
+            res = core.session.get(f"{core.API_DOMAIN}/reserve/main/teetimeList?golfclubSeq={core.GOLFCLUB_SEQ}",
+                                   timeout=5.0, verify=False)
             log_message("✅ 예약 페이지 초기 진입 완료. 세션 활성화.", message_queue)
+            readiness.reach(READY_RESERVE_PAGE, f"HTTP {res.status_code}")
         except requests.RequestException as e:
             log_message(f"❌ 예약 페이지 초기 진입 실패: {e}", message_queue)
             log_message("UI_ERROR:예약 페이지(세션) 초기화 실패로 예약 프로세스 중단.", message_queue)
             return
         if stop_event.is_set(): return
 
+        # [추가] 서버 측 검색 조건이 티 타임을 빠뜨리지 않는지 요청 틀 준비 전에 확인 (사용 시)
+        core.verify_list_filter()
+        if stop_event.is_set(): return
+
         # 4. Session Keep-Alive Thread Start
         keep_alive_dt = target_local_time_kst - datetime.timedelta(seconds=5)
         keep_alive_thread = threading.Thread(
@@ -843,12 +4296,42 @@ def start_pre_process(message_queue, stop_event, inputs):
         keep_alive_thread.start()
         log_message("✅ 세션 유지 스레드 시작 완료 (최종 예약 5초 전까지 유지).", message_queue)
 
+        # [추가] API 도메인 주소 사전 조회 (TTL 동안 캐시, 웜업 커넥션부터 적용)
+        core.resolve_api_host()
+
+        # [추가] 커넥션 준비 확인 (웜업 요청 1회로 풀에 커넥션 확보) 및 발사 준비 상태 보고
+        if core.warm_connection_count > 0:
+            opened, live = core.probe_connections(core.warm_connection_count)
+            readiness.reach(READY_CONNECTIONS_WARM, f"{opened}/{core.warm_connection_count}개 응답, 풀 내 {live}개")
+        else:
+            readiness.reach(READY_CONNECTIONS_WARM, "웜업 사용 안함")
+        log_readiness(readiness, target_local_time_kst, message_queue)
+        if stop_event.is_set(): return
+
+        # [추가] 실행 전 리허설: 측정값으로 예약 지연/발사 오프셋 자동 설정
+        booking_delay = inputs.get('booking_delay', 0.0)
+        fire_offset = inputs.get('fire_offset', 0.0)
+        if inputs.get('rehearsal_before_open'):
+            lead = (target_local_time_kst - datetime.datetime.now(KST)).total_seconds()
+            if lead < REHEARSAL_MIN_LEAD:
+                log_message(f"ℹ️ T-0까지 {lead:.0f}초 남아 실행 전 리허설을 건너뜁니다. (최소 {REHEARSAL_MIN_LEAD:.0f}초)",
+                            message_queue)
+            else:
+                report = run_rehearsal(core, inputs, ranking, message_queue, stop_event)
+                recommendation = report.recommend() if report is not None else None
+                if recommendation is not None:
+                    booking_delay, fire_offset = recommendation
+                    log_message(f"🎯 리허설 결과 적용: 예약 지연 {booking_delay:.3f}초, 발사 오프셋 {fire_offset:+.3f}초",
+                                message_queue)
+            if stop_event.is_set(): return
+
         # 5. Wait for Final Offset Check Point (30 seconds before target time)
         countdown_start_time = target_dt_kst - datetime.timedelta(seconds=30)
         now_kst = datetime.datetime.now(KST)
 
         if now_kst < countdown_start_time:
-            wait_until(countdown_start_time, stop_event, message_queue, "최종 시간 보정 대기", log_countdown=False)
+            wait_until(countdown_start_time, stop_event, message_queue, "최종 시간 보정 대기", log_countdown=False,
+                       timing_stats=timing_stats)
             if stop_event.is_set(): return
 
             log_message("🔄 최종 예약 30초 전: 서버 시간 오차 재측정 및 보정 (부하 최소화 시점)", message_queue)
@@ -862,12 +4345,40 @@ def start_pre_process(message_queue, stop_event, inputs):
             log_message("⚠️ [시간 경과] 이미 최종 예약 30초 전 시점을 지났습니다. 초기 오프셋으로 즉시 실행합니다.", message_queue)
             if stop_event.is_set(): return
 
-        # 6. Wait until the Final Target Time (with Countdown)
-        wait_until(target_local_time_kst, stop_event, message_queue, "최종 예약 시도", log_countdown=True)
+        # [추가] 골든 타임 직전 커넥션 웜업: 마지막 N초 동안 인증된 커넥션을 풀에 살아있도록 유지
+        fetch_mode = inputs.get('fetch_mode', FETCH_MODE_SEQUENTIAL)
+        concurrent_fetch = fetch_mode == FETCH_MODE_CONCURRENT
+        if fetch_mode in (FETCH_MODE_CONCURRENT, FETCH_MODE_STREAMING):
+            core._get_page_executor()
+
+        # [추가] getList / Check / Submit 요청 틀 사전 준비 (발사 시점에는 바뀌는 필드만 교체)
+        core.prepare_request_templates(inputs['target_date'])
+        log_message("✅ 요청 틀 사전 준비 완료 (getList / Check / Submit).", message_queue)
+
+        # [추가] 골든 타임 구간 동안 주소 고정 (TTL이 지났으면 지금 다시 조회한 뒤 고정)
+        core.resolve_api_host(pin_until_dt=target_local_time_kst + datetime.timedelta(seconds=DNS_PIN_WINDOW))
+
+        if core.warm_connection_count > 0:
+            warm_start_dt = target_local_time_kst - datetime.timedelta(seconds=inputs.get('warm_window', 10.0))
+            warm_end_dt = target_local_time_kst + datetime.timedelta(seconds=min(0.0, fire_offset) - 0.3)
+            threading.Thread(
+                target=core.warm_up_connections,
+                args=(warm_start_dt, warm_end_dt, core.warm_connection_count),
+                daemon=True
+            ).start()
+            log_message(
+                f"✅ 커넥션 웜업 예약 완료 (T-{inputs.get('warm_window', 10.0):.0f}초부터 {core.warm_connection_count}개 유지).",
+                message_queue)
+
+        # 6. Wait until the Final Target Time (with Countdown) ([추가] 발사 오프셋 반영)
+        fire_time_kst = apply_fire_offset(target_local_time_kst, fire_offset, message_queue)
+        wait_until(fire_time_kst, stop_event, message_queue, "최종 예약 시도", log_countdown=True,
+                   timing_stats=timing_stats)
+        tracer.mark('T-0')
+        hot_log.min_level = inputs.get('critical_log_level', LOG_INFO)  # [추가] 골든 타임 구간: 응답 덤프 생략
         if stop_event.is_set(): return
 
-        # 7. Apply Booking Delay (예약 지연)
-        booking_delay = inputs.get('booking_delay', 0.0)
+        # 7. Apply Booking Delay (예약 지연, [수정] 실행 전 리허설 결과가 있으면 그 값)
         try:
             if booking_delay > 0.001:
                 log_message(f"⏳ 예약 지연 {booking_delay:.3f}초 적용...", message_queue)
@@ -885,27 +4396,46 @@ def start_pre_process(message_queue, stop_event, inputs):
             f"🔎 필터링 조건: {inputs['start_time']}~{inputs['end_time']}, 코스: {inputs['course_type']}, 순서: {inputs['order']}",
             message_queue)
 
-        all_times_html = core.get_all_available_times(inputs['target_date'])
-        if not all_times_html:
-            log_message("❌ 티 타임 목록 조회 실패. 예약 프로세스 중단.", message_queue)
-            return
-        if stop_event.is_set(): return
-
-        # 9. Filter and Sort Times
-        is_reverse = inputs['order'] == '역순 (늦은 시간 순)'
+        is_reverse = inputs['order'] == ORDER_REVERSE
         target_course = inputs['course_type']
 
-        sorted_available_times = core.filter_and_sort_times(
-            all_times_html=all_times_html,
-            start_time_str=inputs['start_time'],
-            end_time_str=inputs['end_time'],
-            target_course_names=target_course,
-            is_reverse=is_reverse
-        )
-        if stop_event.is_set(): return
+        # [추가] 발사 직전 커넥션 풀 스냅샷 (나이/재사용 보고용)
+        pool_snapshot = core.snapshot_connections()
+        fire_monotonic = time.monotonic()
+
+        if fetch_mode == FETCH_MODE_STREAMING:
+            # [추가] 스트리밍: 페이지 도착 즉시 파싱하고, 순위가 확정된 후보부터 바로 예약 시도
+            sorted_available_times = core.stream_sorted_candidates(
+                date=inputs['target_date'],
+                start_time_str=inputs['start_time'],
+                end_time_str=inputs['end_time'],
+                target_course_names=target_course,
+                is_reverse=is_reverse,
+                ranking=ranking
+            )
+        else:
+            all_times_html = core.get_all_available_times(inputs['target_date'], concurrent=concurrent_fetch)
+            if not all_times_html:
+                log_message("❌ 티 타임 목록 조회 실패. 예약 프로세스 중단.", message_queue)
+                return
+            if stop_event.is_set(): return
+
+            # 9. Filter and Sort Times
+            sorted_available_times = core.filter_and_sort_times(
+                all_times_html=all_times_html,
+                start_time_str=inputs['start_time'],
+                end_time_str=inputs['end_time'],
+                target_course_names=target_course,
+                is_reverse=is_reverse,
+                ranking=ranking
+            )
+            core.log_connection_report(pool_snapshot, fire_monotonic)
+            if stop_event.is_set(): return
 
         # 10. Run API Booking attempts
         core.run_api_booking(inputs, sorted_available_times)
+        if fetch_mode == FETCH_MODE_STREAMING:
+            core.log_connection_report(pool_snapshot, fire_monotonic)
 
     except KeyError as e:
         log_message(f"[UI ALERT] 🛑 예상치 못한 오류 발생: KeyError - {e}", message_queue)
@@ -916,6 +4446,256 @@ def start_pre_process(message_queue, stop_event, inputs):
         log_message(f"디버깅 정보: Traceback: {traceback.format_exc()}", message_queue)
 
     finally:
+        if core is not None:
+            core.close()
+        finish_hot_logger(hot_log, inputs, message_queue)
+        log_timing_histogram(timing_stats, message_queue)
+        export_pipeline_trace(tracer, message_queue, inputs.get('trace_dir', TRACE_DIR))
+        log_message("[INFO] Worker 스레드 종료.", message_queue)
+
+
+def describe_clock_sync(estimate):
+    """[추가] 발사 준비 상태 보고용 서버 시계 동기화 결과 설명."""
+    if estimate is None:
+        return "정밀 측정 실패, Date 헤더 1회"
+    return f"±{estimate.uncertainty * 1000:.1f}ms, 샘플 {estimate.samples}개"
+
+
+def apply_fire_offset(target_local_time_kst, fire_offset, message_queue):
+    """[추가] 발사 오프셋(초, 음수면 먼저 발사)을 목표 시각에 더한 실제 발사 시각을 반환합니다."""
+    if abs(fire_offset) < 0.0005:
+        return target_local_time_kst
+    fire_time_kst = target_local_time_kst + datetime.timedelta(seconds=fire_offset)
+    log_message(f"🎯 발사 오프셋 {fire_offset:+.3f}초 적용: 발사 시각 {fire_time_kst.strftime('%H:%M:%S.%f')[:-3]}",
+                message_queue)
+    return fire_time_kst
+
+
+def log_readiness(readiness, target_local_time_kst, message_queue):
+    """[추가] 상태별 확인 시각과 최초 발사 가능 시각(T-0 대비 여유)을 로그로 남깁니다."""
+    log_message("🚦 발사 준비 상태 (확인 요청 기준):", message_queue)
+    for line in readiness.summary_lines(target_local_time_kst.timestamp()):
+        log_message(line, message_queue)
+
+
+def make_session_cache(inputs, message_queue):
+    """[추가] inputs['session_cache']가 켜져 있으면 SessionCache를 반환합니다. (cryptography 미설치 시 None)"""
+    if not inputs.get('session_cache'):
+        return None
+    cache = SessionCache(inputs.get('session_cache_dir') or SESSION_CACHE_DIR)
+    if not cache.enabled:
+        log_message("ℹ️ cryptography 패키지가 없어 로그인 세션 캐시를 사용하지 않습니다. (pip install cryptography)",
+                    message_queue)
+        return None
+    return cache
+
+
+def compile_slot_ranking(inputs, message_queue):
+    """[추가] 골든 타임 전에 선호도 순위표를 컴파일합니다. (UI에서 미리 만든 순위표가 있으면 그대로 사용)"""
+    start = time.perf_counter()
+    ranking = inputs.get('slot_ranking') or SlotRanking.from_inputs(inputs)
+    log_message(f"🧮 선호도 순위표 준비 완료 ({ranking.description}) - {(time.perf_counter() - start) * 1000:.2f}ms",
+                message_queue)
+    return ranking
+
+
+def make_list_filter(inputs, message_queue):
+    """[추가] 'getList' 검색 조건을 만듭니다. (서버 측 필터를 끄면 홀 수 조건만 클라이언트에서 확인)"""
+    list_filter = ListFilter.from_inputs(inputs)
+    log_message(f"🔎 'getList' 검색 조건: {list_filter.description}", message_queue)
+    return list_filter
+
+
+def finish_hot_logger(hot_log, inputs, message_queue):
+    """[추가] 로그 레벨을 되돌리고, UI가 핫 패스 로거를 직접 drain 하지 않는 경우 남은 레코드를 큐로 옮깁니다."""
+    hot_log.min_level = LOG_DEBUG
+    if inputs.get('hot_logger') is None:
+        hot_log.flush_to(message_queue)
+
+
+def export_pipeline_trace(tracer, message_queue, trace_dir=TRACE_DIR):
+    """[추가] T-0 이후 구간별 소요를 로그로 남기고, 실행 전체 추적을 Chrome trace JSON으로 저장합니다."""
+    summary_lines = tracer.summary_lines('T-0')
+    if summary_lines:
+        log_message("🧭 T-0 이후 구간별 소요 (T-0 기준 상대 시각):", message_queue)
+        for line in summary_lines:
+            log_message(line, message_queue)
+    if not tracer.spans or not trace_dir:
+        return
+    try:
+        path = tracer.export(trace_dir)
+        log_message(f"🧭 구간별 추적 저장 완료: {path} (chrome://tracing 또는 ui.perfetto.dev 에서 열기)", message_queue)
+    except OSError as e:
+        log_message(f"⚠️ 구간별 추적 저장 실패: {e}", message_queue)
+
+
+def log_timing_histogram(timing_stats, message_queue):
+    """[추가] 이번 실행의 wait_until 발사 오차 히스토그램을 로그로 남깁니다."""
+    histogram_lines = timing_stats.histogram_lines()
+    if histogram_lines:
+        log_message(f"📊 발사 오차 히스토그램 ({len(timing_stats.records)}회):", message_queue)
+        for line in histogram_lines:
+            log_message(line, message_queue)
+
+
+# ============================================================
+# [추가] 리허설: 실제 오픈 전에 이미 열린 날짜로 전체 파이프라인(getList → 파싱 → 1단계 확인)을 측정하고
+# 예약 지연(booking_delay)과 발사 오프셋(fire_offset)을 추천합니다. (2단계 최종 예약은 보내지 않음)
+# ============================================================
+REHEARSAL_ROUNDS = 5
+REHEARSAL_INTERVAL = 0.3  # 회차 사이 간격 (초)
+REHEARSAL_SAFETY_MARGIN = 0.005  # 추천 예약 지연에 더하는 여유 (초)
+REHEARSAL_MIN_LEAD = 60.0  # 실행 중 리허설은 T-0까지 이만큼 남아 있을 때만 수행 (초)
+FIRE_OFFSET_LIMIT = 0.5  # 발사 오프셋 입력 범위 (±초)
+BOOKING_DELAY_MAX = 1.0
+REHEARSAL_RESULT_PREFIX = "REHEARSAL_RESULT:"  # UI로 추천값 전달 (예: "REHEARSAL_RESULT:0.012,-0.018")
+REHEARSAL_STAGES = (('getList', "getList (전체 페이지)"), ('parse', "파싱/순위"), ('check', "1단계 확인"))
+
+
+class RehearsalReport:
+    """리허설 회차별 구간 소요(초)와 서버 시계 추정 결과로 예약 지연/발사 오프셋을 추천합니다."""
+
+    def __init__(self, clock_estimate=None):
+        self.clock_estimate = clock_estimate
+        self.samples = {stage: [] for stage, _ in REHEARSAL_STAGES}
+
+    def add(self, stage, seconds):
+        self.samples[stage].append(seconds)
+
+    def quantile(self, stage, q):
+        ordered = sorted(self.samples[stage])
+        if not ordered:
+            return None
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    @property
+    def base_rtt(self):
+        """서버 처리 시간이 거의 없는 요청의 왕복 시간 (시계 측정의 최소 RTT, 없으면 1단계 확인 최소값)."""
+        if self.clock_estimate is not None:
+            return self.clock_estimate.min_rtt
+        return self.quantile('check', 0.0)
+
+    def recommend(self):
+        """
+        반환값: (booking_delay, fire_offset) 초, 측정값이 부족하면 None.
+        - fire_offset: 편도 지연(최소 RTT / 2)만큼 먼저 보내 첫 getList가 서버에 T-0에 도착하도록 당김
+        - booking_delay: 서버 시계 불확실성(반폭) + 여유만큼 늦춰, 시계 오차로 오픈 전에 도착하는 것을 막음
+        """
+        base_rtt = self.base_rtt
+        if base_rtt is None:
+            return None
+        uncertainty = self.clock_estimate.uncertainty if self.clock_estimate is not None else 0.5
+        booking_delay = min(BOOKING_DELAY_MAX, uncertainty + REHEARSAL_SAFETY_MARGIN)
+        fire_offset = max(-FIRE_OFFSET_LIMIT, -base_rtt / 2)
+        return round(booking_delay, 3), round(fire_offset, 3)
+
+    def summary_lines(self):
+        lines = []
+        base_rtt = self.base_rtt
+        for stage, label in REHEARSAL_STAGES:
+            samples = self.samples[stage]
+            if not samples:
+                lines.append(f"   {label:<16} 측정 없음")
+                continue
+            p50, p90 = self.quantile(stage, 0.5), self.quantile(stage, 0.9)
+            line = f"   {label:<16} p50={p50 * 1000:.1f}ms  p90={p90 * 1000:.1f}ms  ({len(samples)}회)"
+            if stage != 'parse' and base_rtt is not None:
+                line += f"  서버 처리 추정 p50={max(0.0, p50 - base_rtt) * 1000:.1f}ms"
+            lines.append(line)
+        if base_rtt is not None:
+            lines.append(f"   기준 RTT (최소) {base_rtt * 1000:.1f}ms, 서버 시계 {describe_clock_sync(self.clock_estimate)}")
+        return lines
+
+
+def run_rehearsal(core, inputs, ranking, message_queue, stop_event):
+    """
+    [추가] 로그인/시계 동기화가 끝난 core로 getList → 파싱/순위 → 1단계 확인을 여러 번 수행하고 RehearsalReport를 반환합니다.
+    중단되면 None. 요청 틀은 리허설 날짜 기준으로 바뀌므로, 실제 발사 전에 prepare_request_templates를 다시 호출해야 합니다.
+    """
+    date = inputs.get('rehearsal_date') or inputs['target_date']
+    rounds = int(inputs.get('rehearsal_rounds', REHEARSAL_ROUNDS))
+    concurrent_fetch = inputs.get('fetch_mode', FETCH_MODE_SEQUENTIAL) != FETCH_MODE_SEQUENTIAL
+    report = RehearsalReport(core.last_clock_estimate)
+    log_message(f"🧪 **[리허설]** {date} 기준 {rounds}회 (getList → 파싱 → 1단계 확인, 최종 예약 요청 없음)",
+                message_queue)
+    core.verify_list_filter(date)
+    core.prepare_request_templates(date)
+
+    for round_no in range(1, rounds + 1):
+        if stop_event.is_set(): return None
+        start = time.perf_counter()
+        all_times_html = core.get_all_available_times(date, concurrent=concurrent_fetch)
+        fetched = time.perf_counter()
+        if not all_times_html:
+            log_message(f"⚠️ 리허설 {round_no}회차: 티 타임 목록 조회 실패.", message_queue)
+            continue
+        report.add('getList', fetched - start)
+
+        ranked, _ = ranking.rank(core.parse_teetime_items(all_times_html) or [])
+        parsed = time.perf_counter()
+        report.add('parse', parsed - fetched)
+        if not ranked:
+            log_message(f"⚠️ 리허설 {round_no}회차: 조건에 맞는 후보가 없어 1단계 확인은 건너뜁니다.", message_queue)
+            continue
+
+        result = core.check_reservation(ranked[0][1].time_table_id)
+        report.add('check', time.perf_counter() - parsed)
+        log_message(
+            f"🧪 리허설 {round_no}회차: getList {(fetched - start) * 1000:.1f}ms, 파싱/순위 {(parsed - fetched) * 1000:.2f}ms, "
+            f"1단계 {report.samples['check'][-1] * 1000:.1f}ms [{result.outcome}]", message_queue)
+        if stop_event.wait(REHEARSAL_INTERVAL): return None
+
+    log_message("📊 리허설 구간별 소요:", message_queue)
+    for line in report.summary_lines():
+        log_message(line, message_queue)
+    return report
+
+
+def start_rehearsal(message_queue, stop_event, inputs):
+    """[추가] 리허설 전용 Worker: 로그인 → 시계 동기화 → 예약 페이지 진입 → run_rehearsal → 추천값을 UI로 전달."""
+    hot_log = inputs.get('hot_logger') or HotPathLogger()
+    core = None
+    try:
+        core = APIBookingCore(log_message, message_queue, stop_event, inputs['golfclub_seq'], inputs.get('api_domain'))
+        core.hot_log = hot_log
+        ranking = compile_slot_ranking(inputs, message_queue)
+
+        core.session_cache = make_session_cache(inputs, message_queue)
+        core.page_counts = make_page_count_store(inputs)
+        core.list_filter = make_list_filter(inputs, message_queue)
+        core.accept_encoding = inputs.get('accept_encoding') or ACCEPT_ENCODING
+        core.transport = inputs.get('transport', TRANSPORT_HTTP1)
+        login_result = core.login_with_cache(inputs['id'], inputs['password'])
+        if login_result['result'] != 'success':
+            log_message(f"❌ 로그인 실패: {login_result['message']}", message_queue)
+            return
+        if not login_result.get('cached'):
+            core.wait_session_ready()
+        if stop_event.is_set(): return
+
+        core.get_server_time_offset()
+        core.session.get(f"{core.API_DOMAIN}/reserve/main/teetimeList?golfclubSeq={core.GOLFCLUB_SEQ}",
+                         timeout=5.0, verify=False)
+        if stop_event.is_set(): return
+
+        report = run_rehearsal(core, inputs, ranking, message_queue, stop_event)
+        recommendation = report.recommend() if report is not None else None
+        if recommendation is None:
+            log_message("❌ 리허설 측정값이 부족하여 추천값을 계산하지 못했습니다.", message_queue)
+            return
+        booking_delay, fire_offset = recommendation
+        log_message(f"🎯 추천: 예약 지연 {booking_delay:.3f}초, 발사 오프셋 {fire_offset:+.3f}초", message_queue)
+        message_queue.put(f"{REHEARSAL_RESULT_PREFIX}{booking_delay:.3f},{fire_offset:.3f}")
+
+    except requests.RequestException as e:
+        log_message(f"❌ 리허설 중 네트워크 오류: {e}", message_queue)
+    except Exception as e:
+        log_message(f"[UI ALERT] 🛑 리허설 중 예상치 못한 오류 발생: {e}", message_queue)
+        log_message(f"디버깅 정보: Traceback: {traceback.format_exc()}", message_queue)
+    finally:
+        if core is not None:
+            core.close()
+        finish_hot_logger(hot_log, inputs, message_queue)
         log_message("[INFO] Worker 스레드 종료.", message_queue)
 
 
@@ -923,9 +4703,43 @@ def start_pre_process(message_queue, stop_event, inputs):
 # Streamlit UI & Thread Management
 # ============================================================
 
+# [추가] 로그 화면: 보관 줄 수와 실행 중 로그 영역(fragment) 갱신 주기
+LOG_HISTORY_MAX = 500
+LOG_REFRESH_SECONDS = 0.25
+CPU_SAMPLE_SECONDS = 1.0
+
+
+def classify_log_color(msg):
+    """[추가] 로그 한 줄의 색상 CSS 클래스를 반환합니다. (기존 골프존감포의 로그 색상 로직 유지)"""
+    if "[UI ALERT]" in msg or "❌" in msg or "UI_ERROR" in msg:
+        return "log-red"
+    elif "🎉" in msg or "✅" in msg and "대기중" not in msg:
+        return "log-green"
+    elif "💚 [세션 유지]" in msg or "📜" in msg or "⛳ **[Target]**" in msg:
+        return "log-blue"
+    elif "⏳" in msg or "🔄" in msg:
+        return "log-gray"
+    return "log-black"
+
+
+def render_log_line(msg):
+    """[추가] 로그 한 줄을 수신 시점에 한 번만 이스케이프/색상 분류하여 HTML로 변환합니다."""
+    safe_msg = msg.replace("<", "&lt;").replace(">", "&gt;")
+    return f'<div class="{classify_log_color(msg)}">{safe_msg}</div>'
+
+
+def render_log_html(rendered_lines):
+    """[추가] 변환된 로그 줄을 최신순 하나의 HTML 블록으로 합칩니다."""
+    return f'<div class="log-view">{"".join(reversed(rendered_lines))}</div>'
+
+
 # --- State Initialization ---
 if 'log_messages' not in st.session_state:
-    st.session_state.log_messages = ["프로그램 실행 준비 완료."]
+    # [수정] 변환된 HTML 줄을 최대 LOG_HISTORY_MAX개까지 보관 (오래된 줄은 자동 삭제)
+    st.session_state.log_messages = deque([render_log_line("프로그램 실행 준비 완료.")], maxlen=LOG_HISTORY_MAX)
+    st.session_state.log_html = render_log_html(st.session_state.log_messages)
+if 'cpu_sample' not in st.session_state:
+    st.session_state.cpu_sample = (time.monotonic(), time.process_time(), None)
 if 'is_running' not in st.session_state:
     st.session_state.is_running = False
 if 'stop_event' not in st.session_state:
@@ -934,8 +4748,8 @@ if 'worker_thread' not in st.session_state:
     st.session_state.worker_thread = None
 if 'message_queue' not in st.session_state:
     st.session_state.message_queue = queue.Queue()
-if 'log_container_placeholder' not in st.session_state:
-    st.session_state.log_container_placeholder = None
+if 'hot_logger' not in st.session_state:
+    st.session_state.hot_logger = None  # [추가] 실행 중인 Worker의 핫 패스 로거 (UI에서 drain)
 
 # 초기값 설정
 if 'target_date' not in st.session_state:
@@ -961,6 +4775,51 @@ if 'password' not in st.session_state:
     st.session_state.password = ""
 if 'course_type' not in st.session_state:
     st.session_state.course_type = 'ALL'
+if 'fetch_mode' not in st.session_state:
+    st.session_state.fetch_mode = FETCH_MODE_SEQUENTIAL
+if 'engine' not in st.session_state:
+    st.session_state.engine = ENGINE_THREAD
+if 'transport' not in st.session_state:
+    st.session_state.transport = TRANSPORT_HTTP1
+if 'dns_pinning' not in st.session_state:
+    st.session_state.dns_pinning = True
+if 'warm_connections' not in st.session_state:
+    st.session_state.warm_connections = 4
+if 'speculative_checks' not in st.session_state:
+    st.session_state.speculative_checks = 1
+if 'check_concurrency' not in st.session_state:
+    st.session_state.check_concurrency = 3
+if 'session_cache' not in st.session_state:
+    st.session_state.session_cache = Fernet is not None
+# [추가] 선호도 순위 입력
+if 'preferred_windows' not in st.session_state:
+    st.session_state.preferred_windows = ""
+if 'course_weights' not in st.session_state:
+    st.session_state.course_weights = ""
+if 'avoid_edge_tees' not in st.session_state:
+    st.session_state.avoid_edge_tees = False
+# [추가] 'getList' 검색 조건
+if 'hole_cnt' not in st.session_state:
+    st.session_state.hole_cnt = "전체"
+if 'server_filter' not in st.session_state:
+    st.session_state.server_filter = False  # [수정] 시간대 코드가 확인되기 전까지 기본 사용 안함
+# [추가] 발사 오프셋 및 리허설
+if 'fire_offset' not in st.session_state:
+    st.session_state.fire_offset = 0.000
+if 'rehearsal_date' not in st.session_state:
+    st.session_state.rehearsal_date = get_default_date(1)
+if 'rehearsal_rounds' not in st.session_state:
+    st.session_state.rehearsal_rounds = REHEARSAL_ROUNDS
+if 'rehearsal_apply' not in st.session_state:
+    st.session_state.rehearsal_apply = True
+if 'rehearsal_before_open' not in st.session_state:
+    st.session_state.rehearsal_before_open = False
+if 'pending_tuning' not in st.session_state:
+    st.session_state.pending_tuning = None
+# 리허설 추천값은 위젯 생성 전에만 입력란에 반영할 수 있음
+if st.session_state.pending_tuning is not None:
+    st.session_state.booking_delay, st.session_state.fire_offset = st.session_state.pending_tuning
+    st.session_state.pending_tuning = None
 
 # [수정] 골프장 선택 상태 초기화
 if 'selected_club_name' not in st.session_state:
@@ -969,13 +4828,50 @@ if 'selected_club_name' not in st.session_state:
 
 # --- Helper Functions ---
 def update_log_display():
-    """Reads messages from the queue and updates the log display."""
+    """
+    Reads messages from the queue and updates the log display.
+    [수정] 핫 패스 로거의 레코드도 함께 가져와 타임스탬프 순으로 합칩니다.
+    """
+    new_messages = []
     while not st.session_state.message_queue.empty():
         msg = st.session_state.message_queue.get_nowait()
         if msg.startswith("UI_LOG:"):
-            st.session_state.log_messages.append(msg[7:])
+            new_messages.append(msg[7:])
         elif msg.startswith("UI_ERROR:"):
-            st.session_state.log_messages.append(f"[UI ALERT] {msg[9:]}")
+            new_messages.append(f"[UI ALERT] {msg[9:]}")
+        elif msg.startswith(REHEARSAL_RESULT_PREFIX):
+            # [추가] 리허설 추천값: 다음 전체 재실행 때 입력란에 반영
+            if st.session_state.rehearsal_apply:
+                booking_delay, fire_offset = (float(v) for v in msg[len(REHEARSAL_RESULT_PREFIX):].split(","))
+                st.session_state.pending_tuning = (booking_delay, fire_offset)
+                new_messages.append("🎯 리허설 추천값을 예약 지연/발사 오프셋 입력란에 적용합니다.")
+    if st.session_state.hot_logger is not None:
+        new_messages.extend(st.session_state.hot_logger.drain())
+
+    # '[HH:MM:SS.mmm]' 접두어 기준 안정 정렬 (타임스탬프가 없는 메시지는 직전 메시지 위치 유지)
+    sort_keys = []
+    last_key = ""
+    for msg in new_messages:
+        if msg.startswith("[") and msg[13:14] == "]":
+            last_key = msg[:14]
+        sort_keys.append(last_key)
+    order = sorted(range(len(new_messages)), key=sort_keys.__getitem__)
+    if not order:
+        return
+    # [수정] 색상 분류/이스케이프는 수신 시 한 번만 하고, 화면용 HTML 블록은 새 메시지가 있을 때만 다시 만듦
+    st.session_state.log_messages.extend(render_log_line(new_messages[i]) for i in order)
+    st.session_state.log_html = render_log_html(st.session_state.log_messages)
+
+
+def measure_process_cpu():
+    """[추가] 이 Streamlit 프로세스(UI + Worker 스레드 포함)의 CPU 사용률(%)을 약 1초 간격으로 측정합니다."""
+    last_wall, last_cpu, last_percent = st.session_state.cpu_sample
+    now_wall, now_cpu = time.monotonic(), time.process_time()
+    elapsed = now_wall - last_wall
+    if elapsed >= CPU_SAMPLE_SECONDS:
+        last_percent = (now_cpu - last_cpu) / elapsed * 100
+        st.session_state.cpu_sample = (now_wall, now_cpu, last_percent)
+    return last_percent
 
 
 def stop_booking():
@@ -986,8 +4882,11 @@ def stop_booking():
         log_message("🛑 사용자 요청으로 프로그램을 중단합니다.", st.session_state.message_queue)
 
 
-def run_booking():
-    """Gathers inputs and starts the worker thread."""
+def run_booking(rehearsal=False):
+    """
+    Gathers inputs and starts the worker thread.
+    [추가] rehearsal=True면 예약 대신 리허설 Worker(start_rehearsal)를 실행합니다.
+    """
     # 유효성 검사 로직 삭제 요청에 따라, ID/PW가 비어있는 경우에만 경고 메시지를 출력하고 리턴
     if not st.session_state.id or not st.session_state.password:
         log_message("[UI ALERT] ❌ ID와 비밀번호를 모두 입력해야 합니다.", st.session_state.message_queue)
@@ -1017,23 +4916,57 @@ def run_booking():
         "order": st.session_state.order,
         "test_mode": st.session_state.test_mode,
         "booking_delay": st.session_state.booking_delay,
+        "fire_offset": st.session_state.fire_offset,
+        "rehearsal_date": st.session_state.rehearsal_date.strftime('%Y%m%d'),
+        "rehearsal_rounds": st.session_state.rehearsal_rounds,
+        "rehearsal_before_open": st.session_state.rehearsal_before_open,
         "course_type": st.session_state.course_type,
+        "fetch_mode": st.session_state.fetch_mode,
+        "engine": st.session_state.engine,
+        "transport": st.session_state.transport,
+        "dns_pinning": st.session_state.dns_pinning,
+        "warm_connections": st.session_state.warm_connections,
+        "speculative_checks": st.session_state.speculative_checks,
+        "check_concurrency": st.session_state.check_concurrency,
+        "session_cache": st.session_state.session_cache,
+        "preferred_windows": st.session_state.preferred_windows,
+        "course_weights": st.session_state.course_weights,
+        "avoid_edge_tees": st.session_state.avoid_edge_tees,
+        "hole_cnt": st.session_state.hole_cnt,
+        "server_filter": st.session_state.server_filter,
 
         # [수정] 선택된 골프장 고유번호(seq) 추가
         "golfclub_seq": selected_golfclub_seq,
         "golfclub_name": selected_club_name
     }
 
+    # [추가] 선호도 순위표는 시작 시점에 미리 컴파일 (입력 형식 오류는 여기서 안내)
+    try:
+        inputs["slot_ranking"] = SlotRanking.from_inputs(inputs)
+    except ValueError as e:
+        st.session_state.is_running = False
+        log_message(f"[UI ALERT] ❌ 선호도 입력 오류: {e}", st.session_state.message_queue)
+        return
+
     # 로그 초기화
-    st.session_state.log_messages = []
-    log_message(f"💚 **[Worker 시작]** (Run ID: {datetime.datetime.now(KST).strftime('%Y%m%d%H%M%S')}) 💚",
+    st.session_state.log_messages.clear()
+    st.session_state.log_html = render_log_html(st.session_state.log_messages)
+    # [추가] 핫 패스 로거: Worker는 링 버퍼에 기록만 하고, UI가 drain 하며 포맷팅
+    st.session_state.hot_logger = HotPathLogger()
+    inputs["hot_logger"] = st.session_state.hot_logger
+    inputs["critical_log_level"] = LOG_INFO
+    run_label = "🧪 **[리허설 시작]**" if rehearsal else "💚 **[Worker 시작]**"
+    log_message(f"{run_label} (Run ID: {datetime.datetime.now(KST).strftime('%Y%m%d%H%M%S')}) 💚",
                 st.session_state.message_queue)
     log_message(f"⛳ **[Target]** {inputs['golfclub_name']} (Seq: {inputs['golfclub_seq']})",
                 st.session_state.message_queue)
 
-    # Worker Thread 시작
+    # Worker Thread 시작 ([추가] asyncio 엔진 선택 시 이벤트 루프에서 실행)
+    worker_target = start_pre_process_async if inputs['engine'] == ENGINE_ASYNC else start_pre_process
+    if rehearsal:
+        worker_target = start_rehearsal
     st.session_state.worker_thread = threading.Thread(
-        target=start_pre_process,
+        target=worker_target,
         args=(st.session_state.message_queue, st.session_state.stop_event, inputs),
         daemon=True
     )
@@ -1071,6 +5004,16 @@ st.markdown("""
     border: 1px solid #ccc;
     border-radius: 5px;
 }
+/* [추가] 실행 로그 색상 (수신 시 분류된 클래스) */
+.log-view div {
+    font-size: 12px;
+    font-family: monospace;
+}
+.log-red { color: red; }
+.log-green { color: green; }
+.log-blue { color: #007bff; }
+.log-gray { color: gray; }
+.log-black { color: black; }
 /* 3. Streamlit 기본 title 숨기기 */
 .stApp header {
     visibility: hidden;
@@ -1087,6 +5030,14 @@ st.markdown('<p class="section-header">🔑 로그인 정보</p>', unsafe_allow_
 
 st.text_input("아이디 (ID)", key="id")
 st.text_input("비밀번호 (Password)", type="password", key="password")
+# [추가] 로그인 세션 캐시 (재실행 시 로그인/대기 생략)
+st.checkbox(
+    "🔐 로그인 세션 재사용",
+    key="session_cache",
+    disabled=Fernet is None,
+    help="로그인 후 쿠키를 비밀번호로 암호화하여 저장하고, 다음 실행 시 확인 요청 1회로 유효하면 로그인을 생략합니다. "
+         "(cryptography 패키지 필요)"
+)
 
 # --- 2. 예약 조건 설정 (메인 섹션) ---
 st.markdown('<p class="section-header">⚙️ 예약 조건 설정</p>', unsafe_allow_html=True)
@@ -1129,8 +5080,8 @@ with col_run_time:
         help="프로그램이 티 타임 조회/예약 시도를 시작할 시간을 설정합니다. (예: 09:00:00)"
     )
 
-# [수정] 지연 시간과 테스트 모드를 2번째 줄에 배치
-col_delay, col_mode, col_spacer = st.columns([1.5, 1, 0.5])
+# [수정] 지연 시간, 발사 오프셋과 테스트 모드를 2번째 줄에 배치
+col_delay, col_offset, col_mode = st.columns([1.5, 1.5, 1])
 
 with col_delay:
     st.number_input(
@@ -1143,6 +5094,18 @@ with col_delay:
         help="티 타임 조회 후, 최종 예약 요청 전의 지연 시간(밀리초)입니다. 0.001초 단위로 조정 가능."
     )
 
+with col_offset:
+    st.number_input(
+        "🎯 발사 오프셋 (초)",
+        min_value=-FIRE_OFFSET_LIMIT,
+        max_value=FIRE_OFFSET_LIMIT,
+        step=0.001,
+        format="%.3f",
+        key="fire_offset",
+        help="목표 시각 대비 첫 요청 발사 시각입니다. 음수면 그만큼 먼저 보냅니다 (편도 네트워크 지연 보정). "
+             "리허설로 측정해 추천받을 수 있습니다."
+    )
+
 with col_mode:
     st.markdown("<div style='height: 1.6rem;'></div>", unsafe_allow_html=True)  # 토글 정렬용
     st.toggle(
@@ -1150,7 +5113,37 @@ with col_mode:
         key="test_mode",
         help="ON: 실제 예약 요청 없이 1순위 타임만 확인 후 종료합니다. OFF: 실제 최종 예약 시도."
     )
-# col_spacer는 빈 공간
+
+# [추가] 리허설 (이미 열린 날짜로 getList → 파싱 → 1단계 확인 측정, 최종 예약 요청 없음)
+col_rh_date, col_rh_rounds, col_rh_apply, col_rh_before, col_rh_button = st.columns([1.5, 1, 1, 1.2, 1])
+
+with col_rh_date:
+    st.date_input(
+        "🧪 리허설 날짜",
+        min_value=get_default_date(0),
+        max_value=get_default_date(31),
+        key="rehearsal_date",
+        help="이미 예약이 열려 있는 날짜를 선택합니다. 이 날짜로 조회/확인 요청만 보내 구간별 소요를 측정합니다."
+    )
+
+with col_rh_rounds:
+    st.number_input("반복 횟수", min_value=1, max_value=20, step=1, key="rehearsal_rounds")
+
+with col_rh_apply:
+    st.markdown("<div style='height: 1.6rem;'></div>", unsafe_allow_html=True)
+    st.checkbox("추천값 자동 적용", key="rehearsal_apply",
+                help="리허설이 끝나면 추천된 예약 지연/발사 오프셋을 입력란에 채웁니다.")
+
+with col_rh_before:
+    st.markdown("<div style='height: 1.6rem;'></div>", unsafe_allow_html=True)
+    st.checkbox("실행 전 리허설", key="rehearsal_before_open",
+                help=f"예약 실행 중 T-0 {REHEARSAL_MIN_LEAD:.0f}초 전보다 여유가 있으면 리허설을 먼저 하고, "
+                     "그 결과로 예약 지연/발사 오프셋을 자동 설정합니다. (스레드 엔진 전용)")
+
+with col_rh_button:
+    st.markdown("<div style='height: 1.6rem;'></div>", unsafe_allow_html=True)
+    st.button("🧪 리허설 실행", on_click=run_booking, kwargs={"rehearsal": True},
+              disabled=st.session_state.is_running)
 
 # --- 시간 필터링 및 코스/순서 설정 (3번째 줄) ---
 col_start, col_end, col_course, col_order = st.columns([1, 1, 1.5, 1.5])
@@ -1181,6 +5174,120 @@ with col_order:
         help="필터링된 시간대 중 예약 시도 우선순위를 결정합니다."
     )
 
+# [추가] 선호도 순위 (선호 시간대/코스 가중치, 첫/마지막 티 피하기) 및 'getList' 검색 조건
+col_windows, col_weights, col_edges, col_holes, col_server = st.columns([2, 1.5, 1, 1, 1])
+
+with col_windows:
+    st.text_input(
+        "🎯 선호 시간대 (가중치)",
+        key="preferred_windows",
+        placeholder="07:00-08:00=3, 10:00-11:00=1",
+        help="'HH:MM-HH:MM=가중치'를 쉼표로 구분해 입력합니다. 가중치가 클수록 먼저 시도하며, "
+             "같은 가중치 안에서는 정렬 순서를 따릅니다. 비워두면 정렬 순서만 사용합니다."
+    )
+
+with col_weights:
+    st.text_input(
+        "🏌️ 코스 가중치",
+        key="course_weights",
+        placeholder="IN=1",
+        help="'코스명=가중치'를 쉼표로 구분해 입력합니다. 선호 시간대 가중치와 같은 단위로 더해집니다."
+    )
+
+with col_edges:
+    st.checkbox(
+        "첫/마지막 티 피하기",
+        key="avoid_edge_tees",
+        help="조회된 목록의 첫 티와 마지막 티는 가중치 1만큼 뒤로 미룹니다."
+    )
+
+with col_holes:
+    st.selectbox(
+        "⛳ 홀 수",
+        options=list(HOLE_CNT_OPTIONS),
+        key="hole_cnt",
+        help="선택한 홀 수의 티 타임만 예약을 시도합니다."
+    )
+
+with col_server:
+    st.checkbox(
+        "서버 측 필터",
+        key="server_filter",
+        help="시간대(1부/2부/3부)·홀 수·인원 조건을 'getList' 요청에 넣어 조건에 맞는 티 타임만 받습니다. "
+             "시간대 코드가 실제 서버에서 확인되지 않아 기본은 사용 안함입니다. "
+             "켜면 실행 전 이미 열린 날짜(오늘)로 조건 조회와 전체 조회를 비교해, 티 타임이 빠지거나 확인할 수 없으면 "
+             "전체 조회로 진행합니다. 발사 중 조건 밖 티 타임이 오면 그때부터 전체 조회로 돌아갑니다."
+    )
+
+# [추가] 'getList' 조회 방식 및 예약 엔진 (4번째 줄)
+col_fetch, col_engine, col_transport, col_warm, col_spec, col_budget = st.columns([1.5, 1.5, 1.5, 1, 1, 1])
+
+with col_fetch:
+    st.selectbox(
+        "📡 티 타임 조회 방식",
+        options=FETCH_MODE_OPTIONS,
+        key="fetch_mode",
+        help="순차: 1~4페이지를 차례로 조회. 동시: 모든 페이지를 미리 열어둔 커넥션으로 한 번에 요청합니다. "
+             "스트리밍: 페이지가 도착하는 즉시 파싱하여 순위가 확정된 1순위부터 바로 예약을 시도합니다."
+    )
+
+with col_engine:
+    st.selectbox(
+        "⚙️ 예약 엔진",
+        options=ENGINE_OPTIONS,
+        key="engine",
+        help="스레드: 기존 requests 기반. asyncio: 하나의 이벤트 루프에서 모든 요청(페이지 동시 조회 포함)을 "
+             "코루틴으로 실행합니다. (httpx 필요)"
+    )
+
+with col_transport:
+    st.selectbox(
+        "🔗 전송 프로토콜",
+        options=TRANSPORT_OPTIONS,
+        key="transport",
+        help="HTTP/2: 'getList' 페이지, 동시 확인, 세션 유지 요청을 하나의 웜 커넥션에서 동시에 주고받습니다. "
+             "서버가 HTTP/2를 지원하지 않거나 h2 패키지가 없으면 자동으로 HTTP/1.1을 사용합니다."
+             + ("" if HTTP2_AVAILABLE else " (h2 미설치)")
+    )
+    st.checkbox(
+        "🌐 DNS 사전 조회/고정",
+        key="dns_pinning",
+        help="API 도메인 주소를 미리 조회해 두고 T-0 전후로 고정하여, 골든 타임에 새 커넥션이 DNS 조회를 기다리지 않도록 합니다. "
+             "주소가 여러 개면 연결이 가장 빠른 주소를 먼저 사용합니다. (스레드 엔진, HTTP/1.1)"
+    )
+
+with col_warm:
+    st.number_input(
+        "🔥 웜업 커넥션 수",
+        min_value=0,
+        max_value=16,
+        step=1,
+        key="warm_connections",
+        help="골든 타임 10초 전부터 이 개수만큼 인증된 커넥션을 열어두고 유지합니다. 0이면 웜업하지 않습니다. "
+             "(스레드 엔진 전용)"
+    )
+
+with col_spec:
+    st.number_input(
+        "⚡ 동시 확인 후보 수",
+        min_value=1,
+        max_value=5,
+        step=1,
+        key="speculative_checks",
+        help="상위 N개 후보의 1단계(예약 가능 확인)를 동시에 보내고, 통과한 후보 중 우선순위가 가장 높은 "
+             "시간대로 최종 예약을 요청합니다. 1이면 기존처럼 한 후보씩 순서대로 시도합니다."
+    )
+
+with col_budget:
+    st.number_input(
+        "🚦 동시 요청 한도",
+        min_value=1,
+        max_value=5,
+        step=1,
+        key="check_concurrency",
+        help="투기적 확인 시 동시에 진행할 1단계 요청의 최대 개수입니다."
+    )
+
 # --- 3. 실행 버튼 ---
 st.markdown("---")
 col_start, col_stop = st.columns([1, 1])
@@ -1200,39 +5307,28 @@ with col_stop:
 st.markdown("---")  # Separator
 st.markdown('<p class="section-header">📝 실행 로그</p>', unsafe_allow_html=True)
 
-if st.session_state.log_container_placeholder is None:
-    st.session_state.log_container_placeholder = st.empty()
 
-# Log Display Logic
-with st.session_state.log_container_placeholder.container(height=300):
-    # Log Queue에서 메시지 가져와서 상태에 추가
+# [수정] 로그 영역만 fragment로 주기적으로 다시 그림 (실행 중에도 전체 스크립트를 재실행하지 않음)
+@st.fragment(run_every=LOG_REFRESH_SECONDS if st.session_state.is_running else None)
+def render_log_view():
+    # Log Queue / 핫 패스 로거에서 메시지 가져와서 상태에 추가
     update_log_display()
 
-    # Log Display (기존 골프존감포의 로그 색상 로직 유지)
-    for msg in reversed(st.session_state.log_messages[-500:]):
-        safe_msg = msg.replace("<", "&lt;").replace(">", "&gt;")
-        color = "black"
-        if "[UI ALERT]" in msg or "❌" in msg or "UI_ERROR" in msg:
-            color = "red"
-        elif "🎉" in msg or "✅" in msg and "대기중" not in msg:
-            color = "green"
-        elif "💚 [세션 유지]" in msg or "📜" in msg or "⛳ **[Target]**" in msg:
-            color = "#007bff"
-        elif "⏳" in msg or "🔄" in msg:
-            color = "gray"
-
-        st.markdown(f'<div style="color: {color}; font-size: 12px; font-family: monospace;">{safe_msg}</div>',
-                    unsafe_allow_html=True)
-
-# ------------------------------------------------------------
-# 5. 실시간 업데이트
-# ------------------------------------------------------------
-# Streamlit Rerun (for real-time log updates)
-if st.session_state.is_running:
-    # Worker Thread가 종료되었는지 확인
-    if st.session_state.worker_thread and not st.session_state.worker_thread.is_alive():
+    # 하나의 HTML 블록으로 한 번에 표시
+    with st.container(height=300):
+        st.markdown(st.session_state.log_html, unsafe_allow_html=True)
+
+    cpu_percent = measure_process_cpu()
+    if cpu_percent is not None:
+        st.caption(f"🖥️ 프로세스 CPU 사용률: {cpu_percent:.1f}% (약 {CPU_SAMPLE_SECONDS:.0f}초 평균)")
+
+    # ------------------------------------------------------------
+    # 5. 실시간 업데이트: Worker Thread가 종료되었는지 확인
+    # ------------------------------------------------------------
+    if st.session_state.is_running and st.session_state.worker_thread and \
+            not st.session_state.worker_thread.is_alive():
         st.session_state.is_running = False
-        st.rerun()  # Worker 종료 후 UI 상태 업데이트
-    else:
-        time.sleep(0.1)
-        st.rerun()  # 로그 업데이트를 위해 0.1초마다 재실행
\ No newline at end of file
+        st.rerun()  # Worker 종료 후 전체 UI 상태(버튼 등) 업데이트
+
+
+render_log_view()
\ No newline at end of file
@@ -0,0 +1,28 @@
+# 테스트 공용: streamlit_app import 경고 억제, 로그를 버리는 APIBookingCore, 로컬 대체 서버 fixture
+import logging
+import queue
+import threading
+
+import pytest
+
+# streamlit_app을 bare 모드로 import 할 때 출력되는 ScriptRunContext 경고 억제
+logging.disable(logging.WARNING)
+
+import streamlit_app as app
+from mock_server import MockGolfzonServer
+
+
+def make_core(api_domain):
+    """로그를 버리는 APIBookingCore 인스턴스를 생성합니다."""
+    return app.APIBookingCore(lambda msg, q: None, queue.Queue(), threading.Event(), "1", api_domain)
+
+
+@pytest.fixture(scope="module")
+def server(request):
+    """
+    테스트 모듈마다 하나씩 띄우는 로컬 대체 서버. 모듈의 MOCK_SERVER_OPTIONS로 MockGolfzonServer 인자를 지정합니다.
+    (서버 종료에 serve_forever 폴링 주기만큼 걸려 테스트마다 띄우지 않음)
+    """
+    server = MockGolfzonServer(**getattr(request.module, "MOCK_SERVER_OPTIONS", {})).start()
+    yield server
+    server.stop()
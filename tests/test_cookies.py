@@ -0,0 +1,69 @@
+# 쿠키 테스트: 세션 유지 응답 쿠키 공유, 쿠키가 바뀌는 중에 준비한 요청 틀/Cookie 헤더가 옛 쿠키로 굳지 않는지
+# 실행: python -m pytest -q
+import pytest
+
+import streamlit_app as app
+from mock_server import HTML_TYPE, TEETIME_MAIN_HTML, MockResponse
+from tests.conftest import make_core
+
+KEEP_ALIVE_PATH = "/reserve/main/teetimeList"
+DATE = "20260101"
+COOKIE_DOMAIN = "127.0.0.1"
+
+
+def test_cookie_set_during_template_preparation_is_not_lost():
+    core = make_core("http://127.0.0.1:9")
+    core.session.cookies.set("JSESSIONID", "old", domain=COOKIE_DOMAIN, path="/")
+    prepare_request = core.session.prepare_request
+    rotated = []
+
+    def prepare_then_rotate(request):
+        # 첫 틀(getList)이 쿠키를 복사한 직후 다른 스레드(세션 유지/웜업)가 쿠키를 바꾼 경우
+        prepared = prepare_request(request)
+        if not rotated:
+            rotated.append(True)
+            core.session.cookies.set("JSESSIONID", "new", domain=COOKIE_DOMAIN, path="/")
+        return prepared
+
+    core.session.prepare_request = prepare_then_rotate
+    core.prepare_request_templates(DATE)
+    assert core._get_template('getList').prepared.headers['Cookie'] == "JSESSIONID=new"
+
+
+@pytest.fixture
+def core(server):
+    core = make_core(server.base_url)
+    assert core.requests_login("test", "test")['result'] == 'success'
+    core.prepare_request_templates(DATE)
+    yield core
+    core.close()
+
+
+def rotate_cookie_by_keepalive(server, core, on_response=None):
+    """세션 유지 전용 세션으로 Set-Cookie(WMONID=rotated)를 받습니다. on_response는 응답 훅으로 실행됩니다."""
+    session = core._get_keepalive_session()
+    if on_response is not None:
+        session.hooks['response'].append(on_response)
+    server.script(KEEP_ALIVE_PATH, MockResponse(200, TEETIME_MAIN_HTML.encode(), HTML_TYPE,
+                                                [("Set-Cookie", "WMONID=rotated; Path=/")]))
+    session.get(f"{server.base_url}{KEEP_ALIVE_PATH}", timeout=5)
+
+
+def test_keepalive_cookie_reaches_booking_jar(server, core):
+    rotate_cookie_by_keepalive(server, core)
+    assert core.session.cookies.get("WMONID") == "rotated"
+
+
+def test_template_prepared_before_cookie_lands_is_rebuilt(server, core):
+    def prepare_template_early(res, *args, **kwargs):
+        core._get_template('check')  # 훅은 Set-Cookie가 저장소에 들어가기 전에 실행됨
+
+    rotate_cookie_by_keepalive(server, core, prepare_template_early)
+    assert "WMONID=rotated" in core._get_template('check').build().headers.get('Cookie', '')
+
+
+def test_plain_request_cookie_header_comes_from_jar(server, core):
+    rotate_cookie_by_keepalive(server, core)
+    url = f"{server.base_url}{KEEP_ALIVE_PATH}"
+    prepared = core.session.prepare_request(app.requests.Request("GET", url, headers=core.get_base_headers(url)))
+    assert "WMONID=rotated" in prepared.headers.get('Cookie', '')
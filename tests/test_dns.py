@@ -0,0 +1,80 @@
+# DNS 사전 조회/고정 테스트: 주입한 resolver/시계로 TTL 캐시, 고정 구간, 조회 실패 시 이전 결과, 연결되는 주소 우선
+# 실행: python -m pytest -q
+import socket
+
+import pytest
+
+import streamlit_app as app
+
+HOST = "api.test"
+
+
+class FakeResolver:
+    """answers를 차례로 돌려주는 resolver. 예외를 넣으면 그 차례에 발생시킵니다."""
+
+    def __init__(self, *answers):
+        self.answers = list(answers)
+
+    def __call__(self, host, port):
+        answer = self.answers.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+
+@pytest.fixture
+def clock():
+    now = [0.0]
+    return now
+
+
+def make_pinner(resolver, clock):
+    return app.DNSPinner(resolver=resolver, clock=lambda: clock[0])
+
+
+def test_lookup_is_cached_within_ttl(clock):
+    resolver = FakeResolver((["10.0.0.1"], 30.0))
+    pinner = make_pinner(resolver, clock)
+    assert pinner.lookup(HOST, 443).addresses == ["10.0.0.1"]
+    clock[0] = 20.0
+    assert pinner.lookup(HOST, 443).addresses == ["10.0.0.1"]
+    assert not resolver.answers  # TTL 안: 다시 조회하지 않음
+
+
+def test_lookup_resolves_again_after_ttl(clock):
+    pinner = make_pinner(FakeResolver((["10.0.0.1"], 30.0), (["10.0.0.2"], 30.0)), clock)
+    pinner.lookup(HOST, 443)
+    clock[0] = 31.0
+    assert pinner.lookup(HOST, 443).addresses == ["10.0.0.2"]
+
+
+def test_pinned_address_outlives_ttl_until_unpinned(clock):
+    resolver = FakeResolver((["10.0.0.1"], 30.0), (["10.0.0.3"], 30.0))
+    pinner = make_pinner(resolver, clock)
+    pinner.lookup(HOST, 443)
+    pinner.pin(HOST, 120.0)
+    clock[0] = 90.0
+    assert pinner.addresses_for(HOST) == ["10.0.0.1"]
+    assert pinner.lookup(HOST, 443).addresses == ["10.0.0.1"]
+    assert resolver.answers  # 고정 구간: TTL이 지나도 다시 조회하지 않음
+    clock[0] = 130.0
+    assert pinner.addresses_for(HOST) == ()  # 고정 해제 후: 시스템 조회로 복귀
+
+
+def test_failed_lookup_keeps_previous_addresses(clock):
+    pinner = make_pinner(FakeResolver((["10.0.0.2"], 30.0), socket.gaierror("resolver down")), clock)
+    pinner.lookup(HOST, 443)
+    clock[0] = 31.0
+    assert pinner.lookup(HOST, 443).addresses == ["10.0.0.2"]
+
+
+def test_connectable_address_comes_first():
+    listener = socket.create_server(("127.0.0.1", 0))  # 127.0.0.2의 같은 포트는 연결 거부
+    try:
+        port = listener.getsockname()[1]
+        pinner = app.DNSPinner(resolver=lambda host, port: (["127.0.0.2", "127.0.0.1"], 30.0))
+        entry = pinner.resolve("localhost", port)
+        assert entry.addresses == ["127.0.0.1", "127.0.0.2"]
+        assert entry.latencies["127.0.0.2"] == float("inf")
+    finally:
+        listener.close()
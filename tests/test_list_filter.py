@@ -0,0 +1,74 @@
+# 'getList' 서버 측 검색 조건 테스트: 기본 사용 안함, 조건 조회가 티 타임을 빠뜨리면(너무 좁은 응답) 전체 조회로 전환
+# 실행: python -m pytest -q
+import pytest
+
+import streamlit_app as app
+from mock_server import MockGolfzonServer
+from tests.conftest import make_core
+
+DATE = "20260101"
+INPUTS = {'start_time': "07:00", 'end_time': "09:00", 'hole_cnt': "18홀", 'server_filter': True}
+# 서버의 1부가 07:59에 끝나는 경우: 조건 조회에 08:00~09:00 티 타임이 빠짐
+NARROW_SECTIONS = {"1": (0, 7 * 60 + 59), "2": (8 * 60, 17 * 60 + 59)}
+MOCK_SERVER_OPTIONS = {'pages': 4, 'slots': 30, 'closed_slots': 0, 'nine_hole_every': 3}
+
+
+@pytest.fixture
+def start_server():
+    """MOCK_SERVER_OPTIONS와 다른 설정의 대체 서버를 추가로 띄웁니다. (server fixture와 별도)"""
+    servers = []
+
+    def start_server(**options):
+        servers.append(MockGolfzonServer(**dict(MOCK_SERVER_OPTIONS, **options)).start())
+        return servers[-1]
+    yield start_server
+    for server in servers:
+        server.stop()
+
+
+@pytest.fixture
+def login():
+    cores = []
+
+    def login(server):
+        core = make_core(server.base_url)
+        assert core.requests_login("test", "test")['result'] == 'success'
+        core.list_filter = app.ListFilter.from_inputs(INPUTS)
+        cores.append(core)
+        return core
+    yield login
+    for core in cores:
+        core.close()
+
+
+def candidate_ids(core):
+    items = core.parse_teetime_items(core.get_all_available_times(DATE)) or []
+    return sorted(item.time_table_id for item in items if core.list_filter.in_section(item.minutes))
+
+
+def test_server_filter_is_off_by_default():
+    assert not app.ListFilter.from_inputs({'start_time': "07:00", 'end_time': "09:00"}).server_side
+
+
+def test_matching_sections_keep_server_filter(server, login):
+    core = login(server)
+    core.verify_list_filter(DATE)
+    assert core.list_filter.server_side
+
+
+def test_narrow_sections_fall_back_to_full_list(server, start_server, login):
+    core = login(start_server(time_sections=NARROW_SECTIONS))
+    core.verify_list_filter(DATE)
+    assert not core.list_filter.server_side
+    core.prepare_request_templates(DATE)
+    assert not core._get_template('getList').data["selectTimeSection"]  # 요청 틀도 검색 조건 없이 준비
+
+    expected = login(server)
+    expected.list_filter = app.ListFilter.from_inputs(dict(INPUTS, server_filter=False))
+    assert candidate_ids(core) == candidate_ids(expected)
+
+
+def test_unverifiable_filter_falls_back(start_server, login):
+    core = login(start_server(pages=0))  # 이미 열린 날짜에도 티 타임이 없어 비교할 수 없음
+    core.verify_list_filter(DATE)
+    assert not core.list_filter.server_side
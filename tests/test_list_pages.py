@@ -0,0 +1,49 @@
+# 'getList' 페이지 결과 구분 테스트: 응답 유형 오류 반복은 실패(None), 짧은 HTML만 목록 끝("")
+# 실행: python -m pytest -q
+import pytest
+
+import streamlit_app as app
+from mock_server import JSON_TYPE, MockResponse
+from tests.conftest import make_core
+
+GETLIST_PATH = "/reserve/golfclub/teetime/getList"
+DATE = "20260101"
+WRONG_TYPE = MockResponse(200, b'{"result": 0}', JSON_TYPE, [])
+MOCK_SERVER_OPTIONS = {'pages': 4, 'slots': 30, 'closed_slots': 0}
+
+
+@pytest.fixture
+def core(server, tmp_path):
+    core = make_core(server.base_url)
+    assert core.requests_login("test", "test")['result'] == 'success'
+    core.page_counts = app.PageCountStore(str(tmp_path / "page_counts.json"))
+    yield core
+    core.close()
+
+
+def fetch_page(core, page_no):
+    return core._fetch_list_page(core.TIME_LIST_URL, core._get_list_headers(),
+                                 core._build_list_payload(DATE, page_no), page_no)
+
+
+def test_repeated_content_type_error_is_failure(server, core):
+    server.script(GETLIST_PATH, WRONG_TYPE, WRONG_TYPE, WRONG_TYPE)
+    assert fetch_page(core, 2) is None
+
+
+def test_short_html_page_is_end_of_list(core):
+    assert fetch_page(core, 5) == ""
+
+
+def test_sequential_fetch_keeps_paging_past_failed_page(server, core):
+    server.script(GETLIST_PATH, WRONG_TYPE, WRONG_TYPE, WRONG_TYPE)  # 1페이지 3회 모두 응답 유형 오류
+    times_html = core.get_all_available_times(DATE)
+    assert len(core.parse_teetime_items(times_html)) == 3 * 30  # 2~4페이지는 그대로 조회
+    assert core.page_counts.clubs == {}  # 끝을 확인하기 전 실패한 페이지가 있으면 기록하지 않음
+
+
+def test_failed_page_does_not_record_page_count(core):
+    core._record_list_pages({1: "<li>", 2: None, 3: "", 4: ""})
+    assert core.page_counts.clubs == {}
+    core._record_list_pages({1: "<li>", 2: "<li>", 3: ""})
+    assert core.page_counts.expected_pages(core._page_count_key(), core.MAX_LIST_PAGES) == 2
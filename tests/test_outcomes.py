@@ -0,0 +1,142 @@
+# 예약 실패 분류 테스트: 기록된 Check/Submit 응답 재생 → ReservationResult.outcome / RetryPolicy 확인
+# 실행: python -m pytest -q
+import pytest
+
+import streamlit_app as app
+from mock_server import HTML_TYPE, JSON_TYPE, LOGIN_PAGE_HTML, MockResponse
+from tests.conftest import make_core
+
+CHECK_PATH = "/reserve/checkReserveTeetimeAble"
+SUBMIT_PATH = "/reserve/postReserveConfirmSubmit"
+
+MAINTENANCE_HTML = "<html><body><h1>서비스 점검 중입니다.</h1></body></html>".encode()
+BLOCKED_HTML = "<html><body>Request blocked. 보안 정책에 의해 차단되었습니다.</body></html>".encode()
+
+
+def _json_response(payload, status=200):
+    return MockResponse(status, app.json.dumps(payload, ensure_ascii=False).encode(), JSON_TYPE, [])
+
+
+# (단계, 설명, 기록된 응답, 기대 결과 유형)
+RECORDED_RESPONSES = [
+    ("check", "예약 가능", _json_response({"result": 0, "data": {"success": True}}), app.OUTCOME_SUCCESS),
+    ("check", "이미 예약됨", _json_response(
+        {"result": 0, "data": {"success": False}, "message": "이미 예약되어 있습니다."}), app.OUTCOME_TAKEN),
+    ("check", "세션 만료 (로그인 페이지 HTML)",
+     MockResponse(200, LOGIN_PAGE_HTML.encode(), HTML_TYPE, []), app.OUTCOME_SESSION_EXPIRED),
+    ("check", "점검 페이지 HTML (로그인 페이지 아님)", MockResponse(200, MAINTENANCE_HTML, HTML_TYPE, []),
+     app.OUTCOME_TRANSIENT),
+    ("check", "JSON 깨짐", MockResponse(200, b'{"result": 0, "data": ', JSON_TYPE, []), app.OUTCOME_UNKNOWN),
+    ("check", "게이트웨이 오류 502", MockResponse(502, b"Bad Gateway", HTML_TYPE, []), app.OUTCOME_TRANSIENT),
+    ("submit", "예약 완료", _json_response({"result": 0, "data": {"success": True, "reserveCompleteInfo": {
+        "bookgInfoId": "BK1", "bookgNo": "00000001"}}}), app.OUTCOME_SUCCESS),
+    ("submit", "이미 예약됨", _json_response(
+        {"result": 1, "resultCode": "E0101", "data": {}, "message": "이미 예약되어 있습니다."}), app.OUTCOME_TAKEN),
+    ("submit", "마감", _json_response(
+        {"result": 1, "message": "선택하신 티타임은 마감되었습니다."}), app.OUTCOME_TAKEN),
+    ("submit", "다른 고객 진행중", _json_response(
+        {"result": 1, "message": "다른 고객님이 예약 진행중인 티타임입니다."}), app.OUTCOME_TAKEN),
+    ("submit", "세션 만료 (로그인 페이지 HTML)",
+     MockResponse(200, LOGIN_PAGE_HTML.encode(), HTML_TYPE, []), app.OUTCOME_SESSION_EXPIRED),
+    ("submit", "차단 페이지 HTML (로그인 페이지 아님)", MockResponse(200, BLOCKED_HTML, HTML_TYPE, []),
+     app.OUTCOME_TRANSIENT),
+    ("submit", "로그인 필요", _json_response(
+        {"result": -1, "message": "로그인이 필요한 서비스입니다."}), app.OUTCOME_SESSION_EXPIRED),
+    ("submit", "요청 과다 메시지", _json_response(
+        {"result": 1, "message": "접속자가 많아 잠시 후 다시 시도해 주세요."}), app.OUTCOME_THROTTLED),
+    ("submit", "429 Too Many Requests", MockResponse(429, b"", HTML_TYPE, []), app.OUTCOME_THROTTLED),
+    ("submit", "503 Service Unavailable", MockResponse(503, b"", HTML_TYPE, []), app.OUTCOME_THROTTLED),
+    ("submit", "500 Internal Server Error", MockResponse(500, b"", HTML_TYPE, []), app.OUTCOME_TRANSIENT),
+    ("submit", "401 Unauthorized", MockResponse(401, b"", HTML_TYPE, []), app.OUTCOME_SESSION_EXPIRED),
+    ("submit", "분류 불가 메시지", _json_response(
+        {"result": 9, "message": "처리 중 오류가 발생했습니다."}), app.OUTCOME_UNKNOWN),
+]
+
+
+@pytest.fixture(scope="module")
+def core(server):
+    core = make_core(server.base_url)
+    assert core.requests_login("test", "test")['result'] == 'success'
+    core.prepare_request_templates("20260101")  # 실제 실행과 같이 사전 준비된 요청 틀 경로 사용
+    yield core
+    core.close()
+
+
+@pytest.mark.parametrize("step, name, response, expected", RECORDED_RESPONSES,
+                         ids=[f"{step}-{name}" for step, name, _, _ in RECORDED_RESPONSES])
+def test_recorded_response_outcome(server, core, step, name, response, expected):
+    server.script(CHECK_PATH if step == "check" else SUBMIT_PATH, response)
+    if step == "check":
+        result = core.check_reservation("12091001")
+    else:
+        result = core.submit_reservation("20260101", "12091001", "0703", "IN")
+    assert result.outcome == expected, result.message
+    assert result.outcome in app.RETRY_POLICIES or result.success
+
+
+def test_connection_refused_is_transient():
+    offline_core = make_core("http://127.0.0.1:9")  # 닫힌 포트
+    assert offline_core.check_reservation("12091001").outcome == app.OUTCOME_TRANSIENT
+
+
+@pytest.mark.parametrize("message, expected", [
+    ("이미 예약되어 있습니다.", app.OUTCOME_TAKEN),
+    ("선택하신 티타임은 마감되었습니다.", app.OUTCOME_TAKEN),
+    ("다른 고객님이 예약 진행중인 티타임입니다.", app.OUTCOME_TAKEN),
+    ("다른 세션에서 예약 진행중인 티타임입니다.", app.OUTCOME_TAKEN),
+    ("본인 인증 회원 전용 티타임으로 이미 예약되었습니다.", app.OUTCOME_TAKEN),
+    ("로그인이 필요한 서비스입니다.", app.OUTCOME_SESSION_EXPIRED),
+    ("세션이 유효하지 않습니다.", app.OUTCOME_SESSION_EXPIRED),
+    ("세션이 만료되었습니다. 다시 로그인해 주세요.", app.OUTCOME_SESSION_EXPIRED),
+    ("접속자가 많아 잠시 후 다시 시도해 주세요.", app.OUTCOME_THROTTLED),
+    ("처리 중 오류가 발생했습니다.", app.OUTCOME_UNKNOWN),
+    ("", app.OUTCOME_UNKNOWN),
+    (None, app.OUTCOME_UNKNOWN),
+])
+def test_classify_server_message(message, expected):
+    assert app.classify_server_message(message) == expected
+
+
+@pytest.mark.parametrize("status_code, expected", [
+    (401, app.OUTCOME_SESSION_EXPIRED),
+    (403, app.OUTCOME_SESSION_EXPIRED),
+    (429, app.OUTCOME_THROTTLED),
+    (503, app.OUTCOME_THROTTLED),
+    (500, app.OUTCOME_TRANSIENT),
+    (502, app.OUTCOME_TRANSIENT),
+    (404, app.OUTCOME_UNKNOWN),
+])
+def test_classify_http_status(status_code, expected):
+    assert app.classify_http_status(status_code) == expected
+
+
+@pytest.mark.parametrize("outcome", sorted(app.RETRY_POLICIES))
+def test_retry_policy_delay_is_full_jitter_within_cap(outcome):
+    policy = app.RETRY_POLICIES[outcome]
+    for attempt in range(1, 8):
+        cap = min(policy.max_delay, policy.base_delay * (2 ** (attempt - 1)))
+        for _ in range(50):
+            assert 0.0 <= policy.delay(attempt) <= cap
+
+
+def test_retry_policy_without_base_delay_never_waits():
+    assert app.RetryPolicy(app.RETRY_BACKOFF, max_attempts=3).delay(5) == 0.0
+
+
+@pytest.mark.parametrize("outcome, attempt, expected_action", [
+    (app.OUTCOME_TAKEN, 1, app.RETRY_NEXT_SLOT),
+    (app.OUTCOME_SESSION_EXPIRED, 1, app.RETRY_RELOGIN),
+    (app.OUTCOME_SESSION_EXPIRED, 2, app.RETRY_NEXT_SLOT),
+    (app.OUTCOME_TRANSIENT, 3, app.RETRY_BACKOFF),
+    (app.OUTCOME_TRANSIENT, 4, app.RETRY_NEXT_SLOT),
+    (app.OUTCOME_THROTTLED, 1, app.RETRY_BACKOFF),
+    (app.OUTCOME_THROTTLED, 3, app.RETRY_NEXT_SLOT),
+    (app.OUTCOME_UNKNOWN, 1, app.RETRY_BACKOFF),
+    (app.OUTCOME_UNKNOWN, 2, app.RETRY_NEXT_SLOT),
+])
+def test_next_retry_step_follows_policy(outcome, attempt, expected_action):
+    core = make_core("http://127.0.0.1:9")
+    action, delay = core._next_retry_step(app.ReservationResult(outcome, "기록된 실패"), attempt)
+    assert action == expected_action
+    if action == app.RETRY_NEXT_SLOT:
+        assert delay == 0.0
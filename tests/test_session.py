@@ -0,0 +1,27 @@
+# 세션 확인 요청 테스트: 예약 API가 아닌 읽기 전용 예약 메인 페이지로 로그인 상태를 확인하는지
+# 실행: python -m pytest -q
+from tests.conftest import make_core
+
+CHECK_PATH = "/reserve/checkReserveTeetimeAble"
+TEETIME_MAIN_PATH = "/reserve/main/teetimeList"
+
+
+def test_validate_session_uses_read_only_page(server):
+    core = make_core(server.base_url)
+    assert core.requests_login("test", "test")['result'] == 'success'
+    server.reset()
+    assert core.validate_session()
+    assert server.arrival_times(TEETIME_MAIN_PATH)
+    assert not server.arrival_times(CHECK_PATH)
+
+
+def test_validate_session_rejects_login_page(server):
+    core = make_core(server.base_url)
+    assert not core.validate_session()  # 로그인 전: 예약 메인 페이지 대신 로그인 페이지 HTML
+    assert not server.arrival_times(CHECK_PATH)
+
+
+def test_wait_session_ready_after_login(server):
+    core = make_core(server.base_url)
+    assert core.requests_login("test", "test")['result'] == 'success'
+    assert core.wait_session_ready(timeout=1.0)